@@ -3,19 +3,9 @@ Script to create a Word document with irregular verbs in a table format.
 Columns: Base (Present), Past, Past Participle
 """
 
-try:
-    from docx import Document
-    from docx.shared import Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except ImportError:
-    import subprocess
-    import sys
+import sys
 
-    print("python-docx library not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
-    from docx import Document
-    from docx.shared import Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
+from verb_tables import VerbSheet, main
 
 # Common irregular verbs with their forms
 # Format: (base, past, past_participle)
@@ -155,62 +145,17 @@ irregular_verbs = [
     ("write", "wrote", "written"),
 ]
 
-# Remove any accidental duplicates and sort alphabetically by base form
-seen = set()
-unique_irregulars = []
-for base, past, pp in irregular_verbs:
-    if base not in seen:
-        seen.add(base)
-        unique_irregulars.append((base, past, pp))
 
-unique_irregulars.sort(key=lambda x: x[0])
+def make_sheet():
+    """Describe the irregular verbs document for verb_tables."""
+    return VerbSheet(
+        title="Irregular Verbs",
+        headers=("Base (Present)", "Past", "Past Participle"),
+        verbs=irregular_verbs,
+        # Save directly to the existing irregular_verbs.docx in this folder
+        output_file="irregular_verbs.docx",
+    )
 
-# Create Word document
-doc = Document()
-
-# Add title
-title = doc.add_heading("Irregular Verbs", 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Add subtitle
-subtitle = doc.add_paragraph("Base (Present) | Past | Past Participle")
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle_run = subtitle.runs[0]
-subtitle_run.font.size = Pt(12)
-subtitle_run.font.bold = True
-
-# Blank line
-doc.add_paragraph()
-
-# Create table (header + rows)
-table = doc.add_table(rows=1, cols=3)
-table.style = "Light Grid Accent 1"
-
-header_cells = table.rows[0].cells
-header_cells[0].text = "Base (Present)"
-header_cells[1].text = "Past"
-header_cells[2].text = "Past Participle"
-
-for cell in header_cells:
-    p = cell.paragraphs[0]
-    if p.runs:
-        p.runs[0].font.bold = True
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Add each irregular verb
-for base, past, pp in unique_irregulars:
-    row_cells = table.add_row().cells
-    row_cells[0].text = base
-    row_cells[1].text = past
-    row_cells[2].text = pp
-
-    for cell in row_cells:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Save directly to the existing irregular_verbs.docx in this folder
-output_file = "irregular_verbs.docx"
-doc.save(output_file)
-
-print(f"Document created successfully: {output_file}")
-print(f"Total irregular verbs: {len(unique_irregulars)}")
 
+if __name__ == "__main__":
+    main(sys.argv[1:], sheets=[make_sheet()])
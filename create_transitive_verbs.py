@@ -1,898 +1,249 @@
 """
 Script to create a Word document with transitive verbs in a table format.
 Columns: Present, Past, Past Participle
+
+The table itself is built by the shared engine in verb_tables.py.
+Run with --per-row to use the original table.add_row() loop, or with
+--benchmark [ROWS] to compare rows/second of both table builders.
 """
 
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except ImportError:
-    print("python-docx library not found. Installing...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "python-docx"])
-    from docx import Document
-    from docx.shared import Inches, Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
+import sys
+
+from verb_conjugation import conjugate
+from verb_tables import VerbSheet, main
 
-# Comprehensive list of transitive verbs with their conjugations
+# Comprehensive list of transitive verbs.
+# Regular verbs are stored by their present form only; their past and past
+# participle are generated by verb_conjugation.regular_forms().
+regular_transitive_verbs = """
+    accept achieve acknowledge acquire address admire admit adopt advise
+    affect afford agree aim allow alter analyze announce answer anticipate
+    appreciate approach approve argue arrange arrest ask assess assign
+    assist assume attack attempt attend attract avoid balance ban believe
+    belong blame bless block boil book borrow burn bury calculate call
+    capture carry cause celebrate change charge chase check claim clarify
+    clean clear climb close collect combine comfort command comment commit
+    compare compete complete compose comprehend compress compute conceal
+    conceive concentrate concern conclude conduct confirm confront confuse
+    connect consider consist construct consult consume contain continue
+    contract contribute control convert convince cook copy correct count
+    cover create credit criticize cross crush cry cultivate cure damage
+    dance dare debate decide declare decorate decrease defeat defend define
+    delay deliver demand demonstrate deny depend deposit describe deserve
+    design desire destroy detect determine develop devote dictate die differ
+    direct disagree disappear disappoint discover discuss dislike dismiss
+    display distribute disturb divide donate doubt draft drag dream dress
+    drop dry earn edit educate elect eliminate embrace employ enable
+    encourage end endure enforce engage enhance enjoy enroll ensure enter
+    entertain establish estimate evaluate examine exceed exchange excite
+    excuse execute exercise exhibit exist expand expect experience explain
+    explore export express extend face fail favor fear file fill finish fire
+    fix flash float flood flow focus fold follow force form formulate found
+    frame free frighten fry fulfill gain gather generate glance govern grab
+    grade grant grasp greet guarantee guard guess guide handle happen harm
+    hate head heat help honor hope host hunt identify ignore illustrate
+    imagine implement imply import impress improve include incorporate
+    increase indicate influence inform inherit inhibit injure inspect
+    inspire install instruct insure integrate intend interest interfere
+    interpret interrupt introduce invent invest investigate invite involve
+    iron isolate issue join judge jump justify kick kill kiss knock label
+    lack land last laugh launch lean learn level license lift like limit
+    link list listen live load loan locate lock long look love maintain
+    manage manufacture mark market marry match matter measure melt mention
+    merge mind miss mix modify monitor motivate move multiply name need
+    neglect negotiate note notice obey object observe obtain occupy occur
+    offer open operate oppose order organize originate overlook owe own pack
+    paint park participate pass perform permit persuade pick place plan
+    plant play please point polish possess post pour practice praise pray
+    predict prefer prepare present preserve press pretend prevent print
+    proceed process produce profit program progress project promise promote
+    propose protect provide publish pull purchase pursue push qualify
+    question quote race raise range rank rate reach react realize receive
+    recognize recommend record recover reduce refer reflect refuse regard
+    register regret regulate reject relate relax release rely remain
+    remember remind remove render rent repair repeat replace reply report
+    represent request require rescue research reserve resist resolve respect
+    respond rest restore restrict result resume retain retire retreat return
+    reveal review revise reward risk roll root round rub ruin rule rush sail
+    satisfy save scale scan scare scatter schedule score scream search seat
+    secure seem select sense separate serve settle shape share shift ship
+    shock shop sigh sign signal size skate sketch ski skip slap slip slow
+    smell smile smoke smooth snap snow soak solve sort sound spare specify
+    spell spoil spot squeeze stabilize stack staff stage stain stamp start
+    state stay steer step stimulate stir stop store strain stream strengthen
+    stress stretch strip stroke structure struggle study stuff stumble style
+    subject submit substitute succeed suffer suggest suit summarize supply
+    support suppose suppress surprise surround survey survive suspect
+    suspend sustain swallow swap switch symbolize synthesize systematize
+    table talk tame tap target taste tax tease telephone tempt tend term
+    test thank threaten tie tighten time tip tire title tolerate top total
+    touch tour trace track trade train transfer transform translate
+    transport trap travel treat tremble trend trick trigger trim trip
+    trouble trust try tune turn twist type unify unite unlock unpack update
+    upgrade urge use utilize validate value vanish vary verify view violate
+    visit voice volunteer vote wait walk want warm warn wash waste watch
+    water wave weigh welcome whip whisper wipe wish witness wonder work
+    worry worship wrap yell yield zone
+""".split()
+
+# Verbs whose forms the conjugation rules do not produce
 # Format: (present, past, past_participle)
-transitive_verbs = [
-    # Regular verbs
-    ("accept", "accepted", "accepted"),
-    ("achieve", "achieved", "achieved"),
-    ("acknowledge", "acknowledged", "acknowledged"),
-    ("acquire", "acquired", "acquired"),
-    ("address", "addressed", "addressed"),
-    ("admire", "admired", "admired"),
-    ("admit", "admitted", "admitted"),
-    ("adopt", "adopted", "adopted"),
-    ("advise", "advised", "advised"),
-    ("affect", "affected", "affected"),
-    ("afford", "afforded", "afforded"),
-    ("agree", "agreed", "agreed"),
-    ("aim", "aimed", "aimed"),
-    ("allow", "allowed", "allowed"),
-    ("alter", "altered", "altered"),
-    ("analyze", "analyzed", "analyzed"),
-    ("announce", "announced", "announced"),
-    ("answer", "answered", "answered"),
-    ("anticipate", "anticipated", "anticipated"),
-    ("appreciate", "appreciated", "appreciated"),
-    ("approach", "approached", "approached"),
-    ("approve", "approved", "approved"),
-    ("argue", "argued", "argued"),
-    ("arrange", "arranged", "arranged"),
-    ("arrest", "arrested", "arrested"),
-    ("ask", "asked", "asked"),
-    ("assess", "assessed", "assessed"),
-    ("assign", "assigned", "assigned"),
-    ("assist", "assisted", "assisted"),
-    ("assume", "assumed", "assumed"),
-    ("attack", "attacked", "attacked"),
-    ("attempt", "attempted", "attempted"),
-    ("attend", "attended", "attended"),
-    ("attract", "attracted", "attracted"),
-    ("avoid", "avoided", "avoided"),
-    ("balance", "balanced", "balanced"),
-    ("ban", "banned", "banned"),
+transitive_verb_exceptions = [
     ("beat", "beat", "beaten"),
     ("become", "became", "become"),
     ("begin", "began", "begun"),
-    ("believe", "believed", "believed"),
-    ("belong", "belonged", "belonged"),
     ("bend", "bent", "bent"),
     ("bet", "bet", "bet"),
     ("bid", "bid", "bid"),
     ("bind", "bound", "bound"),
     ("bite", "bit", "bitten"),
-    ("blame", "blamed", "blamed"),
-    ("bless", "blessed", "blessed"),
-    ("block", "blocked", "blocked"),
     ("blow", "blew", "blown"),
-    ("boil", "boiled", "boiled"),
-    ("book", "booked", "booked"),
-    ("borrow", "borrowed", "borrowed"),
     ("break", "broke", "broken"),
     ("bring", "brought", "brought"),
     ("broadcast", "broadcast", "broadcast"),
     ("build", "built", "built"),
-    ("burn", "burned", "burned"),
     ("burst", "burst", "burst"),
-    ("bury", "buried", "buried"),
     ("buy", "bought", "bought"),
-    ("calculate", "calculated", "calculated"),
-    ("call", "called", "called"),
     ("cancel", "cancelled", "cancelled"),
-    ("capture", "captured", "captured"),
-    ("carry", "carried", "carried"),
     ("cast", "cast", "cast"),
     ("catch", "caught", "caught"),
-    ("cause", "caused", "caused"),
-    ("celebrate", "celebrated", "celebrated"),
-    ("change", "changed", "changed"),
-    ("charge", "charged", "charged"),
-    ("chase", "chased", "chased"),
-    ("check", "checked", "checked"),
     ("choose", "chose", "chosen"),
-    ("claim", "claimed", "claimed"),
-    ("clarify", "clarified", "clarified"),
-    ("clean", "cleaned", "cleaned"),
-    ("clear", "cleared", "cleared"),
-    ("climb", "climbed", "climbed"),
-    ("close", "closed", "closed"),
-    ("collect", "collected", "collected"),
-    ("combine", "combined", "combined"),
-    ("comfort", "comforted", "comforted"),
-    ("command", "commanded", "commanded"),
-    ("comment", "commented", "commented"),
-    ("commit", "committed", "committed"),
-    ("compare", "compared", "compared"),
-    ("compete", "competed", "competed"),
-    ("complete", "completed", "completed"),
-    ("compose", "composed", "composed"),
-    ("comprehend", "comprehended", "comprehended"),
-    ("compress", "compressed", "compressed"),
-    ("compute", "computed", "computed"),
-    ("conceal", "concealed", "concealed"),
-    ("conceive", "conceived", "conceived"),
-    ("concentrate", "concentrated", "concentrated"),
-    ("concern", "concerned", "concerned"),
-    ("conclude", "concluded", "concluded"),
-    ("conduct", "conducted", "conducted"),
-    ("confirm", "confirmed", "confirmed"),
-    ("confront", "confronted", "confronted"),
-    ("confuse", "confused", "confused"),
-    ("connect", "connected", "connected"),
-    ("consider", "considered", "considered"),
-    ("consist", "consisted", "consisted"),
-    ("construct", "constructed", "constructed"),
-    ("consult", "consulted", "consulted"),
-    ("consume", "consumed", "consumed"),
-    ("contain", "contained", "contained"),
-    ("continue", "continued", "continued"),
-    ("contract", "contracted", "contracted"),
-    ("contribute", "contributed", "contributed"),
-    ("control", "controlled", "controlled"),
-    ("convert", "converted", "converted"),
-    ("convince", "convinced", "convinced"),
-    ("cook", "cooked", "cooked"),
-    ("copy", "copied", "copied"),
-    ("correct", "corrected", "corrected"),
     ("cost", "cost", "cost"),
-    ("count", "counted", "counted"),
-    ("cover", "covered", "covered"),
-    ("create", "created", "created"),
-    ("credit", "credited", "credited"),
-    ("criticize", "criticized", "criticized"),
-    ("cross", "crossed", "crossed"),
-    ("crush", "crushed", "crushed"),
-    ("cry", "cried", "cried"),
-    ("cultivate", "cultivated", "cultivated"),
-    ("cure", "cured", "cured"),
     ("cut", "cut", "cut"),
-    ("damage", "damaged", "damaged"),
-    ("dance", "danced", "danced"),
-    ("dare", "dared", "dared"),
     ("deal", "dealt", "dealt"),
-    ("debate", "debated", "debated"),
-    ("decide", "decided", "decided"),
-    ("declare", "declared", "declared"),
-    ("decorate", "decorated", "decorated"),
-    ("decrease", "decreased", "decreased"),
-    ("defeat", "defeated", "defeated"),
-    ("defend", "defended", "defended"),
-    ("define", "defined", "defined"),
-    ("delay", "delayed", "delayed"),
-    ("deliver", "delivered", "delivered"),
-    ("demand", "demanded", "demanded"),
-    ("demonstrate", "demonstrated", "demonstrated"),
-    ("deny", "denied", "denied"),
-    ("depend", "depended", "depended"),
-    ("deposit", "deposited", "deposited"),
-    ("describe", "described", "described"),
-    ("deserve", "deserved", "deserved"),
-    ("design", "designed", "designed"),
-    ("desire", "desired", "desired"),
-    ("destroy", "destroyed", "destroyed"),
-    ("detect", "detected", "detected"),
-    ("determine", "determined", "determined"),
-    ("develop", "developed", "developed"),
-    ("devote", "devoted", "devoted"),
-    ("dictate", "dictated", "dictated"),
-    ("die", "died", "died"),
-    ("differ", "differed", "differed"),
     ("dig", "dug", "dug"),
-    ("direct", "directed", "directed"),
-    ("disagree", "disagreed", "disagreed"),
-    ("disappear", "disappeared", "disappeared"),
-    ("disappoint", "disappointed", "disappointed"),
-    ("discover", "discovered", "discovered"),
-    ("discuss", "discussed", "discussed"),
-    ("dislike", "disliked", "disliked"),
-    ("dismiss", "dismissed", "dismissed"),
-    ("display", "displayed", "displayed"),
-    ("distribute", "distributed", "distributed"),
-    ("disturb", "disturbed", "disturbed"),
-    ("divide", "divided", "divided"),
     ("do", "did", "done"),
-    ("donate", "donated", "donated"),
-    ("doubt", "doubted", "doubted"),
-    ("draft", "drafted", "drafted"),
-    ("drag", "dragged", "dragged"),
     ("draw", "drew", "drawn"),
-    ("dream", "dreamed", "dreamed"),
-    ("dress", "dressed", "dressed"),
     ("drink", "drank", "drunk"),
     ("drive", "drove", "driven"),
-    ("drop", "dropped", "dropped"),
-    ("dry", "dried", "dried"),
-    ("earn", "earned", "earned"),
     ("eat", "ate", "eaten"),
-    ("edit", "edited", "edited"),
-    ("educate", "educated", "educated"),
-    ("elect", "elected", "elected"),
-    ("eliminate", "eliminated", "eliminated"),
-    ("embrace", "embraced", "embraced"),
-    ("employ", "employed", "employed"),
-    ("enable", "enabled", "enabled"),
-    ("encourage", "encouraged", "encouraged"),
-    ("end", "ended", "ended"),
-    ("endure", "endured", "endured"),
-    ("enforce", "enforced", "enforced"),
-    ("engage", "engaged", "engaged"),
-    ("enhance", "enhanced", "enhanced"),
-    ("enjoy", "enjoyed", "enjoyed"),
-    ("enroll", "enrolled", "enrolled"),
-    ("ensure", "ensured", "ensured"),
-    ("enter", "entered", "entered"),
-    ("entertain", "entertained", "entertained"),
-    ("establish", "established", "established"),
-    ("estimate", "estimated", "estimated"),
-    ("evaluate", "evaluated", "evaluated"),
-    ("examine", "examined", "examined"),
-    ("exceed", "exceeded", "exceeded"),
-    ("exchange", "exchanged", "exchanged"),
-    ("excite", "excited", "excited"),
-    ("excuse", "excused", "excused"),
-    ("execute", "executed", "executed"),
-    ("exercise", "exercised", "exercised"),
-    ("exhibit", "exhibited", "exhibited"),
-    ("exist", "existed", "existed"),
-    ("expand", "expanded", "expanded"),
-    ("expect", "expected", "expected"),
-    ("experience", "experienced", "experienced"),
-    ("explain", "explained", "explained"),
-    ("explore", "explored", "explored"),
-    ("export", "exported", "exported"),
-    ("express", "expressed", "expressed"),
-    ("extend", "extended", "extended"),
-    ("face", "faced", "faced"),
-    ("fail", "failed", "failed"),
     ("fall", "fell", "fallen"),
-    ("favor", "favored", "favored"),
-    ("fear", "feared", "feared"),
     ("feed", "fed", "fed"),
     ("feel", "felt", "felt"),
     ("fight", "fought", "fought"),
-    ("file", "filed", "filed"),
-    ("fill", "filled", "filled"),
     ("find", "found", "found"),
-    ("finish", "finished", "finished"),
-    ("fire", "fired", "fired"),
     ("fit", "fit", "fit"),
-    ("fix", "fixed", "fixed"),
-    ("flash", "flashed", "flashed"),
-    ("float", "floated", "floated"),
-    ("flood", "flooded", "flooded"),
-    ("flow", "flowed", "flowed"),
     ("fly", "flew", "flown"),
-    ("focus", "focused", "focused"),
-    ("fold", "folded", "folded"),
-    ("follow", "followed", "followed"),
     ("forbid", "forbade", "forbidden"),
-    ("force", "forced", "forced"),
     ("forecast", "forecast", "forecast"),
     ("forget", "forgot", "forgotten"),
     ("forgive", "forgave", "forgiven"),
-    ("form", "formed", "formed"),
-    ("formulate", "formulated", "formulated"),
-    ("found", "founded", "founded"),
-    ("frame", "framed", "framed"),
-    ("free", "freed", "freed"),
     ("freeze", "froze", "frozen"),
-    ("frighten", "frightened", "frightened"),
-    ("fry", "fried", "fried"),
-    ("fulfill", "fulfilled", "fulfilled"),
-    ("gain", "gained", "gained"),
-    ("gather", "gathered", "gathered"),
-    ("generate", "generated", "generated"),
     ("get", "got", "gotten"),
     ("give", "gave", "given"),
-    ("glance", "glanced", "glanced"),
     ("go", "went", "gone"),
-    ("govern", "governed", "governed"),
-    ("grab", "grabbed", "grabbed"),
-    ("grade", "graded", "graded"),
-    ("grant", "granted", "granted"),
-    ("grasp", "grasped", "grasped"),
-    ("greet", "greeted", "greeted"),
     ("grind", "ground", "ground"),
     ("grow", "grew", "grown"),
-    ("guarantee", "guaranteed", "guaranteed"),
-    ("guard", "guarded", "guarded"),
-    ("guess", "guessed", "guessed"),
-    ("guide", "guided", "guided"),
-    ("handle", "handled", "handled"),
     ("hang", "hung", "hung"),
-    ("happen", "happened", "happened"),
-    ("harm", "harmed", "harmed"),
-    ("hate", "hated", "hated"),
     ("have", "had", "had"),
-    ("head", "headed", "headed"),
     ("hear", "heard", "heard"),
-    ("heat", "heated", "heated"),
-    ("help", "helped", "helped"),
     ("hide", "hid", "hidden"),
     ("hit", "hit", "hit"),
     ("hold", "held", "held"),
-    ("honor", "honored", "honored"),
-    ("hope", "hoped", "hoped"),
-    ("host", "hosted", "hosted"),
-    ("hunt", "hunted", "hunted"),
     ("hurt", "hurt", "hurt"),
-    ("identify", "identified", "identified"),
-    ("ignore", "ignored", "ignored"),
-    ("illustrate", "illustrated", "illustrated"),
-    ("imagine", "imagined", "imagined"),
-    ("implement", "implemented", "implemented"),
-    ("imply", "implied", "implied"),
-    ("import", "imported", "imported"),
-    ("impress", "impressed", "impressed"),
-    ("improve", "improved", "improved"),
-    ("include", "included", "included"),
-    ("incorporate", "incorporated", "incorporated"),
-    ("increase", "increased", "increased"),
-    ("indicate", "indicated", "indicated"),
-    ("influence", "influenced", "influenced"),
-    ("inform", "informed", "informed"),
-    ("inherit", "inherited", "inherited"),
-    ("inhibit", "inhibited", "inhibited"),
-    ("injure", "injured", "injured"),
-    ("inspect", "inspected", "inspected"),
-    ("inspire", "inspired", "inspired"),
-    ("install", "installed", "installed"),
-    ("instruct", "instructed", "instructed"),
-    ("insure", "insured", "insured"),
-    ("integrate", "integrated", "integrated"),
-    ("intend", "intended", "intended"),
-    ("interest", "interested", "interested"),
-    ("interfere", "interfered", "interfered"),
-    ("interpret", "interpreted", "interpreted"),
-    ("interrupt", "interrupted", "interrupted"),
-    ("introduce", "introduced", "introduced"),
-    ("invent", "invented", "invented"),
-    ("invest", "invested", "invested"),
-    ("investigate", "investigated", "investigated"),
-    ("invite", "invited", "invited"),
-    ("involve", "involved", "involved"),
-    ("iron", "ironed", "ironed"),
-    ("isolate", "isolated", "isolated"),
-    ("issue", "issued", "issued"),
-    ("join", "joined", "joined"),
-    ("judge", "judged", "judged"),
-    ("jump", "jumped", "jumped"),
-    ("justify", "justified", "justified"),
     ("keep", "kept", "kept"),
-    ("kick", "kicked", "kicked"),
-    ("kill", "killed", "killed"),
-    ("kiss", "kissed", "kissed"),
-    ("knock", "knocked", "knocked"),
     ("know", "knew", "known"),
-    ("label", "labeled", "labeled"),
-    ("lack", "lacked", "lacked"),
-    ("land", "landed", "landed"),
-    ("last", "lasted", "lasted"),
-    ("laugh", "laughed", "laughed"),
-    ("launch", "launched", "launched"),
     ("lay", "laid", "laid"),
     ("lead", "led", "led"),
-    ("lean", "leaned", "leaned"),
-    ("learn", "learned", "learned"),
     ("leave", "left", "left"),
     ("lend", "lent", "lent"),
     ("let", "let", "let"),
-    ("level", "leveled", "leveled"),
-    ("license", "licensed", "licensed"),
     ("lie", "lay", "lain"),
-    ("lift", "lifted", "lifted"),
     ("light", "lit", "lit"),
-    ("like", "liked", "liked"),
-    ("limit", "limited", "limited"),
-    ("link", "linked", "linked"),
-    ("list", "listed", "listed"),
-    ("listen", "listened", "listened"),
-    ("live", "lived", "lived"),
-    ("load", "loaded", "loaded"),
-    ("loan", "loaned", "loaned"),
-    ("locate", "located", "located"),
-    ("lock", "locked", "locked"),
-    ("long", "longed", "longed"),
-    ("look", "looked", "looked"),
     ("lose", "lost", "lost"),
-    ("love", "loved", "loved"),
-    ("maintain", "maintained", "maintained"),
     ("make", "made", "made"),
-    ("manage", "managed", "managed"),
-    ("manufacture", "manufactured", "manufactured"),
-    ("mark", "marked", "marked"),
-    ("market", "marketed", "marketed"),
-    ("marry", "married", "married"),
-    ("match", "matched", "matched"),
-    ("matter", "mattered", "mattered"),
     ("mean", "meant", "meant"),
-    ("measure", "measured", "measured"),
     ("meet", "met", "met"),
-    ("melt", "melted", "melted"),
-    ("mention", "mentioned", "mentioned"),
-    ("merge", "merged", "merged"),
-    ("mind", "minded", "minded"),
-    ("miss", "missed", "missed"),
-    ("mix", "mixed", "mixed"),
-    ("modify", "modified", "modified"),
-    ("monitor", "monitored", "monitored"),
-    ("motivate", "motivated", "motivated"),
-    ("move", "moved", "moved"),
-    ("multiply", "multiplied", "multiplied"),
-    ("name", "named", "named"),
-    ("need", "needed", "needed"),
-    ("neglect", "neglected", "neglected"),
-    ("negotiate", "negotiated", "negotiated"),
-    ("note", "noted", "noted"),
-    ("notice", "noticed", "noticed"),
-    ("obey", "obeyed", "obeyed"),
-    ("object", "objected", "objected"),
-    ("observe", "observed", "observed"),
-    ("obtain", "obtained", "obtained"),
-    ("occupy", "occupied", "occupied"),
-    ("occur", "occurred", "occurred"),
-    ("offer", "offered", "offered"),
-    ("open", "opened", "opened"),
-    ("operate", "operated", "operated"),
-    ("oppose", "opposed", "opposed"),
-    ("order", "ordered", "ordered"),
-    ("organize", "organized", "organized"),
-    ("originate", "originated", "originated"),
     ("overcome", "overcame", "overcome"),
-    ("overlook", "overlooked", "overlooked"),
-    ("owe", "owed", "owed"),
-    ("own", "owned", "owned"),
-    ("pack", "packed", "packed"),
-    ("paint", "painted", "painted"),
-    ("park", "parked", "parked"),
-    ("participate", "participated", "participated"),
-    ("pass", "passed", "passed"),
     ("pay", "paid", "paid"),
-    ("perform", "performed", "performed"),
-    ("permit", "permitted", "permitted"),
-    ("persuade", "persuaded", "persuaded"),
-    ("pick", "picked", "picked"),
-    ("place", "placed", "placed"),
-    ("plan", "planned", "planned"),
-    ("plant", "planted", "planted"),
-    ("play", "played", "played"),
-    ("please", "pleased", "pleased"),
-    ("point", "pointed", "pointed"),
-    ("polish", "polished", "polished"),
-    ("possess", "possessed", "possessed"),
-    ("post", "posted", "posted"),
-    ("pour", "poured", "poured"),
-    ("practice", "practiced", "practiced"),
-    ("praise", "praised", "praised"),
-    ("pray", "prayed", "prayed"),
-    ("predict", "predicted", "predicted"),
-    ("prefer", "preferred", "preferred"),
-    ("prepare", "prepared", "prepared"),
-    ("present", "presented", "presented"),
-    ("preserve", "preserved", "preserved"),
-    ("press", "pressed", "pressed"),
-    ("pretend", "pretended", "pretended"),
-    ("prevent", "prevented", "prevented"),
-    ("print", "printed", "printed"),
-    ("proceed", "proceeded", "proceeded"),
-    ("process", "processed", "processed"),
-    ("produce", "produced", "produced"),
-    ("profit", "profited", "profited"),
-    ("program", "programmed", "programmed"),
-    ("progress", "progressed", "progressed"),
-    ("project", "projected", "projected"),
-    ("promise", "promised", "promised"),
-    ("promote", "promoted", "promoted"),
-    ("propose", "proposed", "proposed"),
-    ("protect", "protected", "protected"),
     ("prove", "proved", "proven"),
-    ("provide", "provided", "provided"),
-    ("publish", "published", "published"),
-    ("pull", "pulled", "pulled"),
-    ("purchase", "purchased", "purchased"),
-    ("pursue", "pursued", "pursued"),
-    ("push", "pushed", "pushed"),
     ("put", "put", "put"),
-    ("qualify", "qualified", "qualified"),
-    ("question", "questioned", "questioned"),
     ("quit", "quit", "quit"),
-    ("quote", "quoted", "quoted"),
-    ("race", "raced", "raced"),
-    ("raise", "raised", "raised"),
-    ("range", "ranged", "ranged"),
-    ("rank", "ranked", "ranked"),
-    ("rate", "rated", "rated"),
-    ("reach", "reached", "reached"),
-    ("react", "reacted", "reacted"),
     ("read", "read", "read"),
-    ("realize", "realized", "realized"),
-    ("receive", "received", "received"),
-    ("recognize", "recognized", "recognized"),
-    ("recommend", "recommended", "recommended"),
-    ("record", "recorded", "recorded"),
-    ("recover", "recovered", "recovered"),
-    ("reduce", "reduced", "reduced"),
-    ("refer", "referred", "referred"),
-    ("reflect", "reflected", "reflected"),
-    ("refuse", "refused", "refused"),
-    ("regard", "regarded", "regarded"),
-    ("register", "registered", "registered"),
-    ("regret", "regretted", "regretted"),
-    ("regulate", "regulated", "regulated"),
-    ("reject", "rejected", "rejected"),
-    ("relate", "related", "related"),
-    ("relax", "relaxed", "relaxed"),
-    ("release", "released", "released"),
-    ("rely", "relied", "relied"),
-    ("remain", "remained", "remained"),
-    ("remember", "remembered", "remembered"),
-    ("remind", "reminded", "reminded"),
-    ("remove", "removed", "removed"),
-    ("render", "rendered", "rendered"),
-    ("rent", "rented", "rented"),
-    ("repair", "repaired", "repaired"),
-    ("repeat", "repeated", "repeated"),
-    ("replace", "replaced", "replaced"),
-    ("reply", "replied", "replied"),
-    ("report", "reported", "reported"),
-    ("represent", "represented", "represented"),
-    ("request", "requested", "requested"),
-    ("require", "required", "required"),
-    ("rescue", "rescued", "rescued"),
-    ("research", "researched", "researched"),
-    ("reserve", "reserved", "reserved"),
-    ("resist", "resisted", "resisted"),
-    ("resolve", "resolved", "resolved"),
-    ("respect", "respected", "respected"),
-    ("respond", "responded", "responded"),
-    ("rest", "rested", "rested"),
-    ("restore", "restored", "restored"),
-    ("restrict", "restricted", "restricted"),
-    ("result", "resulted", "resulted"),
-    ("resume", "resumed", "resumed"),
-    ("retain", "retained", "retained"),
-    ("retire", "retired", "retired"),
-    ("retreat", "retreated", "retreated"),
-    ("return", "returned", "returned"),
-    ("reveal", "revealed", "revealed"),
-    ("review", "reviewed", "reviewed"),
-    ("revise", "revised", "revised"),
-    ("reward", "rewarded", "rewarded"),
     ("ride", "rode", "ridden"),
     ("ring", "rang", "rung"),
     ("rise", "rose", "risen"),
-    ("risk", "risked", "risked"),
-    ("roll", "rolled", "rolled"),
-    ("root", "rooted", "rooted"),
-    ("round", "rounded", "rounded"),
-    ("rub", "rubbed", "rubbed"),
-    ("ruin", "ruined", "ruined"),
-    ("rule", "ruled", "ruled"),
     ("run", "ran", "run"),
-    ("rush", "rushed", "rushed"),
-    ("sail", "sailed", "sailed"),
-    ("satisfy", "satisfied", "satisfied"),
-    ("save", "saved", "saved"),
     ("say", "said", "said"),
-    ("scale", "scaled", "scaled"),
-    ("scan", "scanned", "scanned"),
-    ("scare", "scared", "scared"),
-    ("scatter", "scattered", "scattered"),
-    ("schedule", "scheduled", "scheduled"),
-    ("score", "scored", "scored"),
-    ("scream", "screamed", "screamed"),
-    ("search", "searched", "searched"),
-    ("seat", "seated", "seated"),
-    ("secure", "secured", "secured"),
     ("see", "saw", "seen"),
     ("seek", "sought", "sought"),
-    ("seem", "seemed", "seemed"),
-    ("select", "selected", "selected"),
     ("sell", "sold", "sold"),
     ("send", "sent", "sent"),
-    ("sense", "sensed", "sensed"),
-    ("separate", "separated", "separated"),
-    ("serve", "served", "served"),
     ("set", "set", "set"),
-    ("settle", "settled", "settled"),
     ("shake", "shook", "shaken"),
-    ("shape", "shaped", "shaped"),
-    ("share", "shared", "shared"),
     ("shed", "shed", "shed"),
-    ("shift", "shifted", "shifted"),
     ("shine", "shone", "shone"),
-    ("ship", "shipped", "shipped"),
-    ("shock", "shocked", "shocked"),
     ("shoot", "shot", "shot"),
-    ("shop", "shopped", "shopped"),
     ("show", "showed", "shown"),
     ("shrink", "shrank", "shrunk"),
     ("shut", "shut", "shut"),
-    ("sigh", "sighed", "sighed"),
-    ("sign", "signed", "signed"),
-    ("signal", "signaled", "signaled"),
     ("sing", "sang", "sung"),
     ("sink", "sank", "sunk"),
     ("sit", "sat", "sat"),
-    ("size", "sized", "sized"),
-    ("skate", "skated", "skated"),
-    ("sketch", "sketched", "sketched"),
-    ("ski", "skied", "skied"),
-    ("skip", "skipped", "skipped"),
-    ("slap", "slapped", "slapped"),
     ("sleep", "slept", "slept"),
     ("slide", "slid", "slid"),
-    ("slip", "slipped", "slipped"),
-    ("slow", "slowed", "slowed"),
-    ("smell", "smelled", "smelled"),
-    ("smile", "smiled", "smiled"),
-    ("smoke", "smoked", "smoked"),
-    ("smooth", "smoothed", "smoothed"),
-    ("snap", "snapped", "snapped"),
-    ("snow", "snowed", "snowed"),
-    ("soak", "soaked", "soaked"),
-    ("solve", "solved", "solved"),
-    ("sort", "sorted", "sorted"),
-    ("sound", "sounded", "sounded"),
-    ("spare", "spared", "spared"),
     ("speak", "spoke", "spoken"),
-    ("specify", "specified", "specified"),
     ("speed", "sped", "sped"),
-    ("spell", "spelled", "spelled"),
     ("spend", "spent", "spent"),
     ("spin", "spun", "spun"),
     ("split", "split", "split"),
-    ("spoil", "spoiled", "spoiled"),
-    ("spot", "spotted", "spotted"),
     ("spread", "spread", "spread"),
     ("spring", "sprang", "sprung"),
-    ("squeeze", "squeezed", "squeezed"),
-    ("stabilize", "stabilized", "stabilized"),
-    ("stack", "stacked", "stacked"),
-    ("staff", "staffed", "staffed"),
-    ("stage", "staged", "staged"),
-    ("stain", "stained", "stained"),
-    ("stamp", "stamped", "stamped"),
     ("stand", "stood", "stood"),
-    ("start", "started", "started"),
-    ("state", "stated", "stated"),
-    ("stay", "stayed", "stayed"),
     ("steal", "stole", "stolen"),
-    ("steer", "steered", "steered"),
-    ("step", "stepped", "stepped"),
     ("stick", "stuck", "stuck"),
-    ("stimulate", "stimulated", "stimulated"),
-    ("stir", "stirred", "stirred"),
-    ("stop", "stopped", "stopped"),
-    ("store", "stored", "stored"),
-    ("strain", "strained", "strained"),
-    ("stream", "streamed", "streamed"),
-    ("strengthen", "strengthened", "strengthened"),
-    ("stress", "stressed", "stressed"),
-    ("stretch", "stretched", "stretched"),
     ("strike", "struck", "struck"),
     ("string", "strung", "strung"),
-    ("strip", "stripped", "stripped"),
     ("strive", "strove", "striven"),
-    ("stroke", "stroked", "stroked"),
-    ("structure", "structured", "structured"),
-    ("struggle", "struggled", "struggled"),
-    ("study", "studied", "studied"),
-    ("stuff", "stuffed", "stuffed"),
-    ("stumble", "stumbled", "stumbled"),
-    ("style", "styled", "styled"),
-    ("subject", "subjected", "subjected"),
-    ("submit", "submitted", "submitted"),
-    ("substitute", "substituted", "substituted"),
-    ("succeed", "succeeded", "succeeded"),
-    ("suffer", "suffered", "suffered"),
-    ("suggest", "suggested", "suggested"),
-    ("suit", "suited", "suited"),
-    ("summarize", "summarized", "summarized"),
-    ("supply", "supplied", "supplied"),
-    ("support", "supported", "supported"),
-    ("suppose", "supposed", "supposed"),
-    ("suppress", "suppressed", "suppressed"),
-    ("surprise", "surprised", "surprised"),
-    ("surround", "surrounded", "surrounded"),
-    ("survey", "surveyed", "surveyed"),
-    ("survive", "survived", "survived"),
-    ("suspect", "suspected", "suspected"),
-    ("suspend", "suspended", "suspended"),
-    ("sustain", "sustained", "sustained"),
-    ("swallow", "swallowed", "swallowed"),
-    ("swap", "swapped", "swapped"),
     ("swear", "swore", "sworn"),
     ("sweep", "swept", "swept"),
     ("swim", "swam", "swum"),
     ("swing", "swung", "swung"),
-    ("switch", "switched", "switched"),
-    ("symbolize", "symbolized", "symbolized"),
-    ("synthesize", "synthesized", "synthesized"),
-    ("systematize", "systematized", "systematized"),
-    ("table", "tabled", "tabled"),
     ("take", "took", "taken"),
-    ("talk", "talked", "talked"),
-    ("tame", "tamed", "tamed"),
-    ("tap", "tapped", "tapped"),
-    ("target", "targeted", "targeted"),
-    ("taste", "tasted", "tasted"),
-    ("tax", "taxed", "taxed"),
     ("teach", "taught", "taught"),
     ("tear", "tore", "torn"),
-    ("tease", "teased", "teased"),
-    ("telephone", "telephoned", "telephoned"),
     ("tell", "told", "told"),
-    ("tempt", "tempted", "tempted"),
-    ("tend", "tended", "tended"),
-    ("term", "termed", "termed"),
-    ("test", "tested", "tested"),
-    ("thank", "thanked", "thanked"),
     ("think", "thought", "thought"),
-    ("threaten", "threatened", "threatened"),
     ("throw", "threw", "thrown"),
     ("thrust", "thrust", "thrust"),
-    ("tie", "tied", "tied"),
-    ("tighten", "tightened", "tightened"),
-    ("time", "timed", "timed"),
-    ("tip", "tipped", "tipped"),
-    ("tire", "tired", "tired"),
-    ("title", "titled", "titled"),
-    ("tolerate", "tolerated", "tolerated"),
-    ("top", "topped", "topped"),
-    ("total", "totaled", "totaled"),
-    ("touch", "touched", "touched"),
-    ("tour", "toured", "toured"),
-    ("trace", "traced", "traced"),
-    ("track", "tracked", "tracked"),
-    ("trade", "traded", "traded"),
-    ("train", "trained", "trained"),
-    ("transfer", "transferred", "transferred"),
-    ("transform", "transformed", "transformed"),
-    ("translate", "translated", "translated"),
-    ("transport", "transported", "transported"),
-    ("trap", "trapped", "trapped"),
-    ("travel", "traveled", "traveled"),
-    ("treat", "treated", "treated"),
-    ("tremble", "trembled", "trembled"),
-    ("trend", "trended", "trended"),
-    ("trick", "tricked", "tricked"),
-    ("trigger", "triggered", "triggered"),
-    ("trim", "trimmed", "trimmed"),
-    ("trip", "tripped", "tripped"),
-    ("trouble", "troubled", "troubled"),
-    ("trust", "trusted", "trusted"),
-    ("try", "tried", "tried"),
-    ("tune", "tuned", "tuned"),
-    ("turn", "turned", "turned"),
-    ("twist", "twisted", "twisted"),
-    ("type", "typed", "typed"),
     ("undergo", "underwent", "undergone"),
     ("understand", "understood", "understood"),
     ("undertake", "undertook", "undertaken"),
     ("undo", "undid", "undone"),
-    ("unify", "unified", "unified"),
-    ("unite", "united", "united"),
-    ("unlock", "unlocked", "unlocked"),
-    ("unpack", "unpacked", "unpacked"),
-    ("update", "updated", "updated"),
-    ("upgrade", "upgraded", "upgraded"),
     ("uphold", "upheld", "upheld"),
     ("upset", "upset", "upset"),
-    ("urge", "urged", "urged"),
-    ("use", "used", "used"),
-    ("utilize", "utilized", "utilized"),
-    ("validate", "validated", "validated"),
-    ("value", "valued", "valued"),
-    ("vanish", "vanished", "vanished"),
-    ("vary", "varied", "varied"),
-    ("verify", "verified", "verified"),
-    ("view", "viewed", "viewed"),
-    ("violate", "violated", "violated"),
-    ("visit", "visited", "visited"),
-    ("voice", "voiced", "voiced"),
-    ("volunteer", "volunteered", "volunteered"),
-    ("vote", "voted", "voted"),
-    ("wait", "waited", "waited"),
     ("wake", "woke", "woken"),
-    ("walk", "walked", "walked"),
-    ("want", "wanted", "wanted"),
-    ("warm", "warmed", "warmed"),
-    ("warn", "warned", "warned"),
-    ("wash", "washed", "washed"),
-    ("waste", "wasted", "wasted"),
-    ("watch", "watched", "watched"),
-    ("water", "watered", "watered"),
-    ("wave", "waved", "waved"),
     ("wear", "wore", "worn"),
     ("weave", "wove", "woven"),
     ("wed", "wed", "wed"),
-    ("weigh", "weighed", "weighed"),
-    ("welcome", "welcomed", "welcomed"),
     ("wet", "wet", "wet"),
-    ("whip", "whipped", "whipped"),
-    ("whisper", "whispered", "whispered"),
     ("win", "won", "won"),
     ("wind", "wound", "wound"),
-    ("wipe", "wiped", "wiped"),
-    ("wish", "wished", "wished"),
     ("withdraw", "withdrew", "withdrawn"),
     ("withhold", "withheld", "withheld"),
     ("withstand", "withstood", "withstood"),
-    ("witness", "witnessed", "witnessed"),
-    ("wonder", "wondered", "wondered"),
-    ("work", "worked", "worked"),
-    ("worry", "worried", "worried"),
-    ("worship", "worshiped", "worshiped"),
-    ("wrap", "wrapped", "wrapped"),
     ("write", "wrote", "written"),
-    ("yell", "yelled", "yelled"),
-    ("yield", "yielded", "yielded"),
-    ("zone", "zoned", "zoned"),
 ]
 
-# Remove duplicates and sort
-unique_verbs = []
-seen = set()
-for verb_tuple in transitive_verbs:
-    if verb_tuple[0] not in seen:
-        unique_verbs.append(verb_tuple)
-        seen.add(verb_tuple[0])
-
-# Sort alphabetically by present tense
-unique_verbs.sort(key=lambda x: x[0])
-
-# Create Word document
-doc = Document()
-
-# Add title
-title = doc.add_heading('Transitive Verbs', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Add subtitle
-subtitle = doc.add_paragraph('Present | Past | Past Participle')
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle_format = subtitle.runs[0].font
-subtitle_format.size = Pt(12)
-subtitle_format.bold = True
-
-# Add spacing
-doc.add_paragraph()
+# SHA-256 of the deduped, sorted table; checked by
+# python verb_conjugation.py --validate
+TRANSITIVE_TABLE_SHA256 = "be6a5750470e73b2f6d53d1e7a62f2ab8693563684ddac60ec11c5b2a61504b7"
 
-# Create table
-table = doc.add_table(rows=1, cols=3)
-table.style = 'Light Grid Accent 1'
 
-# Add header row
-header_cells = table.rows[0].cells
-header_cells[0].text = 'Present'
-header_cells[1].text = 'Past'
-header_cells[2].text = 'Past Participle'
+def transitive_verbs():
+    """Yield every (present, past, past_participle), conjugating regular verbs on demand."""
+    return conjugate(regular_transitive_verbs, transitive_verb_exceptions)
 
-# Format header
-for cell in header_cells:
-    cell.paragraphs[0].runs[0].font.bold = True
-    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-# Add verb rows
-for present, past, past_participle in unique_verbs:
-    row_cells = table.add_row().cells
-    row_cells[0].text = present
-    row_cells[1].text = past
-    row_cells[2].text = past_participle
-    
-    # Center align all cells
-    for cell in row_cells:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+def make_sheet():
+    """Describe the transitive verbs document for verb_tables."""
+    return VerbSheet(
+        title='Transitive Verbs',
+        headers=('Present', 'Past', 'Past Participle'),
+        verbs=transitive_verbs(),
+        output_file='transitive_verb.docx',
+    )
 
-# Save document
-output_file = 'transitive_verb.docx'
-doc.save(output_file)
 
-print(f"Document created successfully: {output_file}")
-print(f"Total verbs: {len(unique_verbs)}")
+if __name__ == "__main__":
+    main(sys.argv[1:], sheets=[make_sheet()])
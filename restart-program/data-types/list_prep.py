@@ -577,28 +577,389 @@ nums = [2, 7, 11, 15]
 target = 9
 print(f"List: {nums}, Target: {target}, Indices: {two_sum(nums, target)}")
 
+# Follow-up: many targets against the same array
+"""
+TWO-SUM INDEX:
+--------------
+two_sum() rebuilds its dict on every call. When thousands of targets
+are asked against the same data, build the structures once:
+- hash map: value -> indices where it occurs (in increasing order)
+- sorted array of the distinct values, for two-pointer scans:
+  start at both ends; move the left pointer up if the sum is too small,
+  the right one down if too big -> every matching value pair in O(n)
+Then:
+- two_sum(target): same answer as the function above, with lookups only
+- all_pairs(target): every pair of indices, not just the first
+- k_sum(target, k): every distinct combination of k values (3-sum, 4-sum...)
+- add(value): incremental insert, no rebuild
+"""
+from bisect import bisect_left, insort
+from itertools import combinations, product
+
+class TwoSumIndex:
+    """Prebuilt index over a fixed (but growable) list of numbers for repeated sum queries."""
+
+    def __init__(self, nums=()):
+        self.values = []
+        self.positions = {}      # value -> [indices], increasing
+        self.sorted_values = []  # distinct values, ascending
+        self._expanded = {}      # k -> sorted values, each repeated up to k times (k_sum cache)
+        for num in nums:
+            self.add(num)
+
+    def add(self, num):
+        """Append num to the data; O(1), plus O(distinct values) for a new value."""
+        indices = self.positions.get(num)
+        if indices is None:
+            indices = self.positions[num] = []
+            insort(self.sorted_values, num)
+        indices.append(len(self.values))
+        self.values.append(num)
+        self._expanded.clear()
+
+    def _matching_values(self, target):
+        """Yield (a, b) with a <= b, a + b == target, both present (two pointers)."""
+        values = self.sorted_values
+        lo, hi = 0, len(values) - 1
+        while lo <= hi:
+            total = values[lo] + values[hi]
+            if total < target:
+                lo += 1
+            elif total > target:
+                hi -= 1
+            else:
+                if lo < hi or len(self.positions[values[lo]]) > 1:
+                    yield values[lo], values[hi]
+                lo += 1
+                hi -= 1
+
+    def two_sum(self, target):
+        """[j, i] exactly like two_sum(self.values, target), without building a dict."""
+        positions = self.positions
+        for i, num in enumerate(self.values):
+            indices = positions.get(target - num)
+            if indices and indices[0] < i:
+                # two_sum() would remember the last index before i
+                return [indices[bisect_left(indices, i) - 1], i]
+        return []
+
+    def all_pairs(self, target):
+        """Every (i, j), i < j, with values[i] + values[j] == target, sorted."""
+        pairs = []
+        for a, b in self._matching_values(target):
+            if a == b:
+                pairs.extend(combinations(self.positions[a], 2))
+            else:
+                pairs.extend((min(i, j), max(i, j)) for i, j in product(self.positions[a], self.positions[b]))
+        pairs.sort()
+        return pairs
+
+    def k_sum(self, target, k):
+        """Every distinct combination of k values (as sorted tuples) summing to target."""
+        if k < 1:
+            return []
+        if k == 1:
+            return [(target,)] if target in self.positions else []
+        expanded = self._expanded.get(k)
+        if expanded is None:
+            # A value can be used as many times as it occurs, up to k
+            expanded = self._expanded[k] = [value for value in self.sorted_values
+                                            for _ in range(min(k, len(self.positions[value])))]
+        return self._k_sum(expanded, 0, k, target)
+
+    def _k_sum(self, nums, start, k, target):
+        if k == 2:
+            result = []
+            lo, hi = start, len(nums) - 1
+            while lo < hi:
+                total = nums[lo] + nums[hi]
+                if total < target:
+                    lo += 1
+                elif total > target:
+                    hi -= 1
+                else:
+                    result.append((nums[lo], nums[hi]))
+                    lo += 1
+                    while lo < hi and nums[lo] == nums[lo - 1]:
+                        lo += 1  # Skip repeats: each combination once
+                    hi -= 1
+            return result
+        result = []
+        for i in range(start, len(nums) - k + 1):
+            if i > start and nums[i] == nums[i - 1]:
+                continue
+            if nums[i] * k > target:
+                break  # Even the k smallest remaining values are too big
+            if nums[i] + nums[-1] * (k - 1) < target:
+                continue  # Even with the largest values, too small
+            for rest in self._k_sum(nums, i + 1, k - 1, target - nums[i]):
+                result.append((nums[i],) + rest)
+        return result
+
+index = TwoSumIndex([2, 7, 11, 15, 2, 7])
+print(f"Index over {index.values}:")
+print(f"  two_sum(9) = {index.two_sum(9)}, all pairs: {index.all_pairs(9)}")
+print(f"  3-sum to 20: {index.k_sum(20, 3)}, 4-sum to 18: {index.k_sum(18, 4)}")
+index.add(-2)
+print(f"  after add(-2): all pairs for 0: {index.all_pairs(0)}, for 5: {index.all_pairs(5)}")
+
+# Same answers as the functions, on random data
+import random
+import time
+rng = random.Random(7)
+data = [rng.randint(-10**6, 10**6) for _ in range(300)]
+index = TwoSumIndex(data)
+for target in [rng.choice(data) + rng.choice(data) for _ in range(50)]:
+    assert index.two_sum(target) == two_sum(data, target)
+small = data[:20]
+small_index = TwoSumIndex(small)
+for target in sorted({a + b for a in small for b in small[:10]})[::10]:
+    assert small_index.two_sum(target) == two_sum(small, target)
+    assert small_index.all_pairs(target) == [(i, j) for i, j in combinations(range(len(small)), 2)
+                                             if small[i] + small[j] == target]
+    assert small_index.k_sum(target, 3) == sorted({tuple(sorted(c)) for c in combinations(small, 3)
+                                                   if sum(c) == target})
+print("TwoSumIndex agrees with two_sum() and brute force")
+
+if __name__ == "__main__":  # Timing takes a few seconds
+    data = [rng.randint(-10**6, 10**6) for _ in range(2000)]
+    index = TwoSumIndex(data)
+    targets = [rng.choice(data) + rng.choice(data) for _ in range(1000)]
+    start = time.perf_counter()
+    for target in targets:
+        two_sum(data, target)
+    function_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for target in targets:
+        index.two_sum(target)
+    index_time = time.perf_counter() - start
+    print(f"1000 targets on 2000 numbers: two_sum() {function_time:.3f}s, TwoSumIndex {index_time:.3f}s")
+
 # Question 5: Rotate list
 print("\nQ5: Rotate list k positions")
 def rotate_list(lst, k):
     """Rotate list k positions to the right."""
+    if not lst:
+        return lst[:]  # Nothing to rotate (and k % 0 raises ZeroDivisionError)
     k = k % len(lst)  # Handle k > len(lst)
     return lst[-k:] + lst[:-k]
 
 test_list = [1, 2, 3, 4, 5]
 print(f"List: {test_list}, Rotated by 2: {rotate_list(test_list, 2)}")
+print(f"Empty list rotated: {rotate_list([], 3)}")
+
+# Follow-up: rotate without copying
+"""
+IN-PLACE ROTATION:
+------------------
+lst[-k:] + lst[:-k] makes three copies (two slices + the result).
+In place instead:
+- list:   triple reversal. Reverse everything, then the first k items,
+          then the rest: [1,2,3,4,5] -> [5,4,3,2,1] -> [4,5 | 3,2,1]
+          -> [4,5,1,2,3]. Swaps only: O(n) time, O(1) extra memory
+- deque:  deque.rotate(k) is built in (O(k): moves items between ends)
+- array:  numeric buffers (array.array, bytearray) can be shifted with
+          one memmove through a memoryview, saving only the shorter side
+- no copy at all: two memoryviews (tail, head) that read as the
+  rotated buffer, e.g. for f.writelines() or socket.sendmsg()
+"""
+from array import array
+from collections import deque
+
+def _reverse_range(seq, lo, hi):
+    """Reverse seq[lo:hi] in place by swapping from both ends."""
+    hi -= 1
+    while lo < hi:
+        seq[lo], seq[hi] = seq[hi], seq[lo]
+        lo += 1
+        hi -= 1
+
+def rotate_buffer(buffer, k):
+    """Rotate a writable 1-D buffer k positions to the right, in place."""
+    with memoryview(buffer) as view:
+        n = len(view)
+        if n == 0 or k % n == 0:
+            return buffer
+        k %= n
+        if k <= n - k:
+            saved = memoryview(view[n - k:].tobytes()).cast(view.format)  # The k items wrapping around
+            view[k:] = view[:n - k]  # Overlapping copy: a memmove
+            view[:k] = saved
+        else:
+            saved = memoryview(view[:n - k].tobytes()).cast(view.format)
+            view[:k] = view[n - k:]
+            view[k:] = saved
+    return buffer
+
+def rotated_views(buffer, k):
+    """The buffer rotated k positions right, as two memoryviews (tail, head); nothing is copied."""
+    view = memoryview(buffer)
+    n = len(view)
+    k = k % n if n else 0
+    return view[n - k:], view[:n - k]
+
+def rotate_in_place(seq, k):
+    """Rotate a list, deque or writable buffer k positions to the right, in place; returns it."""
+    if isinstance(seq, deque):
+        seq.rotate(k)
+        return seq
+    if not isinstance(seq, list):
+        return rotate_buffer(seq, k)
+    n = len(seq)
+    if n == 0:
+        return seq
+    k %= n
+    seq.reverse()
+    _reverse_range(seq, 0, k)
+    _reverse_range(seq, k, n)
+    return seq
+
+print(f"In place (list):  {rotate_in_place([1, 2, 3, 4, 5], 2)}")
+print(f"In place (deque): {list(rotate_in_place(deque([1, 2, 3, 4, 5]), 2))}")
+print(f"In place (array): {rotate_in_place(array('i', [1, 2, 3, 4, 5]), 2).tolist()}")
+tail, head = rotated_views(array('i', [1, 2, 3, 4, 5]), 2)
+print(f"Zero-copy views: {tail.tolist()} + {head.tolist()}")
+print(f"Empty: {rotate_in_place([], 2)}, {list(rotate_in_place(deque(), 2))}, "
+      f"{rotate_in_place(array('i'), 2).tolist()}")
+
+# Every path agrees with rotate_list(), including k < 0 and k > len
+for n in range(7):
+    for k in range(-8, 9):
+        expected = rotate_list(list(range(n)), k)
+        assert rotate_in_place(list(range(n)), k) == expected
+        assert list(rotate_in_place(deque(range(n)), k)) == expected
+        assert rotate_in_place(array('q', range(n)), k).tolist() == expected
+        assert [x for view in rotated_views(array('q', range(n)), k) for x in view.tolist()] == expected
+print("All rotation paths agree on lists of 0-6 items")
+
+# Extra memory and time for 1M numbers
+import time
+import tracemalloc
+if __name__ == "__main__":  # Takes a few seconds under tracemalloc
+    for name, make, rotate in (
+        ("rotate_list (copies)", lambda: list(range(1_000_000)), rotate_list),
+        ("list, triple reversal", lambda: list(range(1_000_000)), rotate_in_place),
+        ("deque.rotate", lambda: deque(range(1_000_000)), rotate_in_place),
+        ("array, memoryview", lambda: array('q', range(1_000_000)), rotate_in_place),
+    ):
+        data = make()
+        tracemalloc.start()
+        start = time.perf_counter()
+        rotate(data, 250_000)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<22} {elapsed:.4f}s, extra memory {peak / 2**20:6.2f} MiB")
+    print("Note: the swaps run in Python, so triple reversal saves memory, not time.")
 
 # Question 6: Find maximum subarray sum (Kadane's algorithm)
 print("\nQ6: Maximum subarray sum")
+def max_subarray(iterable):
+    """
+    Kadane's algorithm over any iterable (list, generator, file...):
+    returns (max sum, start, end), the best subarray being nums[start:end].
+    One pass, O(1) memory: nothing is sliced or copied.
+    """
+    best = None
+    current_sum = current_start = 0
+    for i, num in enumerate(iterable):
+        if i == 0 or current_sum < 0:
+            current_sum, current_start = num, i  # A negative prefix only hurts: restart here
+        else:
+            current_sum += num
+        if best is None or current_sum > best[0]:
+            best = (current_sum, current_start, i + 1)
+    if best is None:
+        raise ValueError("max_subarray() of an empty sequence")
+    return best
+
 def max_subarray_sum(nums):
     """Find maximum sum of contiguous subarray."""
-    max_sum = current_sum = nums[0]
-    for num in nums[1:]:
-        current_sum = max(num, current_sum + num)
-        max_sum = max(max_sum, current_sum)
-    return max_sum
+    return max_subarray(nums)[0]
 
 test_list = [-2, 1, -3, 4, -1, 2, 1, -5, 4]
 print(f"List: {test_list}, Max subarray sum: {max_subarray_sum(test_list)}")
+best, start, end = max_subarray(iter(test_list))  # Any iterator works
+print(f"Best subarray: test_list[{start}:{end}] = {test_list[start:end]}, sum {best}")
+
+# Follow-up: parallel Kadane for huge arrays
+"""
+DIVIDE AND CONQUER:
+-------------------
+Split the array into chunks and summarize each one independently as
+(total, best prefix, best suffix, best subarray). Two neighbouring
+summaries merge into the summary of both chunks:
+- total  = left total + right total
+- prefix = best of: left prefix, left total + right prefix
+- suffix = best of: right suffix, right total + left suffix
+- best   = best of: left best, right best, left suffix + right prefix
+               (the subarray crossing the boundary)
+The merge is associative, so chunks can be summarized in parallel (here
+in a process pool) and combined in any grouping: a classic reduction.
+"""
+def chunk_summary(chunk):
+    """
+    Summary of (offset, values): (total, (prefix sum, end),
+    (suffix sum, start), (best sum, start, end)), with absolute indices.
+    """
+    offset, values = chunk
+    total = 0
+    prefix = None
+    lowest = (0, offset)  # Smallest running total before some index: the best suffix starts there
+    for i, value in enumerate(values, offset):
+        if total < lowest[0]:
+            lowest = (total, i)
+        total += value
+        if prefix is None or total > prefix[0]:
+            prefix = (total, i + 1)
+    best, start, end = max_subarray(values)
+    return total, prefix, (total - lowest[0], lowest[1]), (best, start + offset, end + offset)
+
+def merge_summaries(left, right):
+    """Summary of two adjacent chunks (left first) from theirs; ties keep the leftmost."""
+    left_total, left_prefix, left_suffix, left_best = left
+    right_total, right_prefix, right_suffix, right_best = right
+    first = lambda item: item[0]
+    prefix = max(left_prefix, (left_total + right_prefix[0], right_prefix[1]), key=first)
+    suffix = max((right_total + left_suffix[0], left_suffix[1]), right_suffix, key=first)
+    crossing = (left_suffix[0] + right_prefix[0], left_suffix[1], right_prefix[1])
+    best = max(left_best, crossing, right_best, key=first)
+    return left_total + right_total, prefix, suffix, best
+
+def max_subarray_parallel(nums, chunks=4, workers=None):
+    """max_subarray() of a list, its chunks summarized in a process pool."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import reduce
+    if chunks < 1:
+        raise ValueError(f"max_subarray_parallel() needs at least 1 chunk, got {chunks}")
+    if not nums:
+        raise ValueError("max_subarray_parallel() of an empty sequence")
+    size = -(-len(nums) // min(chunks, len(nums)))  # Ceiling division; at least 1 item per chunk
+    pieces = [(offset, nums[offset:offset + size]) for offset in range(0, len(nums), size)]
+    # fork: workers don't re-run this whole tutorial on import (spawn would)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        summaries = list(pool.map(chunk_summary, pieces))
+    return reduce(merge_summaries, summaries)[3]
+
+summaries = [chunk_summary((0, test_list[:4])), chunk_summary((4, test_list[4:]))]
+print(f"Merged chunk summaries: best {merge_summaries(*summaries)[3]}")
+
+if __name__ == "__main__":  # Process pools need the guard
+    import random
+    import time
+    big = [random.randint(-100, 100) for _ in range(2_000_000)]
+    start = time.perf_counter()
+    sequential = max_subarray(big)
+    sequential_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = max_subarray_parallel(big, chunks=8)
+    parallel_time = time.perf_counter() - start
+    print(f"2M numbers: sequential {sequential} in {sequential_time:.3f}s, "
+          f"parallel {parallel} in {parallel_time:.3f}s")
+    print("Note: sending chunks to the workers costs time too; it pays off with several cores and big arrays.")
 
 
 # ==============================================================================
@@ -1732,8 +2093,8 @@ print(f"Character frequencies: {sorted_chars}")
 
 # Example 3: Sliding window
 print("\nEXAMPLE 3: Sliding window pattern")
-def sliding_window_max(nums, k):
-    """Find maximum in each sliding window of size k."""
+def sliding_window_max_naive(nums, k):
+    """Find maximum in each sliding window of size k (O(n*k): copies every window)."""
     if not nums or k == 0:
         return []
     
@@ -1744,7 +2105,346 @@ def sliding_window_max(nums, k):
     return result
 
 nums = [1, 3, -1, -3, 5, 3, 6, 7]
-print(f"Sliding window max (k=3): {sliding_window_max(nums, 3)}")
+print(f"Sliding window max (k=3): {sliding_window_max_naive(nums, 3)}")
+
+# Monotonic deque: O(n) in total, for any iterable (even an endless stream)
+"""
+MONOTONIC DEQUE:
+----------------
+Keep the indices of the window's "candidates" in a deque, with their
+values decreasing from front to back:
+- A new value removes every smaller value at the back: those can never
+  be the maximum again, as the new value outlives them in the window
+- The front is the current maximum; drop it once it leaves the window
+Each value is appended and removed at most once -> O(n) total, O(k) memory.
+Being a generator, it needs no list: results come out as values come in.
+"""
+from collections import deque
+
+def _sliding_window_extreme(values, k, replaces):
+    """Yield the extreme of each window of size k; replaces(new, old) drops old."""
+    if k <= 0:
+        return
+    window = deque()  # (index, value), front = extreme of the window
+    for i, value in enumerate(values):
+        while window and replaces(value, window[-1][1]):
+            window.pop()
+        window.append((i, value))
+        if window[0][0] <= i - k:
+            window.popleft()  # Front index fell out of the window
+        if i >= k - 1:
+            yield window[0][1]
+
+def sliding_window_max(values, k):
+    """Yield the maximum of each sliding window of size k, in O(n)."""
+    return _sliding_window_extreme(values, k, lambda new, old: new >= old)
+
+def sliding_window_min(values, k):
+    """Yield the minimum of each sliding window of size k, in O(n)."""
+    return _sliding_window_extreme(values, k, lambda new, old: new <= old)
+
+def sliding_window_sum(values, k):
+    """Yield the sum of each sliding window of size k: add the new value, subtract the leaving one."""
+    if k <= 0:
+        return
+    window = deque(maxlen=k)
+    total = 0
+    for value in values:
+        if len(window) == k:
+            total -= window[0]  # Evicted by the append below
+        window.append(value)
+        total += value
+        if len(window) == k:
+            yield total
+    # NOTE: with floats, a running sum slowly accumulates rounding error
+
+def sliding_window_mean(values, k):
+    """Yield the mean of each sliding window of size k."""
+    for total in sliding_window_sum(values, k):
+        yield total / k
+
+print(f"Deque max  (k=3): {list(sliding_window_max(nums, 3))}")
+print(f"Deque min  (k=3): {list(sliding_window_min(nums, 3))}")
+print(f"Deque sum  (k=3): {list(sliding_window_sum(nums, 3))}")
+print(f"Deque mean (k=3): {[round(m, 2) for m in sliding_window_mean(nums, 3)]}")
+
+# Works on streams: no len() or slicing needed
+import itertools
+import random
+rng = random.Random(0)
+stream = (rng.randint(0, 100) for _ in itertools.count())  # Endless!
+first_maxes = list(itertools.islice(sliding_window_max(stream, 5), 5))
+print(f"First 5 window maxes of an endless stream (k=5): {first_maxes}")
+
+# Benchmark: the naive version copies k values per window
+import time
+series = [rng.random() for _ in range(20000)]
+for k in (10, 1000):
+    start = time.perf_counter()
+    naive = sliding_window_max_naive(series, k)
+    naive_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = list(sliding_window_max(series, k))
+    fast_time = time.perf_counter() - start
+    print(f"n=20k, k={k}: naive {naive_time:.4f}s, deque {fast_time:.4f}s, "
+          f"same result: {naive == fast}")
+print("Note: the deque's time doesn't depend on k; the naive one grows with it.")
+
+
+# ==============================================================================
+# PART 13: VECTORIZED BACKEND - NUMPY FOR LARGE NUMERIC DATA
+# ==============================================================================
+
+"""
+NUMPY BACKEND:
+--------------
+The interview solutions above loop in pure Python: fine for small lists,
+slow for millions of numbers. NumPy runs the same loops in C over packed
+arrays. Each *_numpy version below uses a vectorized trick:
+
+- two_sum:            np.unique + np.searchsorted find every complement at once
+- max_subarray_sum:   cumulative sums; best = max(prefix[j] - min(prefix[:j]))
+                      (int arrays whose sums fit int64 only: float prefix
+                      sums lose small values next to big ones)
+- rotate_list:        np.roll
+- find_duplicates:    np.unique(return_index=True) marks first occurrences
+- sliding_window_max: sliding_window_view for small k; for large k, block
+                      prefix/suffix maxima (van Herk/Gil-Werman), O(n) for any k
+
+The *_auto versions pick a backend: NumPy when it is installed and the
+input is an ndarray or a numeric list of at least NUMPY_MIN_SIZE items,
+pure Python otherwise. Smaller int and float dtypes are widened to
+int64/float64 first, so uint8 5 - 10 is -5, not 251; arrays containing
+NaN stay on the pure-Python path. Both backends return the same (plain
+Python) results, checked against a shared corpus of test cases below.
+
+NOTE: converting a list to an array costs a pass over it, so small lists
+stay on the pure-Python path. rotate_list only uses NumPy for ndarrays:
+list slicing is already a C-level copy.
+"""
+
+print("\n" + "="*70)
+print("VECTORIZED BACKEND - NUMPY FOR LARGE NUMERIC DATA")
+print("="*70)
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # Optional: everything falls back to pure Python
+    np = None
+
+NUMPY_MIN_SIZE = 10_000
+# Up to this k, sliding_window_view's O(n*k) max beats the O(n) block method
+WINDOW_VIEW_MAX_K = 16
+
+def _numeric_array(data, convert=True):
+    """data as a 1-D int64/float64 ndarray if NumPy should handle it, else None."""
+    if np is None:
+        return None
+    if not isinstance(data, np.ndarray):
+        if not convert or len(data) < NUMPY_MIN_SIZE:
+            return None
+        try:
+            data = np.asarray(data)
+        except (ValueError, OverflowError):  # Ragged or huge ints
+            return None
+    if data.ndim != 1 or data.dtype.kind not in "iuf" or data.dtype.itemsize > 8:
+        return None
+    if data.dtype.kind == "f":
+        data = data.astype(np.float64, copy=False)
+        # NaN breaks sorting and ==; the pure-Python versions define the answer
+        if np.isnan(data).any():
+            return None
+        return data
+    # Small ints wrap around in arithmetic (uint8: 5 - 10 == 251)
+    if data.dtype == np.uint64 and len(data) and data.max() >= 2**63:
+        return None
+    return data.astype(np.int64, copy=False)
+
+def _python_input(data):
+    """data for a pure-Python version: ndarrays become lists of Python numbers."""
+    return data.tolist() if np is not None and isinstance(data, np.ndarray) else data
+
+def _complements_fit(arr, target):
+    """True if target - arr cannot overflow int64."""
+    if arr.dtype.kind == "f" or isinstance(target, (float, np.floating)) or len(arr) == 0:
+        return True
+    largest = max(abs(int(arr.min())), abs(int(arr.max())))
+    return abs(int(target)) + largest < 2**63
+
+def two_sum_numpy(arr, target):
+    """two_sum() on an ndarray: same first pair of indices, or []."""
+    values, first_index = np.unique(arr, return_index=True)
+    complements = target - arr
+    positions = np.searchsorted(values, complements).clip(max=len(values) - 1)
+    # Complement present at an earlier index?
+    found = (values[positions] == complements) & (first_index[positions] < np.arange(len(arr)))
+    if len(arr) == 0 or not found.any():
+        return []
+    i = int(np.argmax(found))
+    # two_sum() remembers the last index of each value seen before i
+    j = int(np.flatnonzero(arr[:i] == complements[i])[-1])
+    return [j, i]
+
+def _prefix_sums_fit(arr):
+    """True if every cumulative sum of an int64 array fits int64."""
+    if len(arr) == 0:
+        return True
+    largest = max(abs(int(arr.min())), abs(int(arr.max())))
+    return len(arr) * largest < 2**63
+
+def max_subarray_sum_numpy(arr):
+    """max_subarray_sum() on an int ndarray, from cumulative sums (see _prefix_sums_fit)."""
+    if len(arr) == 0:
+        raise ValueError("max_subarray() of an empty sequence")
+    prefix = np.concatenate(([0], np.cumsum(arr)))
+    # Best sum ending at j: prefix[j] minus the smallest prefix before it
+    return (prefix[1:] - np.minimum.accumulate(prefix[:-1])).max().item()
+
+def rotate_list_numpy(arr, k):
+    """rotate_list() on an ndarray: np.roll."""
+    return np.roll(arr, k).tolist()
+
+def find_duplicates_numpy(arr):
+    """find_duplicates() on an ndarray: every repeat, in order of appearance."""
+    _, first_index = np.unique(arr, return_index=True)
+    repeat = np.ones(len(arr), dtype=bool)
+    repeat[first_index] = False
+    return arr[repeat].tolist()
+
+def sliding_window_max_numpy(arr, k):
+    """Window maxima as a list, like list(sliding_window_max(arr, k))."""
+    n = len(arr)
+    if k <= 0 or k > n:
+        return []
+    if k <= WINDOW_VIEW_MAX_K:
+        return sliding_window_view(arr, k).max(axis=1).tolist()
+    # Split into blocks of k; a window spans the end of one block and the start of the next
+    padded = np.concatenate((arr, np.full(-n % k, arr.min(), dtype=arr.dtype))).reshape(-1, k)
+    prefix = np.maximum.accumulate(padded, axis=1).ravel()
+    suffix = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[:n - k + 1], prefix[k - 1:n]).tolist()
+
+def two_sum_auto(nums, target):
+    """two_sum() on the fastest available backend."""
+    arr = _numeric_array(nums)
+    if arr is None or not _complements_fit(arr, target):
+        return two_sum(_python_input(nums), target)
+    return two_sum_numpy(arr, target)
+
+def max_subarray_sum_auto(nums):
+    """max_subarray_sum() on the fastest available backend."""
+    arr = _numeric_array(nums)
+    # Float prefix sums cancel out small values (-1e17 + 1.0 == -1e17): exact Kadane instead
+    if arr is None or arr.dtype.kind == "f" or not _prefix_sums_fit(arr):
+        return max_subarray_sum(_python_input(nums))
+    return max_subarray_sum_numpy(arr)
+
+def rotate_list_auto(lst, k):
+    """rotate_list(); NumPy only for ndarray input."""
+    arr = _numeric_array(lst, convert=False)
+    return rotate_list(_python_input(lst), k) if arr is None else rotate_list_numpy(arr, k)
+
+def find_duplicates_auto(lst):
+    """find_duplicates() on the fastest available backend."""
+    arr = _numeric_array(lst)
+    return find_duplicates(_python_input(lst)) if arr is None else find_duplicates_numpy(arr)
+
+def sliding_window_max_auto(nums, k):
+    """Window maxima as a list, on the fastest available backend."""
+    arr = _numeric_array(nums)
+    if arr is None:
+        return list(sliding_window_max(_python_input(nums), k))
+    return sliding_window_max_numpy(arr, k)
+
+# Shared correctness corpus: every backend must agree on these.
+# A (values, dtype) pair tests an array of that dtype.
+rng = random.Random(42)
+CORRECTNESS_CASES = [
+    [],
+    [5],
+    [-3],
+    [2, 7, 11, 15],
+    [3, 3],
+    [1, 2, 3, 2, 4, 3, 5],
+    [-2, 1, -3, 4, -1, 2, 1, -5, 4],
+    [-5, -1, -8, -2],
+    [0, 0, 0, 0],
+    [1.5, 2.5, -1.0, 3.0, 1.5],
+    [1.5, float("nan"), -2.0, float("nan"), 4.0, 1.5],
+    (list(range(20)), "uint8"),
+    ([-100, 27, 100, -27, 5], "int8"),
+    ([0.5, -1.25, 2.0, 0.5], "float32"),
+    [2**62, 2**62, -5, 2**62, 2**62],     # Sums overflow int64
+    [-2**62, 3, -2**62, 2**62 + 7],
+    [-1e17] + [1.0] * 20,                 # Small values vanish in float prefix sums
+    [1e300, 1e300, -1e300, 1.0],
+    [rng.randint(-50, 50) for _ in range(200)],
+    [rng.randint(-10**6, 10**6) for _ in range(3000)],
+]
+
+def _outcome(function, *args):
+    """Result of a call, or the type of exception it raised."""
+    try:
+        return function(*args)
+    except Exception as error:
+        return type(error)
+
+def check_backends(cases=CORRECTNESS_CASES):
+    """
+    Compare the pure-Python versions on each case with the *_auto versions
+    on it as an ndarray (NumPy, or the fallback for arrays NumPy declines);
+    returns failures.
+    """
+    failures = []
+    for case in cases:
+        if isinstance(case, tuple):
+            case, dtype = case
+        else:
+            dtype = float if any(isinstance(x, float) for x in case) else np.int64
+        arr = np.array(case, dtype=dtype)
+        values = arr.tolist()  # The same numbers, after any rounding to dtype
+        checks = [
+            ("two_sum", two_sum, two_sum_auto, (values[0] + values[-1] if values else 0,)),
+            ("two_sum (none)", two_sum, two_sum_auto, (10**9,)),
+            ("two_sum (negative)", two_sum, two_sum_auto, (-1,)),
+            ("max_subarray_sum", max_subarray_sum, max_subarray_sum_auto, ()),
+            ("find_duplicates", find_duplicates, find_duplicates_auto, ()),
+        ]
+        checks.append(("rotate_list", rotate_list, rotate_list_auto, (len(case) // 3 + 1,)))
+        for k in (1, 3, 20, 500):
+            checks.append((f"sliding_window_max k={k}",
+                           lambda nums, k: list(sliding_window_max(nums, k)), sliding_window_max_auto, (k,)))
+        for name, python_version, auto_version, args in checks:
+            # repr() so NaN results compare equal
+            if repr(_outcome(python_version, values, *args)) != repr(_outcome(auto_version, arr, *args)):
+                failures.append((name, str(dtype), case[:10]))
+    return failures
+
+if np is None:
+    print("NumPy not installed: the *_auto functions use the pure-Python versions")
+else:
+    failures = check_backends()
+    print(f"Correctness corpus: {len(CORRECTNESS_CASES)} cases, "
+          f"{'all backends agree' if not failures else f'MISMATCHES: {failures}'}")
+
+if np is not None and __name__ == "__main__":  # Slow: seconds of pure Python on 1M numbers
+    big = [rng.randint(-10**6, 10**6) for _ in range(1_000_000)]
+    big_array = np.array(big)
+    for name, python_call, auto_call in (
+        ("two_sum", lambda: two_sum(big, 10**9), lambda: two_sum_auto(big_array, 10**9)),
+        ("max_subarray_sum", lambda: max_subarray_sum(big), lambda: max_subarray_sum_auto(big_array)),
+        ("find_duplicates", lambda: find_duplicates(big), lambda: find_duplicates_auto(big_array)),
+        ("sliding_window_max k=3600", lambda: list(sliding_window_max(big, 3600)),
+         lambda: sliding_window_max_auto(big_array, 3600)),
+    ):
+        start = time.perf_counter()
+        python_call()
+        python_time = time.perf_counter() - start
+        start = time.perf_counter()
+        auto_call()
+        numpy_time = time.perf_counter() - start
+        print(f"1M numbers, {name}: Python {python_time:.3f}s, NumPy {numpy_time:.3f}s")
 
 
 # ==============================================================================
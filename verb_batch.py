@@ -0,0 +1,116 @@
+"""
+Batch mode: render many verb sheets in parallel.
+
+A manifest is a JSON list of documents to produce. Each entry names a
+registered sheet ("irregular", "transitive") or a source file, and may
+restrict it to some starting letters:
+
+    [
+        {"sheet": "transitive", "letters": "a-f", "output": "transitive_a_f.docx"},
+        {"sheet": "transitive", "letters": "g-z", "output": "transitive_g_z.docx"},
+        {"source": "verbs_fr.csv.gz", "title": "French Verbs"}
+    ]
+
+python-docx rendering is CPU-bound, so documents are spread over a
+ProcessPoolExecutor; each worker process keeps one document builder.
+
+Usage:
+    python verb_batch.py manifest.json --workers 4 -o handouts/
+"""
+
+import argparse
+import json
+import os
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from verb_tables import load_sheet, make_builder, source_sheet
+
+# One builder per worker process, created by the first job it runs
+_builder = None
+
+
+def parse_letters(spec):
+    """Turn 'a-f', 'aeiou' or 'a-c,x-z' into a set of lowercase letters."""
+    letters = set()
+    for part in spec.lower().replace(",", " ").split():
+        if len(part) == 3 and part[1] == "-":
+            first, last = string.ascii_lowercase.index(part[0]), string.ascii_lowercase.index(part[2])
+            letters.update(string.ascii_lowercase[first:last + 1])
+        else:
+            letters.update(part)
+    return letters
+
+
+def job_sheet(job):
+    """Build the VerbSheet described by one manifest entry."""
+    if "source" in job:
+        sheet = source_sheet(job["source"], job.get("title"))
+    else:
+        sheet = load_sheet(job["sheet"])
+        if "title" in job:
+            sheet.title = job["title"]
+
+    if "letters" in job:
+        letters = parse_letters(job["letters"])
+        sheet.verbs = (row for row in sheet.verbs if row[0][:1].lower() in letters)
+
+    if "output" in job:
+        sheet.output_file = job["output"]
+    return sheet
+
+
+def render_job(job, output_dir=""):
+    """Render one manifest entry. Returns (output_file, verb count, seconds)."""
+    global _builder
+    start = time.perf_counter()
+    if _builder is None:
+        _builder = make_builder(cache=True)
+    sheet = job_sheet(job)
+    output_file, count = _builder.save(sheet, os.path.join(output_dir, sheet.output_file))
+    return output_file, count, time.perf_counter() - start
+
+
+def run_batch(jobs, workers=None, output_dir=""):
+    """
+    Render all jobs across worker processes, printing per-document timing
+    and total throughput. Returns the list of (output_file, count, seconds).
+    """
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        for job in jobs:
+            results.append(render_job(job, output_dir))
+            print("  {:<40} {:>8} verbs {:8.3f}s".format(*results[-1]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_job, job, output_dir) for job in jobs]
+            for future in as_completed(futures):
+                results.append(future.result())
+                print("  {:<40} {:>8} verbs {:8.3f}s".format(*results[-1]))
+
+    elapsed = time.perf_counter() - start
+    total_verbs = sum(count for _, count, _ in results)
+    print(f"Rendered {len(results)} documents ({total_verbs} verbs) in {elapsed:.3f}s")
+    print(f"Throughput: {len(results) / elapsed:.2f} documents/s, {total_verbs / elapsed:,.0f} verbs/s")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a manifest of verb sheets in parallel.")
+    parser.add_argument("manifest", help="JSON file with a list of documents to produce")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: %(default)s; 1 renders serially)")
+    parser.add_argument("-o", "--output-dir", default="",
+                        help="directory for the .docx files (default: current directory)")
+    args = parser.parse_args(argv)
+
+    with open(args.manifest, encoding="utf-8") as f:
+        jobs = json.load(f)
+    print(f"Rendering {len(jobs)} documents with {args.workers} worker(s)")
+    run_batch(jobs, args.workers, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
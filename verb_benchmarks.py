@@ -0,0 +1,249 @@
+"""
+Benchmark suite for the verb document pipeline.
+
+Times each stage of building a verb table document separately, on
+synthetic corpora shaped like create_transitive_verbs.py (regular base
+forms stored as one string plus a list of exception tuples, with some
+repeated verbs):
+
+    construct  split the stored base forms and conjugate them, plus exceptions
+    dedupe     keep the first row of each base form
+    sort       sort_verbs() with the default casefold collation
+    render     build the table (python-docx bulk XML, or the stdlib writer
+               rendering into memory)
+    save       doc.save() to disk (stdlib: write the rendered bytes)
+
+Each size runs twice: once for wall time and once under tracemalloc for
+the peak memory of every stage (tracemalloc slows code down, so the two
+are kept apart). tracemalloc only sees Python allocations, not lxml's C
+memory. Results are written as JSON for regression tracking; with
+--baseline, the stage times are compared with an earlier results file;
+baselines from another backend or row mode are refused, and sizes whose
+row counts differ are skipped with a warning.
+
+Usage:
+    python verb_benchmarks.py                         # 1k, 10k, 100k, 1M verbs
+    python verb_benchmarks.py --sizes 1000 10000 -o results.json
+    python verb_benchmarks.py --backend stdlib --baseline old_results.json
+    python verb_benchmarks.py --per-row             # python-docx one row at a time
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+
+from verb_conjugation import conjugate
+from verb_docx_writer import write_docx
+from verb_sorting import sort_verbs
+from verb_tables import VerbDocumentBuilder, VerbSheet, docx_available
+
+STAGES = ("construct", "dedupe", "sort", "render", "save")
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+HEADERS = ("Present", "Past", "Past Participle")
+
+
+def synthetic_corpus(size, seed=0):
+    """
+    Return (regular base forms as one whitespace-separated str, exception
+    tuples) with size verbs in total: about 85% regular, 15% exceptions
+    and 5% of all entries repeating an earlier verb.
+    """
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    regular = []
+    exceptions = []
+    for i in range(size):
+        if i and rng.random() < 0.05:
+            # Repeat an earlier verb, as the original lists do
+            if exceptions and rng.random() < 0.15:
+                exceptions.append(rng.choice(exceptions))
+            elif regular:
+                regular.append(rng.choice(regular))
+            continue
+        base = "".join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+        if rng.random() < 0.15:
+            exceptions.append((base, base + "t", base + "en"))
+        else:
+            regular.append(base)
+    return " ".join(regular), exceptions
+
+
+def dedupe(rows):
+    """Rows with the first occurrence of each base form, in input order."""
+    first = {}
+    for row in rows:
+        first.setdefault(row[0], row)
+    return list(first.values())
+
+
+def run_stages(size, backend, output_dir, memory=False, bulk=True):
+    """
+    Run every stage once on a corpus of size verbs. Returns ({stage:
+    seconds}, or with memory {stage: peak traced bytes}; rows; file bytes).
+    """
+    regular_text, exceptions = synthetic_corpus(size)
+    output_file = os.path.join(output_dir, f"benchmark_{size}.docx")
+    results = {}
+    state = {}
+
+    def construct():
+        state["rows"] = list(conjugate(regular_text.split(), exceptions))
+
+    def dedupe_stage():
+        state["rows"] = dedupe(state["rows"])
+
+    def sort_stage():
+        state["rows"] = sort_verbs(state["rows"], "casefold")
+
+    def render():
+        sheet = VerbSheet("Benchmark", HEADERS, state["rows"], output_file)
+        if backend == "docx":
+            state["doc"] = VerbDocumentBuilder(bulk=bulk).build(sheet, state["rows"])
+        else:
+            state["doc"] = io.BytesIO()
+            write_docx(state["doc"], sheet.title, sheet.subtitle, sheet.headers, state["rows"])
+
+    def save():
+        if backend == "docx":
+            state["doc"].save(output_file)
+        else:
+            with open(output_file, "wb") as f:
+                f.write(state["doc"].getvalue())
+
+    if memory:
+        tracemalloc.start()
+    try:
+        for stage, run in zip(STAGES, (construct, dedupe_stage, sort_stage, render, save)):
+            if memory:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                run()
+                results[stage] = tracemalloc.get_traced_memory()[1] - before
+            else:
+                start = time.perf_counter()
+                run()
+                results[stage] = time.perf_counter() - start
+    finally:
+        if memory:
+            tracemalloc.stop()
+    file_size = os.path.getsize(output_file)
+    os.remove(output_file)
+    return results, len(state["rows"]), file_size
+
+
+def benchmark(sizes=DEFAULT_SIZES, backend="auto", memory=True, bulk=True):
+    """Benchmark every size and return the results document (see main())."""
+    if backend == "auto":
+        backend = "docx" if docx_available() else "stdlib"
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": backend,
+        # Row mode of the python-docx builder; the stdlib writer has only one
+        "bulk": bulk if backend == "docx" else None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": list(STAGES),
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as output_dir:
+        for size in sizes:
+            seconds, rows, file_size = run_stages(size, backend, output_dir, bulk=bulk)
+            peaks = run_stages(size, backend, output_dir, memory=True, bulk=bulk)[0] if memory else {}
+            result = {
+                "verbs": size,
+                "rows": rows,
+                "file_bytes": file_size,
+                "total_seconds": sum(seconds.values()),
+                "stages": {stage: {"seconds": seconds[stage], "peak_bytes": peaks.get(stage)}
+                           for stage in STAGES},
+            }
+            report["results"].append(result)
+            print_result(result)
+    return report
+
+
+def print_result(result, baseline=None):
+    """Print one size's stage times and peaks, with ratios to a baseline result if given."""
+    print(f"{result['verbs']:,} verbs -> {result['rows']:,} rows, "
+          f"{result['file_bytes'] / 2**20:.2f} MiB .docx, {result['total_seconds']:.3f}s total")
+    for stage in STAGES:
+        stats = result["stages"][stage]
+        line = f"  {stage:<10} {stats['seconds']:10.4f}s"
+        if stats["peak_bytes"] is not None:
+            line += f"  peak {stats['peak_bytes'] / 2**20:9.2f} MiB"
+        if baseline:
+            old = baseline["stages"][stage]["seconds"]
+            if old:
+                line += f"  {stats['seconds'] / old:6.2f}x baseline"
+        print(line)
+
+
+def _mode(report):
+    """Backend and row mode of a results file, e.g. "docx, bulk"."""
+    # Files written before the mode was recorded always used bulk python-docx
+    bulk = report.get("bulk", True if report["backend"] == "docx" else None)
+    if bulk is None:
+        return report["backend"]
+    return f"{report['backend']}, {'bulk' if bulk else 'per-row'}"
+
+
+def compare(report, baseline):
+    """
+    Print the stage times of report against an earlier results file.
+    Returns False, comparing nothing, if the baseline used another
+    backend or row mode; sizes whose row counts differ are skipped.
+    """
+    if _mode(report) != _mode(baseline):
+        print(f"Baseline from {baseline['timestamp']} used {_mode(baseline)}, not {_mode(report)}: "
+              "not comparing")
+        return False
+    old_results = {result["verbs"]: result for result in baseline["results"]}
+    print(f"Compared with baseline from {baseline['timestamp']} ({_mode(baseline)}):")
+    for result in report["results"]:
+        old = old_results.get(result["verbs"])
+        if old is None:
+            continue
+        if old["rows"] != result["rows"]:
+            print(f"{result['verbs']:,} verbs: baseline had {old['rows']:,} rows, "
+                  f"now {result['rows']:,}; skipped (different corpus)")
+            continue
+        print_result(result, old)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each stage of the verb document pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), metavar="N",
+                        help="corpus sizes in verbs (default: %(default)s)")
+    parser.add_argument("--backend", choices=("auto", "docx", "stdlib"), default="auto",
+                        help="renderer to benchmark (default: docx if installed)")
+    parser.add_argument("--per-row", action="store_true",
+                        help="python-docx backend: add rows one at a time instead of in bulk")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass (halves the run time)")
+    parser.add_argument("-o", "--output", default="benchmark_results.json",
+                        help="JSON results file (default: %(default)s)")
+    parser.add_argument("--baseline", metavar="JSON", help="earlier results file to compare with")
+    args = parser.parse_args(argv)
+
+    report = benchmark(args.sizes, args.backend, memory=not args.no_memory, bulk=not args.per_row)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            if not compare(report, json.load(f)):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,483 @@
+"""
+Rebuild manifests for the verb document builders.
+
+A cached save writes two files next to the document:
+
+    <output>.manifest.json       hashes of the options and of every
+                                 section of rows (a section is a run of
+                                 rows whose base forms share a first
+                                 character), and the SHA-256 and size of
+                                 the document it wrote
+    <output>.sections.gz         the rendered row XML of every section
+
+A later save skips the rebuild only if the hashes match and the file on
+disk is still that document, so a document overwritten by anything else
+(another backend, a chunked or uncached save) is always rebuilt. When
+only some sections changed, only their rows are rendered again: the XML
+of the others is read back from the sections file, and the document is
+reassembled and zipped from it. Saves that bypass the manifest delete
+both files.
+
+Rows that can be read twice (a list, a VerbStore, a verb_sources.VerbFile)
+are hashed before anything is rendered, so a re-run with nothing changed
+renders and writes nothing. Rows from a one-shot iterator such as
+read_verbs() can only be hashed while the document is written; it goes to
+a temporary file that is dropped if nothing changed.
+
+CachedDocumentBuilder implements this for both backends: the
+python-docx builder (verb_tables.VerbDocumentBuilder) and the stdlib
+one (verb_docx_writer.StdlibDocumentBuilder) only render and write.
+"""
+
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+from xml.sax.saxutils import escape
+
+from verb_profile import staged_rows
+from verb_sources import DEFAULT_MEMORY_LIMIT, row_size
+
+# Written next to each output file
+MANIFEST_SUFFIX = ".manifest.json"
+SECTIONS_SUFFIX = ".sections.gz"
+
+# Bump when the rendered XML or the manifest changes so old manifests are ignored
+CACHE_FORMAT = 5
+
+# The sections file is rewritten on every rebuild: favour speed over size
+SECTIONS_COMPRESSLEVEL = 1
+
+
+def manifest_path(output_file):
+    return output_file + MANIFEST_SUFFIX
+
+
+def sections_path(output_file):
+    return output_file + SECTIONS_SUFFIX
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def output_record(output_file):
+    """{"size", "sha256"} of a written output file, for the manifest."""
+    return {"size": os.path.getsize(output_file), "sha256": file_digest(output_file)}
+
+
+def output_matches(output_file, record):
+    """True if output_file exists and is the file described by an output_record()."""
+    if not record or not os.path.exists(output_file):
+        return False
+    # Size first: a different file is almost always a different size
+    return os.path.getsize(output_file) == record["size"] and file_digest(output_file) == record["sha256"]
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def remove_manifest(output_file):
+    """Delete output_file's manifest and sections file after a save that did not go through them."""
+    if isinstance(output_file, (str, os.PathLike)):
+        output_file = os.fspath(output_file)
+        _remove(manifest_path(output_file))
+        _remove(sections_path(output_file))
+
+
+def rereadable(verbs):
+    """True if iterating verbs again starts over (a list or VerbFile, not a generator)."""
+    return iter(verbs) is not verbs
+
+
+def _section_key(row):
+    return row[0][:1]
+
+
+def _row_bytes(row):
+    # Forms never hold control characters, so these separators are unambiguous
+    return ("\x00".join(row) + "\x01").encode("utf-8")
+
+
+def section_hashes(rows):
+    """[{"key", "hash", "rows"}] for each run of rows whose base forms share a first character."""
+    sections = []
+    for key, section_rows in itertools.groupby(rows, key=_section_key):
+        digest = hashlib.sha256()
+        count = 0
+        for row in section_rows:
+            digest.update(_row_bytes(row))
+            count += 1
+        sections.append({"key": key, "hash": digest.hexdigest(), "rows": count})
+    return sections
+
+
+def hash_pass(rows, memory_limit, tmp_dir=None):
+    """
+    (section_hashes(rows), the same rows again for rendering). The rows
+    are kept in a list while they fit in about memory_limit bytes, and
+    from then on in a temporary JSONL file, so they are never sorted
+    twice. Call discard() on the second item if it is not read.
+    """
+    kept = []
+    size = 0
+    spill = None
+
+    def keep():
+        nonlocal kept, size, spill
+        for row in rows:
+            if spill is None:
+                size += row_size(row)
+                if size <= memory_limit:
+                    kept.append(row)
+                    yield row
+                    continue
+                spill = tempfile.TemporaryFile("w+", encoding="utf-8", dir=tmp_dir)
+                for old in kept:
+                    spill.write(json.dumps(old) + "\n")
+                kept = None
+            spill.write(json.dumps(row) + "\n")
+            yield row
+
+    sections = section_hashes(keep())
+    if spill is None:
+        return sections, kept
+    spill.seek(0)
+    return sections, _SpilledRows(spill)
+
+
+class _SpilledRows:
+    """Rows replayed once from a hash_pass() temporary file, which is then closed."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def __iter__(self):
+        with self._f:
+            for line in self._f:
+                yield tuple(json.loads(line))
+
+    def discard(self):
+        self._f.close()
+
+
+class SectionRenderer:
+    """
+    The row_xml of a builder's _write(). Called as row_xml(template, rows)
+    with the rows in document order (all at once or chunk by chunk), it
+    yields their XML, rendered with a row_template(): one piece per row,
+    or one piece for a run of rows read back from the sections file.
+
+    With expected (section_hashes() of the same rows), a section whose
+    hash is in reusable is not rendered: its rows are skipped and its XML
+    is read back from old_file, which is read front to back as sections
+    come (unchanged sections keep their order), so at most one section is
+    held in memory. Without expected, the rows are hashed as they are
+    rendered, into sections. Either way every section's XML is written to
+    new_file; close() finishes it.
+
+    The sections file is gzipped: the options hash on the first line,
+    then per section a "<hash> <byte count>" line and the section's XML.
+    """
+
+    def __init__(self, options_hash, new_file, old_file=None, expected=None, reusable=()):
+        self.options_hash = options_hash
+        self.new_file = new_file
+        self.sections = [] if expected is None else expected
+        self.reused = 0
+        self.used = False
+        self._expected = expected
+        self._reusable = set(reusable)
+        self._old = self._open_old(old_file) if old_file and self._reusable else None
+        self._new = gzip.open(new_file, "wb", compresslevel=SECTIONS_COMPRESSLEVEL)
+        self._new.write(options_hash.encode("ascii") + b"\n")
+        # Current section: position in expected, rows still to come, XML read back or rendered
+        self._index = -1
+        self._left = 0
+        self._cached = None
+        self._cached_rows = None
+        self._offset = 0
+        self._pieces = []
+        # Without expected: key and running hash of the current section
+        self._key = self._digest = None
+
+    def _open_old(self, old_file):
+        """The old sections file after its header, or None if missing or written with other options."""
+        try:
+            f = gzip.open(old_file, "rb")
+        except FileNotFoundError:
+            return None
+        if f.readline().rstrip(b"\n").decode("ascii", "replace") != self.options_hash:
+            f.close()
+            return None
+        return f
+
+    def _read_back(self, section_hash):
+        """The XML of a section in the old sections file, or None."""
+        while self._old is not None:
+            header = self._old.readline().split()
+            if len(header) != 2:
+                self._old.close()
+                self._old = None
+                break
+            data = self._old.read(int(header[1]))
+            if header[0].decode("ascii") == section_hash:
+                return data.decode("utf-8")
+        return None
+
+    def _write_section(self, section_hash, xml):
+        data = xml.encode("utf-8")
+        self._new.write(f"{section_hash} {len(data)}\n".encode("ascii"))
+        self._new.write(data)
+
+    def __call__(self, template, rows):
+        self.used = True
+        if self._expected is None:
+            yield from self._render_hashing(template, rows)
+            return
+        rows = iter(rows)
+        while True:
+            if self._left == 0:
+                row = next(rows, None)
+                if row is None:
+                    return
+                self._next_section()
+                rows = itertools.chain((row,), rows)
+            wanted = self._left
+            if self._cached is not None:
+                taken = len(list(itertools.islice(rows, wanted)))
+                if taken:
+                    yield self._cached_slice(taken)
+            else:
+                taken = 0
+                for row in itertools.islice(rows, wanted):
+                    piece = template.format(*(escape(text) for text in row))
+                    self._pieces.append(piece)
+                    taken += 1
+                    yield piece
+            self._left -= taken
+            if taken < wanted:
+                return  # This call's rows ended inside the section
+
+    def _next_section(self):
+        self._finish()
+        self._index += 1
+        if self._index >= len(self._expected):
+            raise RuntimeError("more rows to render than were hashed")
+        section = self._expected[self._index]
+        self._left = section["rows"]
+        self._cached = self._read_back(section["hash"]) if section["hash"] in self._reusable else None
+        self._cached_rows = None
+        self._offset = 0
+        self._pieces = []
+
+    def _cached_slice(self, count):
+        """XML of the next count rows of the section being read back."""
+        if self._offset == 0 and count == self._expected[self._index]["rows"]:
+            self._offset = count
+            return self._cached
+        if self._cached_rows is None:
+            # Every row ends with </w:tr>, which escaped text cannot contain
+            self._cached_rows = [row + "</w:tr>" for row in self._cached.split("</w:tr>")[:-1]]
+        start, self._offset = self._offset, self._offset + count
+        return "".join(self._cached_rows[start:self._offset])
+
+    def _finish(self):
+        if self._index < 0 or self._index >= len(self._expected):
+            return
+        if self._left:
+            raise RuntimeError("fewer rows to render than were hashed")
+        if self._cached is not None:
+            self.reused += 1
+            xml = self._cached
+        else:
+            xml = "".join(self._pieces)
+        self._write_section(self._expected[self._index]["hash"], xml)
+        self._cached = self._cached_rows = None
+        self._pieces = []
+
+    def _render_hashing(self, template, rows):
+        for row in rows:
+            if self._digest is None or _section_key(row) != self._key:
+                self._finish_hashed()
+                self._key = _section_key(row)
+                self._digest = hashlib.sha256()
+            self._digest.update(_row_bytes(row))
+            piece = template.format(*(escape(text) for text in row))
+            self._pieces.append(piece)
+            yield piece
+
+    def _finish_hashed(self):
+        if self._digest is None:
+            return
+        section = {"key": self._key, "hash": self._digest.hexdigest(), "rows": len(self._pieces)}
+        self.sections.append(section)
+        self._write_section(section["hash"], "".join(self._pieces))
+        self._digest = None
+        self._pieces = []
+
+    def close(self):
+        """Finish the last section and close both sections files."""
+        try:
+            if self._expected is None:
+                self._finish_hashed()
+            elif self.used:
+                self._finish()
+                if self._index != len(self._expected) - 1:
+                    raise RuntimeError("fewer rows to render than were hashed")
+        finally:
+            self._new.close()
+            if self._old is not None:
+                self._old.close()
+
+
+class CachedDocumentBuilder:
+    """
+    Base class of the document builders: save() with an optional rebuild
+    cache (cache=True; force=True ignores existing manifests).
+
+    Subclasses set backend and implement _options(), the builder settings
+    that change the output, and _write(sheet, rows, output_file, row_xml)
+    -> (count, per-chunk report or None), rendering and saving under their
+    own stage() blocks. row_xml is None or a SectionRenderer; builders that
+    render rows as XML text get it through row_xml(template, rows), which
+    is what lets unchanged sections be reused. With streaming=True, the
+    rows are never held in memory: they are read twice if they can be,
+    else hashed while written (see the module docstring).
+    """
+
+    backend = None
+    streaming = False
+
+    def __init__(self, memory_limit=DEFAULT_MEMORY_LIMIT, cache=False, force=False, chunk=None):
+        self.memory_limit = memory_limit
+        self.cache = cache
+        self.force = force
+        self.chunk = chunk
+        self.last_report = None
+
+    def _write(self, sheet, rows, output_file, row_xml=None):
+        raise NotImplementedError
+
+    def _options(self):
+        return []
+
+    def save(self, sheet, output_file=None):
+        """Build and save a sheet. Returns (output_file, number of verbs)."""
+        output_file = output_file or sheet.output_file
+        if self.cache and isinstance(output_file, (str, os.PathLike)):
+            return self._save_cached(sheet, os.fspath(output_file))
+
+        count, chunks = self._write(sheet, staged_rows(sheet, self.memory_limit), output_file)
+        # The manifest no longer describes this file
+        remove_manifest(output_file)
+        self.last_report = {"skipped": False, "changed": None, "unchanged": 0, "reused": 0,
+                            "chunks": chunks}
+        return output_file, count
+
+    def _options_hash(self, sheet):
+        """Hash of everything besides the verbs that changes the output."""
+        options = [CACHE_FORMAT, self.backend, sheet.title, sheet.subtitle, list(sheet.headers),
+                   sheet.collation, list(sheet.sort_columns), sheet.locale_name, self.chunk]
+        options += self._options()
+        return hashlib.sha256(json.dumps(options).encode("utf-8")).hexdigest()
+
+    def _read_manifest(self, manifest_file, options_hash):
+        """The manifest if it exists, is not forced away and matches options_hash, else None."""
+        if self.force or not os.path.exists(manifest_file):
+            return None
+        with open(manifest_file, encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("options") == options_hash else None
+
+    def _save_cached(self, sheet, output_file):
+        """
+        save() with the rebuild cache. If nothing changed and the file on
+        disk is still the one the manifest describes, nothing is rendered
+        or written (for one-shot rows: nothing is kept). Otherwise the
+        document is written with the XML of unchanged sections read back
+        from the sections file; the report counts the sections that
+        changed and those whose XML was reused.
+        """
+        manifest_file = manifest_path(output_file)
+        sections_file = sections_path(output_file)
+        options_hash = self._options_hash(sheet)
+        manifest = self._read_manifest(manifest_file, options_hash)
+        old_sections = {section["hash"] for section in manifest["sections"]} if manifest else set()
+
+        rows = staged_rows(sheet, self.memory_limit)
+        expected = None
+        if not self.streaming:
+            rows = list(rows)
+            expected = section_hashes(rows)
+        elif rereadable(sheet.verbs):
+            # Hash first, so an unchanged document is neither rendered nor written
+            expected, rows = hash_pass(rows, self.memory_limit)
+        if expected is not None and self._up_to_date(manifest, options_hash, expected, output_file):
+            if isinstance(rows, _SpilledRows):
+                rows.discard()
+            self.last_report = {"skipped": True, "changed": 0, "unchanged": len(expected),
+                                "reused": 0, "chunks": None}
+            return output_file, sum(section["rows"] for section in expected)
+
+        # Both files are written beside the old ones and replace them only if the document changed
+        partial_file = output_file + ".partial"
+        renderer = SectionRenderer(options_hash, sections_file + ".partial", sections_file,
+                                   expected, old_sections if expected is not None else ())
+        try:
+            try:
+                count, chunks = self._write(sheet, rows, partial_file, renderer)
+            finally:
+                renderer.close()
+            sections = expected if expected is not None else renderer.sections
+            skipped = expected is None and self._up_to_date(manifest, options_hash, sections, output_file)
+            if skipped:
+                os.remove(partial_file)
+                os.remove(renderer.new_file)
+            else:
+                os.replace(partial_file, output_file)
+                if renderer.used:
+                    os.replace(renderer.new_file, sections_file)
+                else:
+                    # The builder rendered no XML text (python-docx per-row mode)
+                    os.remove(renderer.new_file)
+                    _remove(sections_file)
+        except BaseException:
+            _remove(partial_file)
+            _remove(renderer.new_file)
+            raise
+
+        changed = sum(1 for section in sections if section["hash"] not in old_sections)
+        self.last_report = {"skipped": skipped, "changed": changed, "unchanged": len(sections) - changed,
+                            "reused": 0 if skipped else renderer.reused,
+                            "chunks": None if skipped else chunks}
+        if not skipped:
+            manifest = {"options": options_hash, "hash": self._document_hash(options_hash, sections),
+                        "output": output_record(output_file), "sections": sections}
+            with open(manifest_file + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(manifest_file + ".tmp", manifest_file)
+        return output_file, count
+
+    @staticmethod
+    def _document_hash(options_hash, sections):
+        return hashlib.sha256(
+            (options_hash + "".join(section["hash"] for section in sections)).encode("utf-8")
+        ).hexdigest()
+
+    def _up_to_date(self, manifest, options_hash, sections, output_file):
+        """True if the manifest matches these sections and the file it describes is still there."""
+        return (manifest is not None
+                and manifest["hash"] == self._document_hash(options_hash, sections)
+                and output_matches(output_file, manifest.get("output")))
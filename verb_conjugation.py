@@ -0,0 +1,152 @@
+"""
+Rule-based conjugation of regular English verbs.
+
+Most transitive verbs are regular, so their past and past participle can
+be generated from the base form instead of being stored:
+
+    accept  -> accepted      (add -ed)
+    agree   -> agreed        (ends in -e: add -d)
+    study   -> studied       (consonant + y: -y -> -ied)
+    play    -> played        (vowel + y: add -ed)
+    ban     -> banned        (one syllable, consonant-vowel-consonant: double)
+    admit   -> admitted      (stressed final syllable: double)
+    panic   -> panicked      (ends in -c: add -ked)
+
+create_transitive_verbs.py stores only the base form of verbs these rules
+handle and the full (present, past, past_participle) tuple of the rest.
+
+Usage:
+    python verb_conjugation.py accept ban study  # print generated forms
+    python verb_conjugation.py --validate        # prove the stored table is reproduced
+"""
+
+import argparse
+import hashlib
+import re
+
+from verb_sources import unique_sorted
+
+VOWELS = "aeiou"
+
+# Endings of multi-syllable verbs stressed on the last syllable, which
+# double their final consonant like one-syllable verbs (admit -> admitted)
+STRESSED_ENDINGS = (
+    "dmit", "mmit", "rmit", "bmit", "smit", "omit", "emit",
+    "cur", "pel", "trol", "gret", "efer", "nfer", "sfer", "bed", "quip", "gram",
+)
+
+
+def syllable_count(word):
+    """Rough syllable count: groups of vowels, ignoring a silent final -e."""
+    return len(re.findall(r"[aeiouy]+", word[:-1] if word.endswith("e") else word))
+
+
+def doubles_final_consonant(base):
+    """True if the base ends consonant-vowel-consonant and doubles it before -ed."""
+    if len(base) < 3:
+        return False
+    before, vowel, last = base[-3:]
+    if base[-4:-2] == "qu":
+        # The u of "qu" is part of the consonant sound (equip -> equipped)
+        before = "q"
+    if before in VOWELS or vowel not in VOWELS or last in VOWELS + "wxy":
+        return False
+    return syllable_count(base) == 1 or base.endswith(STRESSED_ENDINGS)
+
+
+def regular_past(base):
+    """Past tense (and past participle) of a regular verb."""
+    if base.endswith("e"):
+        return base + "d"
+    if base.endswith("y") and len(base) > 1 and base[-2] not in VOWELS:
+        return base[:-1] + "ied"
+    if base.endswith("c"):
+        return base + "ked"
+    if doubles_final_consonant(base):
+        return base + base[-1] + "ed"
+    return base + "ed"
+
+
+def regular_forms(base):
+    """(present, past, past_participle) for a regular verb."""
+    past = regular_past(base)
+    return (base, past, past)
+
+
+def is_regular(verb):
+    """True if a (present, past, past_participle) tuple follows the rules."""
+    return verb == regular_forms(verb[0])
+
+
+def split_regular(verbs):
+    """
+    Split verb tuples into (regular base forms, exception tuples), the
+    compact form stored in the data modules.
+    """
+    regular = []
+    exceptions = []
+    for verb in verbs:
+        if is_regular(verb):
+            regular.append(verb[0])
+        else:
+            exceptions.append(tuple(verb))
+    return regular, exceptions
+
+
+def conjugate(regular, exceptions=()):
+    """Yield full verb tuples: generated ones for regular bases, then the exceptions."""
+    for base in regular:
+        yield regular_forms(base)
+    yield from exceptions
+
+
+def table_digest(verbs):
+    """SHA-256 of the deduped, sorted table the documents are built from."""
+    digest = hashlib.sha256()
+    for row in unique_sorted(verbs):
+        digest.update(("\t".join(row) + "\n").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def validate():
+    """
+    Check that the compact transitive verb data reproduces the original
+    table exactly, and that no exception could have been generated.
+    Returns True if everything checks out.
+    """
+    import create_transitive_verbs as data
+
+    ok = True
+    digest = table_digest(data.transitive_verbs())
+    if digest == data.TRANSITIVE_TABLE_SHA256:
+        print(f"Table reproduced exactly (sha256 {digest[:16]}...)")
+    else:
+        print(f"Table differs: sha256 {digest} != {data.TRANSITIVE_TABLE_SHA256}")
+        ok = False
+
+    redundant = [verb for verb in data.transitive_verb_exceptions if is_regular(verb)]
+    for verb in redundant:
+        print(f"Exception follows the rules, store only the base form: {verb}")
+    ok = ok and not redundant
+
+    print(f"{len(data.regular_transitive_verbs)} regular verbs generated, "
+          f"{len(data.transitive_verb_exceptions)} exceptions stored")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conjugate regular verbs.")
+    parser.add_argument("verbs", nargs="*", help="base forms to conjugate")
+    parser.add_argument("--validate", action="store_true",
+                        help="check the compact transitive verb data against the original table")
+    args = parser.parse_args(argv)
+
+    if args.validate:
+        return 0 if validate() else 1
+    for base in args.verbs:
+        print(" | ".join(regular_forms(base)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,342 @@
+"""
+Pure-stdlib .docx writer for the verb tables.
+
+Used when python-docx is not installed (or when asked for with
+--backend stdlib). A .docx file is a zip of WordprocessingML parts, so
+this module writes the few parts Word needs with zipfile, from
+pre-templated XML. The document body has the same shape as the one the
+python-docx builder produces: centered Title heading, bold subtitle,
+empty paragraph, then a "Light Grid Accent 1" table whose header and
+body cells use the "Verb Header" and "Verb Cell" paragraph styles.
+
+word/document.xml is streamed into its zip entry row by row, so no
+document tree or full XML string is ever held in memory; together with
+the bounded-memory verb_sources.unique_sorted(), a table with millions of
+rows is written in constant memory.
+
+With chunk set (see verb_sources.chunked()), the rows are split into one
+table per letter or per N rows instead, each on a new page section under
+its own heading, with the header row repeated at the top of every page.
+Word lays out many small tables far faster than one huge one.
+
+Usage:
+    python verb_docx_writer.py --compare a.docx b.docx  # same body structure?
+    python verb_docx_writer.py --stress 1000000 big.docx
+    python verb_docx_writer.py --sizes a.docx b.docx    # part sizes, e.g. before/after
+"""
+
+import argparse
+import os
+import re
+import time
+import tracemalloc
+import zipfile
+from xml.sax.saxutils import escape
+
+from verb_cache import CachedDocumentBuilder
+from verb_profile import stage
+from verb_sources import chunked
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Text width of a Letter page with the python-docx default template margins
+TEXT_WIDTH = 8640
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_BORDER = '<w:{0} w:val="single" w:sz="{1}" w:space="0" w:color="4F81BD"/>'
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:styles xmlns:w="{W_NS}">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Cambria" w:hAnsi="Cambria" w:eastAsia="Cambria" w:cs="Times New Roman"/>'
+    '<w:sz w:val="24"/><w:szCs w:val="24"/><w:lang w:val="en-US"/>'
+    '</w:rPr></w:rPrDefault><w:pPrDefault/></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:pBdr><w:bottom w:val="single" w:sz="8" w:space="4" w:color="4F81BD"/></w:pBdr>'
+    '<w:spacing w:after="300" w:line="240" w:lineRule="auto"/><w:contextualSpacing/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:color w:val="17365D"/>'
+    '<w:spacing w:val="5"/><w:kern w:val="28"/><w:sz w:val="52"/><w:szCs w:val="52"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="480" w:after="0"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b/><w:bCs/><w:color w:val="365F91"/>'
+    '<w:sz w:val="28"/><w:szCs w:val="28"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:customStyle="1" w:styleId="VerbCell"><w:name w:val="Verb Cell"/>'
+    '<w:basedOn w:val="Normal"/><w:pPr><w:jc w:val="center"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:customStyle="1" w:styleId="VerbHeader"><w:name w:val="Verb Header"/>'
+    '<w:basedOn w:val="VerbCell"/><w:rPr><w:b/></w:rPr></w:style>'
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal"><w:name w:val="Normal Table"/>'
+    '<w:tblPr><w:tblInd w:w="0" w:type="dxa"/><w:tblCellMar><w:top w:w="0" w:type="dxa"/>'
+    '<w:left w:w="108" w:type="dxa"/><w:bottom w:w="0" w:type="dxa"/><w:right w:w="108" w:type="dxa"/>'
+    '</w:tblCellMar></w:tblPr></w:style>'
+    '<w:style w:type="table" w:styleId="LightGrid-Accent1"><w:name w:val="Light Grid Accent 1"/>'
+    '<w:basedOn w:val="TableNormal"/><w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>'
+    '<w:tblPr><w:tblStyleRowBandSize w:val="1"/><w:tblStyleColBandSize w:val="1"/><w:tblBorders>'
+    + "".join(_BORDER.format(side, 8) for side in ("top", "left", "bottom", "right", "insideH", "insideV"))
+    + '</w:tblBorders></w:tblPr>'
+    '<w:tblStylePr w:type="firstRow"><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b/><w:bCs/></w:rPr>'
+    '<w:tcPr><w:tcBorders>' + _BORDER.format("bottom", 18) + '</w:tcBorders></w:tcPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="firstCol"><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b/><w:bCs/></w:rPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="band1Horz"><w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="D3DFEE"/></w:tcPr></w:tblStylePr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:document xmlns:w="{W_NS}"><w:body>'
+)
+
+SECTION_PROPERTIES = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1800" w:bottom="1440" w:left="1800" w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/><w:docGrid w:linePitch="360"/></w:sectPr>'
+)
+
+DOCUMENT_END = SECTION_PROPERTIES + '</w:body></w:document>'
+
+# Ends the current section; the next one starts on a new page
+SECTION_BREAK = '<w:p><w:pPr>' + SECTION_PROPERTIES + '</w:pPr></w:p>'
+
+CHUNK_HEADING_TEMPLATE = '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>{label}</w:t></w:r></w:p>'
+
+HEADING_TEMPLATE = (
+    '<w:p><w:pPr><w:pStyle w:val="Title"/><w:jc w:val="center"/></w:pPr><w:r><w:t>{title}</w:t></w:r></w:p>'
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:rPr><w:b/><w:sz w:val="24"/></w:rPr>'
+    '<w:t>{subtitle}</w:t></w:r></w:p>'
+    '<w:p/>'
+)
+
+TABLE_START_TEMPLATE = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="LightGrid-Accent1"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLayout w:type="fixed"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '</w:tblPr><w:tblGrid>{grid}</w:tblGrid>'
+)
+
+TABLE_END = '</w:tbl>'
+
+# Paragraph style ids in STYLES_XML, referenced by every table cell
+CELL_STYLE_ID = "VerbCell"
+HEADER_STYLE_ID = "VerbHeader"
+
+
+def row_template(columns, style=CELL_STYLE_ID, repeat=False):
+    """
+    Return a str.format() template for one <w:tr> with the given column
+    count, whose cells use the paragraph style with id style; with
+    repeat, the row is repeated at the top of every page.
+    """
+    row_properties = '<w:trPr><w:tblHeader/></w:trPr>' if repeat else ''
+    cell = f'<w:tc><w:p><w:pPr><w:pStyle w:val="{style}"/></w:pPr><w:r><w:t>{{}}</w:t></w:r></w:p></w:tc>'
+    return "<w:tr>" + row_properties + cell * columns + "</w:tr>"
+
+
+# Rows rendered per write to the zip entry
+WRITE_BATCH = 1000
+
+
+def _write_rows(f, verb_row, rows, row_xml=None):
+    """
+    Render rows into f in batches of WRITE_BATCH, or take their XML from
+    row_xml(verb_row, rows) if given (one piece may hold several rows).
+    Returns (rows, bytes) written.
+    """
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    if row_xml is None:
+        pieces = (verb_row.format(*(escape(text) for text in row)) for row in counted())
+    else:
+        pieces = row_xml(verb_row, counted())
+    size = 0
+    batch = []
+    for piece in pieces:
+        batch.append(piece)
+        if len(batch) == WRITE_BATCH:
+            data = "".join(batch).encode("utf-8")
+            f.write(data)
+            size += len(data)
+            batch = []
+    data = "".join(batch).encode("utf-8")
+    f.write(data)
+    return count, size + len(data)
+
+
+def write_docx(output_file, title, subtitle, headers, rows, chunk=None, report=None, row_xml=None):
+    """
+    Write a verb table .docx with zipfile only, streaming the rows into
+    word/document.xml. Returns the number of verb rows.
+
+    With chunk, one table is written per chunk (see verb_sources.chunked())
+    and, if report is a list, one {"label", "rows", "bytes", "seconds"}
+    dict per chunk is appended to it. row_xml, if given, supplies the row
+    XML (see verb_cache.SectionRenderer).
+    """
+    columns = len(headers)
+    verb_row = row_template(columns)
+    table_start = TABLE_START_TEMPLATE.format(grid=f'<w:gridCol w:w="{TEXT_WIDTH // columns}"/>' * columns)
+    header_cells = [escape(text) for text in headers]
+    count = 0
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", ROOT_RELS_XML)
+        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_XML)
+        zf.writestr("word/styles.xml", STYLES_XML)
+
+        with zf.open("word/document.xml", "w", force_zip64=True) as f:
+            f.write((
+                DOCUMENT_START
+                + HEADING_TEMPLATE.format(title=escape(title), subtitle=escape(subtitle))
+            ).encode("utf-8"))
+
+            if chunk is None:
+                f.write((table_start + row_template(columns, HEADER_STYLE_ID).format(*header_cells)).encode("utf-8"))
+                count = _write_rows(f, verb_row, rows, row_xml)[0]
+                f.write(TABLE_END.encode("utf-8"))
+            else:
+                header_row = row_template(columns, HEADER_STYLE_ID, repeat=True).format(*header_cells)
+                for index, (label, chunk_rows) in enumerate(chunked(rows, chunk)):
+                    start = time.perf_counter()
+                    head = ((SECTION_BREAK if index else "")
+                            + CHUNK_HEADING_TEMPLATE.format(label=escape(label))
+                            + table_start + header_row).encode("utf-8")
+                    f.write(head)
+                    rows_written, size = _write_rows(f, verb_row, chunk_rows, row_xml)
+                    f.write(TABLE_END.encode("utf-8"))
+                    count += rows_written
+                    if report is not None:
+                        report.append({"label": label, "rows": rows_written,
+                                       "bytes": len(head) + size + len(TABLE_END),
+                                       "seconds": time.perf_counter() - start})
+
+            f.write(DOCUMENT_END.encode("utf-8"))
+    return count
+
+
+def body_structure(docx_file):
+    """
+    Return the <w:body> XML of a .docx with rsid attributes removed, so
+    documents from either backend can be compared directly.
+    """
+    with zipfile.ZipFile(docx_file) as zf:
+        xml = zf.read("word/document.xml").decode("utf-8")
+    body = xml[xml.index("<w:body>"):xml.index("</w:body>") + len("</w:body>")]
+    return re.sub(r' w:rsid\w*="[^"]*"', "", body)
+
+
+class StdlibDocumentBuilder(CachedDocumentBuilder):
+    """
+    Renders VerbSheets without python-docx.
+
+    Shares save(), the rebuild cache and last_report with
+    verb_tables.VerbDocumentBuilder (see verb_cache.CachedDocumentBuilder),
+    so the CLI and batch mode can use either builder. Cached saves stream
+    too: the rows are hashed in a pass of their own when they can be read
+    twice, else as they are written.
+    """
+
+    backend = "stdlib"
+    streaming = True
+
+    def _write(self, sheet, rows, output_file, row_xml=None):
+        chunks = [] if self.chunk else None
+        # Rows are rendered straight into the file, so this stage includes the save
+        with stage("render", sheet):
+            count = write_docx(output_file, sheet.title, sheet.subtitle, sheet.headers, rows,
+                               self.chunk, chunks, row_xml)
+        return count, chunks
+
+
+def part_sizes(docx_file):
+    """Return {part name: uncompressed bytes} for the parts of a .docx, plus "(file)"."""
+    with zipfile.ZipFile(docx_file) as zf:
+        sizes = {info.filename: info.file_size for info in zf.infolist()}
+    sizes["(file)"] = os.path.getsize(docx_file)
+    return sizes
+
+
+def print_sizes(docx_files):
+    """Print document.xml, styles.xml and file sizes side by side."""
+    parts = ("word/document.xml", "word/styles.xml", "(file)")
+    sizes = [part_sizes(docx_file) for docx_file in docx_files]
+    for docx_file, file_sizes in zip(docx_files, sizes):
+        print(docx_file)
+        for part in parts:
+            line = f"  {part:<20} {file_sizes.get(part, 0):12,} bytes"
+            if file_sizes is not sizes[0] and sizes[0].get(part):
+                line += f"  ({file_sizes.get(part, 0) / sizes[0][part] - 1:+.1%} vs {docx_files[0]})"
+            print(line)
+
+
+def stress(row_count, output_file):
+    """Write a synthetic table and print rows/second and peak traced memory."""
+    rows = ((f"verb{i}", f"verb{i}ed", f"verb{i}ed") for i in range(row_count))
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = write_docx(output_file, "Stress Test", "Present | Past | Past Participle",
+                       ("Present", "Past", "Past Participle"), rows)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"Wrote {count:,} rows to {output_file} in {elapsed:.2f}s "
+          f"({count / elapsed:,.0f} rows/s), peak memory {peak / 2**20:.2f} MiB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stdlib .docx writer utilities.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--compare", nargs=2, metavar=("A", "B"),
+                       help="check that two .docx files have the same body structure")
+    group.add_argument("--sizes", nargs="+", metavar="DOCX",
+                       help="print part sizes, relative to the first file")
+    group.add_argument("--stress", type=int, metavar="ROWS",
+                       help="write ROWS synthetic rows and report speed and peak memory")
+    parser.add_argument("output", nargs="?", default="stress.docx",
+                        help="output file for --stress (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        same = body_structure(args.compare[0]) == body_structure(args.compare[1])
+        print("Same body structure" if same else "Body structure differs")
+        return 0 if same else 1
+    if args.sizes:
+        print_sizes(args.sizes)
+        return 0
+    stress(args.stress, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,258 @@
+"""
+Export verb lists to CSV, TSV, Markdown, HTML, XLSX and JSON.
+
+All exporters are fed from one deduped/sorted verb stream: each row is
+read once and handed to every requested exporter, so one run writes
+every format without re-reading or re-sorting the source. Exporters
+write as they go and keep no rows in memory.
+
+New formats are added by subclassing Exporter and registering the class
+in EXPORTERS.
+
+Usage:
+    python verb_exporters.py irregular --formats csv md html xlsx json
+    python verb_exporters.py --source verbs.jsonl.gz --formats csv json -o out/
+"""
+
+import argparse
+import csv
+import json
+import os
+import zipfile
+from html import escape as html_escape
+from xml.sax.saxutils import escape as xml_escape
+
+from verb_sources import DEFAULT_MEMORY_LIMIT, unique_sorted
+from verb_tables import SHEETS, load_sheet, source_sheet
+
+
+class Exporter:
+    """Base class: open the output, write rows one by one, then close."""
+
+    extension = None
+
+    def __init__(self, output_file, title, headers):
+        self.output_file = output_file
+        self.title = title
+        self.headers = headers
+
+    def write_row(self, row):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+
+class CsvExporter(Exporter):
+    extension = ".csv"
+    delimiter = ","
+
+    def __init__(self, output_file, title, headers):
+        super().__init__(output_file, title, headers)
+        self.file = open(output_file, "w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.file, delimiter=self.delimiter)
+        self.writer.writerow(headers)
+
+    def write_row(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+class TsvExporter(CsvExporter):
+    extension = ".tsv"
+    delimiter = "\t"
+
+
+class MarkdownExporter(Exporter):
+    extension = ".md"
+
+    def __init__(self, output_file, title, headers):
+        super().__init__(output_file, title, headers)
+        self.file = open(output_file, "w", encoding="utf-8")
+        self.file.write(f"# {title}\n\n")
+        self.file.write("| " + " | ".join(headers) + " |\n")
+        self.file.write("|" + "---|" * len(headers) + "\n")
+
+    def write_row(self, row):
+        self.file.write("| " + " | ".join(text.replace("|", "\\|") for text in row) + " |\n")
+
+    def close(self):
+        self.file.close()
+
+
+class HtmlExporter(Exporter):
+    extension = ".html"
+
+    def __init__(self, output_file, title, headers):
+        super().__init__(output_file, title, headers)
+        self.file = open(output_file, "w", encoding="utf-8")
+        self.file.write(
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{html_escape(title)}</title>\n"
+            "<style>table { border-collapse: collapse; } "
+            "th, td { border: 1px solid #4f81bd; padding: 2px 8px; text-align: center; }</style>\n"
+            f"</head>\n<body>\n<h1>{html_escape(title)}</h1>\n<table>\n<thead><tr>"
+            + "".join(f"<th>{html_escape(text)}</th>" for text in headers)
+            + "</tr></thead>\n<tbody>\n"
+        )
+
+    def write_row(self, row):
+        self.file.write("<tr>" + "".join(f"<td>{html_escape(text)}</td>" for text in row) + "</tr>\n")
+
+    def close(self):
+        self.file.write("</tbody>\n</table>\n</body>\n</html>\n")
+        self.file.close()
+
+
+class JsonExporter(Exporter):
+    """A JSON list of objects keyed by the headers, written one object at a time."""
+
+    extension = ".json"
+
+    def __init__(self, output_file, title, headers):
+        super().__init__(output_file, title, headers)
+        self.file = open(output_file, "w", encoding="utf-8")
+        self.file.write("[")
+        self.first = True
+
+    def write_row(self, row):
+        self.file.write("\n  " if self.first else ",\n  ")
+        self.file.write(json.dumps(dict(zip(self.headers, row)), ensure_ascii=False))
+        self.first = False
+
+    def close(self):
+        self.file.write("\n]\n")
+        self.file.close()
+
+
+class XlsxExporter(Exporter):
+    """
+    Minimal .xlsx ("XLSX-lite"): one worksheet with inline strings, the
+    sheet XML streamed into its zip entry. No styles or shared strings.
+    """
+
+    extension = ".xlsx"
+
+    CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    )
+    ROOT_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    )
+    WORKBOOK_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    )
+    WORKBOOK = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )
+    SHEET_START = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+    )
+    SHEET_END = '</sheetData></worksheet>'
+
+    def __init__(self, output_file, title, headers):
+        super().__init__(output_file, title, headers)
+        # Sheet names are limited to 31 characters and may not contain []:*?/\
+        name = "".join(c for c in title if c not in "[]:*?/\\")[:31] or "Verbs"
+        self.zip = zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED)
+        self.zip.writestr("[Content_Types].xml", self.CONTENT_TYPES)
+        self.zip.writestr("_rels/.rels", self.ROOT_RELS)
+        self.zip.writestr("xl/_rels/workbook.xml.rels", self.WORKBOOK_RELS)
+        self.zip.writestr("xl/workbook.xml", self.WORKBOOK.format(name=xml_escape(name, {'"': "&quot;"})))
+        self.sheet = self.zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self.sheet.write(self.SHEET_START.encode("utf-8"))
+        self.row_number = 0
+        self.write_row(headers)
+
+    def write_row(self, row):
+        self.row_number += 1
+        cells = "".join(
+            f'<c t="inlineStr"><is><t>{xml_escape(text)}</t></is></c>' for text in row
+        )
+        self.sheet.write(f'<row r="{self.row_number}">{cells}</row>'.encode("utf-8"))
+
+    def close(self):
+        self.sheet.write(self.SHEET_END.encode("utf-8"))
+        self.sheet.close()
+        self.zip.close()
+
+
+# Format name -> Exporter class
+EXPORTERS = {
+    "csv": CsvExporter,
+    "tsv": TsvExporter,
+    "md": MarkdownExporter,
+    "html": HtmlExporter,
+    "json": JsonExporter,
+    "xlsx": XlsxExporter,
+}
+
+
+def export(sheet, formats, output_dir="", memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Write a VerbSheet in every requested format in a single pass over
+    its deduped, sorted verbs. Returns ({format: output_file}, row count).
+    """
+    stem = os.path.splitext(sheet.output_file)[0]
+    exporters = {}
+    try:
+        for fmt in formats:
+            exporter_class = EXPORTERS[fmt]
+            output_file = os.path.join(output_dir, stem + exporter_class.extension)
+            exporters[fmt] = exporter_class(output_file, sheet.title, sheet.headers)
+
+        count = 0
+        for row in unique_sorted(sheet.verbs, memory_limit, key=sheet.sort_key()):
+            for exporter in exporters.values():
+                exporter.write_row(row)
+            count += 1
+    finally:
+        for exporter in exporters.values():
+            exporter.close()
+    return {fmt: exporter.output_file for fmt, exporter in exporters.items()}, count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export verb lists to several formats in one pass.")
+    parser.add_argument("sheets", nargs="*",
+                        help="sheets to export: %s (default: all)" % ", ".join(sorted(SHEETS)))
+    parser.add_argument("--source", action="append", default=[], metavar="FILE",
+                        help="export a CSV/TSV/JSONL file, optionally .gz (repeatable)")
+    parser.add_argument("-f", "--formats", nargs="+", default=sorted(EXPORTERS),
+                        choices=sorted(EXPORTERS), help="formats to write (default: all)")
+    parser.add_argument("-o", "--output-dir", default="",
+                        help="directory for the output files (default: current directory)")
+    args = parser.parse_args(argv)
+    for name in args.sheets:
+        if name not in SHEETS:
+            parser.error(f"unknown sheet {name!r} (choose from {', '.join(sorted(SHEETS))})")
+
+    if args.source:
+        sheets = [source_sheet(path) for path in args.source]
+    else:
+        sheets = [load_sheet(name) for name in args.sheets or sorted(SHEETS)]
+    for sheet in sheets:
+        outputs, count = export(sheet, args.formats, args.output_dir)
+        print(f"{sheet.title}: {count} verbs -> {', '.join(outputs.values())}")
+
+
+if __name__ == "__main__":
+    main()
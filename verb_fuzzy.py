@@ -0,0 +1,331 @@
+"""
+Fuzzy search over verb forms, for suggestions on misspellings.
+
+FuzzyIndex keeps a trigram index over every base, past and past
+participle form ("writen" -> "written", "recieve" -> "receive"), with
+the postings of each trigram split by word length. A query is answered
+in two steps:
+
+    1. candidates: an insert, delete or substitution changes at most 3
+       trigrams of the padded word, so a word within d such edits has a
+       length within d of the query's and shares at least len(query
+       trigrams) - 3 * d trigrams with it. Only the rarest postings that
+       bound leaves need reading. A swap of adjacent letters is one edit
+       too: words needing one are found by searching the swapped query
+       with d - 1. Nothing within d is missed.
+    2. verification: the candidates' exact edit distance (Damerau, with
+       adjacent swaps counting as one edit), cut off as soon as it
+       exceeds d. Distances are tried in increasing order, most similar
+       candidates first, stopping as soon as the top k are known.
+
+By default, the edit distance allowed depends on the query's length (0
+below 3 letters, 1 below 6, else 2), as two edits turn short words into
+unrelated ones. A trigram index was preferred over a BK-tree: the
+triangle inequality prunes little at distance 2 over 100k short words.
+
+Usage:
+    python verb_fuzzy.py recieve writen brang     # suggestions
+    python verb_fuzzy.py --batch queries.txt      # one query per line
+    python verb_fuzzy.py --benchmark 100000       # indexed vs naive scan
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from verb_lookup import build_index
+
+# Padding for trigrams, so first and last letters are in as many trigrams as the rest
+PAD = "$$"
+
+# Edits allowed by default, by query length: like the "AUTO" fuzziness of
+# search engines, two edits only for long words (two edits turn most
+# short words into unrelated ones, and would make every short word a candidate)
+AUTO_DISTANCES = ((3, 0), (6, 1))
+MAX_AUTO_DISTANCE = 2
+
+# Trigrams one insert, delete or substitution can change
+GRAMS_PER_EDIT = 3
+
+
+def trigrams(word):
+    """Set of trigrams of word padded with PAD on both sides."""
+    padded = PAD + word + PAD
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def auto_distance(query):
+    """Default max edit distance for query: 0 below 3 letters, 1 below 6, else 2."""
+    for length, distance in AUTO_DISTANCES:
+        if len(query) < length:
+            return distance
+    return MAX_AUTO_DISTANCE
+
+
+def edit_distance(a, b, limit=None):
+    """
+    Damerau (optimal string alignment) distance between a and b: inserts,
+    deletes, substitutions and swaps of adjacent letters cost 1. With
+    limit, returns limit + 1 as soon as the distance must exceed it.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """Trigram index answering top-k fuzzy queries over a set of words."""
+
+    def __init__(self, words=()):
+        self.words = []
+        self._ids = {}
+        self._grams = []
+        self._postings = {}
+        self._by_length = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        """Index word (lower-cased); adding a word twice is a no-op."""
+        word = word.strip().lower()
+        if not word or word in self._ids:
+            return
+        word_id = self._ids[word] = len(self.words)
+        self.words.append(word)
+        self._by_length.setdefault(len(word), []).append(word_id)
+        # Share one str object per trigram between the postings keys and the word sets
+        grams = frozenset(self._postings.setdefault(gram, (gram, {}))[0] for gram in trigrams(word))
+        self._grams.append(grams)
+        for gram in grams:
+            self._postings[gram][1].setdefault(len(word), []).append(word_id)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _pool(self, query, grams, distance):
+        """
+        Ids that may be within Levenshtein distance of query. Each insert,
+        delete or substitution changes at most 3 trigrams, so such a word
+        shares at least max(len(query grams), len(its grams)) - 3 * distance
+        of them, and has one of the rarest trigrams that bound leaves.
+        """
+        if not distance:
+            word_id = self._ids.get(query)
+            return set() if word_id is None else {word_id}
+        needed = len(grams) - GRAMS_PER_EDIT * distance
+        low, high = len(query) - distance, len(query) + distance
+        if needed <= 0:
+            # Too short for the trigram filter: every word of a possible length
+            return {word_id for length in range(low, high + 1)
+                    for word_id in self._by_length.get(length, ())}
+        postings = []
+        for gram in grams:
+            by_length = self._postings.get(gram, ("", {}))[1]
+            lists = [by_length[length] for length in range(low, high + 1) if length in by_length]
+            postings.append((sum(map(len, lists)), lists))
+        postings.sort(key=lambda posting: posting[0])
+        ids = set()
+        for _, lists in postings[:len(grams) - needed + 1]:
+            for posting in lists:
+                ids.update(posting)
+        word_grams = self._grams
+        slack = GRAMS_PER_EDIT * distance
+        pool = set()
+        for word_id in ids:
+            other = word_grams[word_id]
+            if len(grams & other) >= max(needed, len(other) - slack):
+                pool.add(word_id)
+        return pool
+
+    def _candidates(self, query, grams, distance):
+        """
+        Ids that may be within distance of query, swaps included: a word
+        within distance that needs a swap is within distance - 1 of the
+        query with that swap made.
+        """
+        ids = self._pool(query, grams, distance)
+        if distance:
+            for i in range(len(query) - 1):
+                if query[i] != query[i + 1]:
+                    swapped = query[:i] + query[i + 1] + query[i] + query[i + 2:]
+                    ids |= self._candidates(swapped, trigrams(swapped), distance - 1)
+        return ids
+
+    def search(self, query, k=5, max_distance=None):
+        """
+        Return up to k (word, distance) pairs within max_distance (default:
+        auto_distance(query)), closest first; ties go to words sharing more
+        trigrams with the query.
+
+        Distances are searched in increasing order, and candidates in
+        order of shared trigrams; once k words are found within distance
+        t, no word further away can make the top k and the search stops.
+        """
+        query = query.strip().lower()
+        if max_distance is None:
+            max_distance = auto_distance(query)
+        grams = trigrams(query)
+        words, word_grams = self.words, self._grams
+        found = {}
+        for distance in range(max_distance + 1):
+            within = sum(1 for word_distance, _ in found.values() if word_distance <= distance)
+            ids = self._candidates(query, grams, distance).difference(found)
+            for shared, word_id in sorted(((len(grams & word_grams[word_id]), word_id) for word_id in ids),
+                                          reverse=True):
+                if within >= k:
+                    break
+                word_distance = edit_distance(query, words[word_id], max_distance)
+                found[word_id] = (word_distance, -shared)
+                within += word_distance <= distance
+            if within >= k:
+                break
+        ranked = sorted((word_distance, shared, words[word_id])
+                        for word_id, (word_distance, shared) in found.items() if word_distance <= max_distance)
+        return [(word, word_distance) for word_distance, _, word in ranked[:k]]
+
+    def search_many(self, queries, k=5, max_distance=None):
+        """Batch search: {query: search(query)}, answering repeated queries once."""
+        return {query: self.search(query, k, max_distance) for query in dict.fromkeys(queries)}
+
+
+def scan(words, query, k=5, max_distance=None):
+    """search() by computing the edit distance to every word (the naive baseline)."""
+    query = query.strip().lower()
+    if max_distance is None:
+        max_distance = auto_distance(query)
+    matches = []
+    for word in words:
+        distance = edit_distance(query, word, max_distance)
+        if distance <= max_distance:
+            matches.append((distance, word))
+    matches.sort()
+    return [(word, distance) for distance, word in matches[:k]]
+
+
+def build_fuzzy_index(sheet_names=("irregular", "transitive")):
+    """Return (FuzzyIndex over every form in the sheets, the VerbIndex behind it)."""
+    index = build_index(sheet_names)
+    return FuzzyIndex(index), index
+
+
+def suggest(fuzzy, index, query, k=5, max_distance=None):
+    """Suggestions for query: [{'word', 'distance', 'bases'}], closest first."""
+    return [{"word": word, "distance": distance, "bases": index.bases(word)}
+            for word, distance in fuzzy.search(query, k, max_distance)]
+
+
+def synthetic_words(count, seed=0):
+    """count distinct pronounceable pseudo-words, e.g. for benchmarking."""
+    rng = random.Random(seed)
+    onsets = ["b", "br", "c", "ch", "d", "dr", "f", "fl", "g", "gr", "h", "j", "k", "l", "m",
+              "n", "p", "pl", "r", "s", "sh", "st", "t", "tr", "v", "w", "z"]
+    vowels = ["a", "e", "i", "o", "u", "ea", "ou", "ai"]
+    codas = ["", "", "n", "r", "t", "st", "nd", "ck", "ll", "m", "p", "s"]
+    words = set()
+    while len(words) < count:
+        syllables = rng.randint(1, 3)
+        words.add("".join(rng.choice(onsets) + rng.choice(vowels) + rng.choice(codas)
+                          for _ in range(syllables)))
+    return sorted(words)
+
+
+def misspell(word, rng):
+    """word with one random typo: a dropped, doubled, swapped or replaced letter."""
+    i = rng.randrange(len(word))
+    kind = rng.choice(("drop", "double", "swap", "replace"))
+    if kind == "drop" and len(word) > 3:
+        return word[:i] + word[i + 1:]
+    if kind == "double":
+        return word[:i] + word[i] + word[i:]
+    if kind == "swap" and i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def benchmark(entries=100_000, queries=200, k=5, max_distance=None):
+    """Print build time and query latency of the index and of a naive scan."""
+    fuzzy, _ = build_fuzzy_index()
+    real = list(fuzzy.words)
+    start = time.perf_counter()
+    for word in synthetic_words(entries):
+        if len(fuzzy) >= entries:
+            break
+        fuzzy.add(word)
+    build = time.perf_counter() - start
+
+    rng = random.Random(1)
+    sample = [misspell(rng.choice(real), rng) for _ in range(queries)]
+    print(f"Index: {len(fuzzy):,} words ({len(real):,} verb forms), "
+          f"built in {build:.2f}s; {queries} misspelled queries, k={k}, "
+          f"d<={'auto' if max_distance is None else max_distance}")
+
+    indexed = {}
+    latencies = []
+    for query in dict.fromkeys(sample):
+        start = time.perf_counter()
+        indexed[query] = fuzzy.search(query, k, max_distance)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    indexed_ms = sum(latencies) / len(latencies)
+    print(f"  trigram index  {indexed_ms:9.3f} ms/query (median {latencies[len(latencies) // 2]:.3f}, "
+          f"p95 {latencies[len(latencies) * 95 // 100]:.3f})")
+
+    scanned_count = min(queries, 20)
+    start = time.perf_counter()
+    scanned = {query: scan(fuzzy.words, query, k, max_distance) for query in sample[:scanned_count]}
+    scan_ms = (time.perf_counter() - start) * 1000 / scanned_count
+    print(f"  naive scan     {scan_ms:9.3f} ms/query ({scan_ms / indexed_ms:,.0f}x slower)")
+
+    # Same distances (ties at the k-th place may pick different words)
+    same = all([d for _, d in indexed[query]] == [d for _, d in scanned[query]] for query in scanned)
+    print(f"  results match the scan: {same}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suggest verb forms for misspelled words.")
+    parser.add_argument("queries", nargs="*", help="words to look up")
+    parser.add_argument("-k", type=int, default=5, help="suggestions per query (default: %(default)s)")
+    parser.add_argument("-d", "--max-distance", type=int,
+                        help="largest edit distance suggested (default: 0-2 by word length)")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="file with one query per line ('-' for stdin); prints JSON lines")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=100_000, metavar="ENTRIES",
+                        help="compare the index with a naive scan on ENTRIES words")
+    args = parser.parse_args(argv)
+
+    if args.benchmark is not None:
+        benchmark(args.benchmark, k=args.k, max_distance=args.max_distance)
+        return
+
+    fuzzy, index = build_fuzzy_index()
+    queries = list(args.queries)
+    if args.batch:
+        f = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+        with f:
+            queries += [line.strip() for line in f if line.strip()]
+    for query in dict.fromkeys(queries):
+        print(json.dumps({"query": query,
+                          "suggestions": suggest(fuzzy, index, query, args.k, args.max_distance)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Indexed verb-form lookups over the irregular and transitive verb lists.
+
+VerbIndex answers, in O(1) dict lookups:
+    forms("wind")   -> past "wound", past participle "wound"
+    bases("wound")  -> which bases have "wound" as one of their forms
+Slash alternates such as "burnt/burned" are split, so both "burnt" and
+"burned" point back to "burn".
+
+A tiny asyncio HTTP server exposes the index:
+    GET  /forms?verb=write
+    GET  /bases?form=wound
+    POST /batch            body: ["write", "wound", ...]
+Malformed requests get 400 Bad Request and bodies over MAX_BODY_BYTES
+413 Payload Too Large; either way the connection is then closed.
+
+Usage:
+    python verb_lookup.py write wound burnt   # print lookups
+    python verb_lookup.py --serve --port 8080
+    python verb_lookup.py --benchmark         # lookups/s and HTTP requests/s
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from verb_tables import SHEETS, load_sheet
+
+ROLES = ("base", "past", "past_participle")
+
+# Largest request body the server reads (a /batch of ~100k words)
+MAX_BODY_BYTES = 1 << 20
+
+
+def split_forms(text):
+    """'burnt/burned' -> ('burnt', 'burned'); whitespace and case are normalised."""
+    return tuple(form.strip().lower() for form in text.split("/") if form.strip())
+
+
+class VerbIndex:
+    """
+    base -> forms and any form -> bases, built once from verb tuples.
+
+    When a base appears more than once (in one list or across lists),
+    the first entry wins, as in the generated documents.
+    """
+
+    def __init__(self, verbs=()):
+        self._forms = {}
+        self._bases = {}
+        self.add_all(verbs)
+
+    def add_all(self, verbs):
+        for verb in verbs:
+            self.add(*verb)
+
+    def add(self, base, past, past_participle):
+        for key in split_forms(base):
+            if key in self._forms:
+                continue
+            forms = {
+                "base": split_forms(base),
+                "past": split_forms(past),
+                "past_participle": split_forms(past_participle),
+            }
+            self._forms[key] = forms
+            for role in ROLES:
+                for form in forms[role]:
+                    self._bases.setdefault(form, {}).setdefault(key, []).append(role)
+
+    def __len__(self):
+        return len(self._forms)
+
+    def __contains__(self, word):
+        return word.strip().lower() in self._bases
+
+    def __iter__(self):
+        """Every indexed form: bases, pasts and past participles."""
+        return iter(self._bases)
+
+    def forms(self, base):
+        """Return {'base': (...), 'past': (...), 'past_participle': (...)} or None."""
+        return self._forms.get(base.strip().lower())
+
+    def bases(self, form, role=None):
+        """
+        Return {base: [roles]} for every base that has form as one of its
+        forms; with role ('past', ...) only bases using it in that role.
+        """
+        matches = self._bases.get(form.strip().lower(), {})
+        if role is None:
+            return dict(matches)
+        return {base: [role] for base, roles in matches.items() if role in roles}
+
+    def lookup(self, word):
+        """Both directions at once: {'word', 'forms', 'bases'}."""
+        return {"word": word, "forms": self.forms(word), "bases": self.bases(word)}
+
+    def lookup_many(self, words):
+        """Batch lookup: one lookup() result per word, in order."""
+        return [self.lookup(word) for word in words]
+
+
+def build_index(sheet_names=("irregular", "transitive")):
+    """Index the registered verb sheets; earlier sheets win on conflicts."""
+    index = VerbIndex()
+    for name in sheet_names:
+        index.add_all(load_sheet(name).verbs)
+    return index
+
+
+# --- HTTP endpoint ----------------------------------------------------------
+
+def _response(status, payload, keep_alive):
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("ascii") + body
+
+
+def handle_request(index, method, target, body):
+    """Route one request. Returns (status line, JSON payload)."""
+    url = urlsplit(target)
+    query = parse_qs(url.query)
+    if method == "GET" and url.path == "/forms" and "verb" in query:
+        return "200 OK", {"verb": query["verb"][0], "forms": index.forms(query["verb"][0])}
+    if method == "GET" and url.path == "/bases" and "form" in query:
+        role = query.get("role", [None])[0]
+        return "200 OK", {"form": query["form"][0], "bases": index.bases(query["form"][0], role)}
+    if method == "POST" and url.path == "/batch":
+        try:
+            words = json.loads(body or b"[]")
+        except ValueError:
+            return "400 Bad Request", {"error": "body must be a JSON list of words"}
+        if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+            return "400 Bad Request", {"error": "body must be a JSON list of words"}
+        return "200 OK", index.lookup_many(words)
+    return "404 Not Found", {"error": f"no route for {method} {url.path}"}
+
+
+class _BadRequest(Exception):
+    """A request the server answers with an error status, then closes the connection."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_line(reader):
+    try:
+        return await reader.readline()
+    except ValueError:  # Longer than the stream limit
+        raise _BadRequest("400 Bad Request", "line too long") from None
+
+
+async def _read_head(reader):
+    """
+    (method, target, version, headers) of the next request, or None at
+    the end of the stream; raises _BadRequest if it is malformed.
+    """
+    request_line = await _read_line(reader)
+    if not request_line:
+        return None
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise _BadRequest("400 Bad Request", "malformed request line")
+    headers = {}
+    while True:
+        line = await _read_line(reader)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, colon, value = line.decode("latin-1").partition(":")
+        if not colon or not name.strip():
+            raise _BadRequest("400 Bad Request", "malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    return (*parts, headers)
+
+
+def _content_length(headers):
+    """Body size from the headers; raises _BadRequest if invalid or over MAX_BODY_BYTES."""
+    text = headers.get("content-length", "0")
+    if not (text.isascii() and text.isdigit()):
+        raise _BadRequest("400 Bad Request", "invalid Content-Length")
+    length = int(text)
+    if length > MAX_BODY_BYTES:
+        raise _BadRequest("413 Payload Too Large", f"body over {MAX_BODY_BYTES} bytes")
+    return length
+
+
+async def _serve_connection(index, reader, writer):
+    try:
+        while True:
+            try:
+                head = await _read_head(reader)
+                if head is None:
+                    break
+                method, target, version, headers = head
+                length = _content_length(headers)
+            except _BadRequest as error:
+                # The rest of the stream cannot be trusted, so answer and close
+                writer.write(_response(error.status, {"error": str(error)}, False))
+                await writer.drain()
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+            status, payload = handle_request(index, method, target, body)
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(index, host="127.0.0.1", port=8080):
+    """Start serving the index over HTTP; returns the asyncio server."""
+    return await asyncio.start_server(
+        lambda reader, writer: _serve_connection(index, reader, writer), host, port
+    )
+
+
+# --- Benchmark --------------------------------------------------------------
+
+async def _http_client(port, paths, count):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(count):
+        writer.write(f"GET {paths[i % len(paths)]} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+    writer.close()
+
+
+async def _benchmark_http(index, clients, requests_per_client):
+    server = await start_server(index, port=0)
+    port = server.sockets[0].getsockname()[1]
+    words = list(index._bases)
+    paths = [f"/forms?verb={word}" if i % 2 else f"/bases?form={word}" for i, word in enumerate(words)]
+    start = time.perf_counter()
+    await asyncio.gather(*(_http_client(port, paths, requests_per_client) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    return clients * requests_per_client / elapsed
+
+
+def benchmark(index, lookups=1_000_000, clients=20, requests_per_client=500):
+    """Print in-process lookups/s (indexed vs linear scan) and HTTP requests/s."""
+    verbs = [tuple("/".join(forms[role]) for role in ROLES) for forms in index._forms.values()]
+    words = list(index._bases)
+
+    start = time.perf_counter()
+    for i in range(lookups):
+        index.bases(words[i % len(words)])
+    indexed = lookups / (time.perf_counter() - start)
+
+    scans = 10_000
+    start = time.perf_counter()
+    for i in range(scans):
+        word = words[i % len(words)]
+        [verb[0] for verb in verbs if any(word in split_forms(form) for form in verb)]
+    scanned = scans / (time.perf_counter() - start)
+
+    print(f"Index: {len(index)} bases, {len(words)} distinct forms")
+    print(f"  reverse lookup, indexed      {indexed:14,.0f} lookups/s")
+    print(f"  reverse lookup, linear scan  {scanned:14,.0f} lookups/s")
+    http = asyncio.run(_benchmark_http(index, clients, requests_per_client))
+    print(f"  HTTP, {clients} keep-alive clients {http:11,.0f} requests/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Look up verb forms in both directions.")
+    parser.add_argument("words", nargs="*", help="words to look up")
+    parser.add_argument("--sheets", nargs="+", default=["irregular", "transitive"],
+                        choices=sorted(SHEETS), help="lists to index, first wins on conflicts")
+    parser.add_argument("--serve", action="store_true", help="serve the index over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--benchmark", action="store_true", help="measure lookups/s and requests/s")
+    args = parser.parse_args(argv)
+
+    index = build_index(args.sheets)
+    if args.benchmark:
+        benchmark(index)
+    elif args.serve:
+        async def serve():
+            server = await start_server(index, args.host, args.port)
+            print(f"Serving {len(index)} verbs on http://{args.host}:{args.port}")
+            async with server:
+                await server.serve_forever()
+        asyncio.run(serve())
+    else:
+        for result in index.lookup_many(args.words):
+            print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Merge and compare verb lists.
+
+VerbMerge reads any number of verb sources in one streaming pass each and
+keeps, per base form, the forms every source gave it. From that it
+reports:
+
+    union          every base, forms merged across sources, sorted like
+                   the document builders sort (verb_sorting)
+    intersection   bases found in every source
+    difference     bases found only in one source
+    conflicts      bases whose sources disagree on the forms, e.g.
+                   burn: irregular "burnt/burned", transitive "burned"
+
+Work and memory are linear in the input (one dict entry per base).
+
+Usage:
+    python verb_merge.py irregular transitive
+    python verb_merge.py irregular transitive extra.csv --union merged.csv
+"""
+
+import argparse
+import os
+
+from verb_exporters import CsvExporter
+from verb_lookup import split_forms
+from verb_sorting import make_sort_key
+from verb_sources import read_verbs
+from verb_tables import SHEETS, load_sheet
+
+
+def merge_alternatives(*texts):
+    """'burnt/burned' + 'burned' + 'burnt' -> 'burnt/burned' (order of first appearance)."""
+    alternatives = []
+    for text in texts:
+        for form in text.split("/"):
+            form = form.strip()
+            if form and form not in alternatives:
+                alternatives.append(form)
+    return "/".join(alternatives)
+
+
+class VerbMerge:
+    """Per-base view of several verb sources; add sources with add()."""
+
+    def __init__(self):
+        self.sources = []
+        # base -> {source name: (past, past_participle)}, bases in first-seen order
+        self.entries = {}
+
+    def add(self, name, verbs):
+        """Stream one source in. Within a source, the first row of a base wins."""
+        if name in self.sources:
+            raise ValueError(f"Source already added: {name}")
+        self.sources.append(name)
+        for base, past, past_participle in verbs:
+            self.entries.setdefault(base, {}).setdefault(name, (past, past_participle))
+        return self
+
+    def union(self, combine=True, key=None):
+        """
+        Return [(base, past, past_participle)] for every base, sorted by
+        key(row) (default: the builders' default collation,
+        verb_sorting.make_sort_key()). With combine, differing forms are
+        merged into slash alternatives; otherwise the first source that
+        has the base wins.
+        """
+        rows = []
+        for base, by_source in self.entries.items():
+            forms = list(by_source.values())
+            if combine:
+                rows.append((base, merge_alternatives(*(f[0] for f in forms)),
+                             merge_alternatives(*(f[1] for f in forms))))
+            else:
+                rows.append((base, *forms[0]))
+        rows.sort(key=key or make_sort_key())
+        return rows
+
+    def intersection(self):
+        """Bases present in every source."""
+        count = len(self.sources)
+        return [base for base, by_source in self.entries.items() if len(by_source) == count]
+
+    def difference(self, name):
+        """Bases present only in source name."""
+        return [base for base, by_source in self.entries.items()
+                if len(by_source) == 1 and name in by_source]
+
+    def conflicts(self):
+        """
+        Return [(base, {source: (past, past_participle)})] for bases whose
+        sources disagree. Forms are compared as sets of alternatives, so
+        "burnt/burned" and "burned/burnt" agree but "burnt/burned" and
+        "burned" do not.
+        """
+        result = []
+        for base, by_source in self.entries.items():
+            if len(by_source) < 2:
+                continue
+            variants = {tuple(frozenset(split_forms(form)) for form in forms)
+                        for forms in by_source.values()}
+            if len(variants) > 1:
+                result.append((base, dict(by_source)))
+        return result
+
+    def report(self):
+        """Print counts for every set operation and list the conflicts."""
+        conflicts = self.conflicts()
+        rows = [("union", len(self.entries)), ("intersection", len(self.intersection()))]
+        rows += [(f"only in {name}", len(self.difference(name))) for name in self.sources]
+        rows.append(("conflicts", len(conflicts)))
+        width = max(len(label) for label, _ in rows)
+        print(f"Sources: {', '.join(self.sources)}")
+        for label, count in rows:
+            print(f"  {label:<{width}} {count:6} bases")
+        for base, by_source in conflicts:
+            details = "; ".join(f"{name}: {' | '.join(forms)}" for name, forms in by_source.items())
+            print(f"    {base:<12} {details}")
+
+
+def source_verbs(spec):
+    """
+    (name, verbs) for a registered sheet name or a source file path.
+    Files are named by their path as given, so a/verbs.csv and
+    b/verbs.csv stay two sources.
+    """
+    if spec in SHEETS:
+        return spec, load_sheet(spec).verbs
+    return os.path.normpath(spec), read_verbs(spec)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge verb lists and report how they differ.")
+    parser.add_argument("sources", nargs="+",
+                        help="sheet names (%s) or CSV/TSV/JSONL files" % ", ".join(sorted(SHEETS)))
+    parser.add_argument("--union", metavar="CSV", help="write the merged list to a CSV file")
+    parser.add_argument("--first-wins", action="store_true",
+                        help="in the union, keep the first source's forms instead of merging them")
+    args = parser.parse_args(argv)
+
+    merge = VerbMerge()
+    for spec in args.sources:
+        merge.add(*source_verbs(spec))
+    merge.report()
+
+    if args.union:
+        exporter = CsvExporter(args.union, "Merged Verbs", ("Present", "Past", "Past Participle"))
+        try:
+            for row in merge.union(combine=not args.first_wins):
+                exporter.write_row(row)
+        finally:
+            exporter.close()
+        print(f"Union written to {args.union}")
+
+
+if __name__ == "__main__":
+    main()
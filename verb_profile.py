@@ -0,0 +1,150 @@
+"""
+Stage hooks and profiling for the verb generators.
+
+Building a document goes through five stages:
+
+    load    read the sheet's verbs (conjugating generated ones)
+    dedupe  keep the first row of each base form
+    sort    sort the rows by the sheet's collation
+    render  build the table
+    save    write the .docx file
+
+Anything can subscribe to stage start/end events:
+
+    def on_stage(event, stage, sheet, seconds):
+        ...   # event is "start" or "end"; seconds is None on "start"
+
+    verb_profile.subscribe(on_stage)
+
+Without subscribers, the builders stream rows straight through
+verb_sources.unique_sorted() and no events are sent. With subscribers,
+the rows are loaded and deduped in memory as separate steps first, so
+each stage can be timed on its own; the sort itself is the same.
+
+Setting VERB_PROFILE profiles any run of the scripts without editing
+them, printing per-stage wall time and the top cProfile functions to
+stderr. A value other than 1/true/yes is a file to dump the pstats to:
+
+    VERB_PROFILE=1 python create_transitive_verbs.py
+    VERB_PROFILE=transitive.prof python create_transitive_verbs.py
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import time
+
+from verb_sources import unique_sorted
+
+STAGES = ("load", "dedupe", "sort", "render", "save")
+
+PROFILE_ENV = "VERB_PROFILE"
+
+# Functions listed in the cProfile report
+PROFILE_TOP = 25
+
+_subscribers = []
+
+
+def subscribe(callback):
+    """Call callback(event, stage, sheet, seconds) on every stage start and end."""
+    _subscribers.append(callback)
+    return callback
+
+
+def unsubscribe(callback):
+    _subscribers.remove(callback)
+
+
+def active():
+    """True if anything is subscribed to stage events."""
+    return bool(_subscribers)
+
+
+@contextlib.contextmanager
+def stage(name, sheet):
+    """Send start/end events for one stage of building sheet to the subscribers."""
+    if not _subscribers:
+        yield
+        return
+    for callback in list(_subscribers):
+        callback("start", name, sheet, None)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        for callback in list(_subscribers):
+            callback("end", name, sheet, elapsed)
+
+
+def staged_rows(sheet, memory_limit):
+    """
+    The deduped, sorted rows of a sheet. Streams them when nobody is
+    listening; otherwise runs load, dedupe and sort as separate stages.
+    """
+    if not _subscribers:
+        return unique_sorted(sheet.verbs, memory_limit, key=sheet.sort_key())
+    with stage("load", sheet):
+        rows = list(sheet.verbs)
+    with stage("dedupe", sheet):
+        first = {}
+        for row in rows:
+            first.setdefault(row[0], row)
+        rows = list(first.values())
+    with stage("sort", sheet):
+        rows = list(unique_sorted(rows, memory_limit, key=sheet.sort_key()))
+    return rows
+
+
+class StageTimer:
+    """Subscriber that adds up wall time per (sheet title, stage)."""
+
+    def __init__(self):
+        self.seconds = {}
+
+    def __call__(self, event, stage_name, sheet, seconds):
+        if event == "end":
+            key = (sheet.title, stage_name)
+            self.seconds[key] = self.seconds.get(key, 0.0) + seconds
+
+    def report(self, file=sys.stderr):
+        titles = list(dict.fromkeys(title for title, _ in self.seconds))
+        for title in titles:
+            times = [self.seconds.get((title, name), 0.0) for name in STAGES]
+            print(f"{title}: {sum(times):.3f}s", file=file)
+            for name, seconds in zip(STAGES, times):
+                print(f"  {name:<7} {seconds:9.4f}s", file=file)
+
+
+@contextlib.contextmanager
+def profiled(env=None):
+    """
+    Profile the enclosed code if VERB_PROFILE is set in env (default:
+    os.environ): time every stage and run cProfile, then print both to
+    stderr or dump the pstats to the file VERB_PROFILE names.
+    """
+    setting = (os.environ if env is None else env).get(PROFILE_ENV, "")
+    if not setting or setting.lower() in ("0", "false", "no"):
+        yield
+        return
+
+    timer = subscribe(StageTimer())
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        unsubscribe(timer)
+        timer.report()
+        if setting.lower() in ("1", "true", "yes"):
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            print(out.getvalue(), file=sys.stderr)
+        else:
+            profiler.dump_stats(setting)
+            print(f"Profile written to {setting} (python -m pstats {setting})", file=sys.stderr)
@@ -0,0 +1,160 @@
+"""
+Async API for rendering verb sheets on demand, e.g. from a web backend.
+
+    async with VerbSheetService(workers=4) as service:
+        data = await service.render("transitive", letters="a-f")   # .docx bytes
+
+Rendering is CPU-bound, so it runs in a worker pool (processes by
+default) via loop.run_in_executor(), keeping the event loop free.
+Identical requests that arrive while one is rendering wait for that
+render instead of starting another, and recent results are kept in an
+LRU cache, so a popular sheet is rendered once.
+
+Requests name a registered sheet (see verb_tables.SHEETS) and may
+restrict it to some starting letters ("a-f", "aeiou", "a-c,x-z"), like
+verb_batch.py manifest entries.
+
+Usage:
+    python verb_service.py --demo          # concurrent requests, cache and coalescing stats
+"""
+
+import argparse
+import asyncio
+import io
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from verb_batch import job_sheet, parse_letters
+from verb_tables import SHEETS, make_builder
+
+# One builder per worker (process or thread), backend and chunking, created
+# by the first render that needs it. Builders are never changed per request
+# and save() writes builder.last_report, so threads must not share them.
+_local = threading.local()
+
+
+def _builder(backend, chunk):
+    builders = getattr(_local, "builders", None)
+    if builders is None:
+        builders = _local.builders = {}
+    builder = builders.get((backend, chunk))
+    if builder is None:
+        builder = builders[backend, chunk] = make_builder(backend, chunk=chunk)
+    return builder
+
+
+def render_bytes(job, backend="auto"):
+    """Render one job (a verb_batch manifest entry) and return the .docx bytes."""
+    builder = _builder(backend, job.get("chunk"))
+    output = io.BytesIO()
+    builder.save(job_sheet(job), output)
+    return output.getvalue()
+
+
+class VerbSheetService:
+    """
+    Renders verb sheets to .docx bytes without blocking the event loop.
+
+    executor defaults to a ProcessPoolExecutor with the given number of
+    workers; cache_size is the number of rendered documents kept. stats
+    counts renders, cache hits and requests coalesced into a running
+    render.
+    """
+
+    def __init__(self, workers=None, cache_size=32, backend="auto", executor=None):
+        self.backend = backend
+        self.cache_size = cache_size
+        self._executor = executor or ProcessPoolExecutor(max_workers=workers)
+        self._cache = OrderedDict()
+        self._pending = {}
+        self.stats = {"renders": 0, "cache_hits": 0, "coalesced": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut the worker pool down."""
+        self._executor.shutdown()
+
+    @staticmethod
+    def job(sheet, letters=None, title=None, chunk=None):
+        """Return the normalized job for a request; equal requests give equal jobs."""
+        if sheet not in SHEETS:
+            raise ValueError(f"Unknown sheet {sheet!r} (choose from {', '.join(sorted(SHEETS))})")
+        job = {"sheet": sheet}
+        if letters:
+            job["letters"] = "".join(sorted(parse_letters(letters)))
+        if title:
+            job["title"] = title
+        if chunk:
+            job["chunk"] = chunk
+        return job
+
+    async def render(self, sheet, letters=None, title=None, chunk=None):
+        """Return the .docx bytes of a sheet, from the cache, a running render or a new one."""
+        job = self.job(sheet, letters, title, chunk)
+        key = tuple(sorted(job.items()))
+
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return data
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, render_bytes, job, self.backend)
+            future.add_done_callback(lambda done: self._finished(key, done))
+            self._pending[key] = future
+            self.stats["renders"] += 1
+        else:
+            self.stats["coalesced"] += 1
+        # A cancelled caller must not cancel the render other callers wait for
+        return await asyncio.shield(future)
+
+    def _finished(self, key, future):
+        """Move a completed render from the pending table into the LRU cache."""
+        del self._pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._cache[key] = future.result()
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+async def demo(workers=None, clients=50):
+    """Fire concurrent requests for a few sheets and print timing and service stats."""
+    requests = [("transitive", "a-f"), ("transitive", "g-z"), ("irregular", None), ("transitive", None)]
+    async with VerbSheetService(workers=workers) as service:
+        for round_name in ("cold", "warm"):
+            start = time.perf_counter()
+            results = await asyncio.gather(*(
+                service.render(*requests[i % len(requests)]) for i in range(clients)
+            ))
+            elapsed = time.perf_counter() - start
+            print(f"{round_name}: {clients} requests in {elapsed * 1000:.1f} ms, "
+                  f"{sum(map(len, results)):,} bytes served")
+        print("Stats: " + ", ".join(f"{name} {count}" for name, count in service.stats.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Async verb sheet rendering service.")
+    parser.add_argument("--demo", action="store_true", help="run concurrent demo requests")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--clients", type=int, default=50, help="concurrent requests per demo round")
+    args = parser.parse_args(argv)
+    if not args.demo:
+        parser.print_help()
+        return
+    asyncio.run(demo(args.workers, args.clients))
+
+
+if __name__ == "__main__":
+    main()
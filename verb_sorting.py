@@ -0,0 +1,187 @@
+"""
+Collation keys for sorting verb tables.
+
+Sorting by raw code point puts "Zeigen" before "abholen" and "élire"
+after "zoner". This module builds collation keys once per distinct string
+and caches them, instead of deriving them from the raw text each time:
+
+    codepoint  raw str order (the original behaviour)
+    casefold   ICU-free: accents stripped and case folded first, then
+               accents, then case, then the raw string as tie-breakers
+    locale     locale.strxfrm() for a given locale, e.g. "fr_FR.UTF-8"
+
+Keys can span several columns, so rows with the same present form are
+ordered by past form, then past participle. make_sort_key() gives a row
+key for the streaming verb_sources.unique_sorted(); sort_verbs() sorts an
+in-memory list by integer ranks of the precomputed keys.
+
+Usage:
+    python verb_sorting.py --benchmark 1000000
+"""
+
+import argparse
+import locale
+import random
+import time
+import unicodedata
+from operator import itemgetter
+
+COLLATIONS = ("codepoint", "casefold", "locale")
+
+# Distinct strings whose keys are cached before the cache is cleared, so
+# streaming sorts keep bounded memory
+KEY_CACHE_SIZE = 100_000
+
+
+def casefold_key(text):
+    """(base letters, letters with accents, case-folded text, raw text) for text."""
+    folded = text.casefold()
+    decomposed = unicodedata.normalize("NFKD", folded)
+    base = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return (base, decomposed, folded, text)
+
+
+def _locale_transform(locale_name):
+    """
+    Return strxfrm for locale_name (the current LC_COLLATE if None).
+    setlocale() is process-wide, so the returned function switches
+    LC_COLLATE to locale_name for each call and then restores it.
+    """
+    if not locale_name:
+        return locale.strxfrm
+    # Fail here, not on the first key, if the locale is not installed
+    previous = locale.setlocale(locale.LC_COLLATE)
+    try:
+        locale.setlocale(locale.LC_COLLATE, locale_name)
+    finally:
+        locale.setlocale(locale.LC_COLLATE, previous)
+
+    def strxfrm(text):
+        previous = locale.setlocale(locale.LC_COLLATE)
+        try:
+            locale.setlocale(locale.LC_COLLATE, locale_name)
+            return locale.strxfrm(text)
+        finally:
+            locale.setlocale(locale.LC_COLLATE, previous)
+
+    return strxfrm
+
+
+def column_key(collation="casefold", locale_name=None):
+    """Return a function str -> tuple of str for one column, caching per distinct string."""
+    if collation == "codepoint":
+        return lambda text: (text,)
+    if collation == "casefold":
+        transform = casefold_key
+    elif collation == "locale":
+        strxfrm = _locale_transform(locale_name)
+        transform = lambda text: (strxfrm(text), text)  # noqa: E731
+    else:
+        raise ValueError(f"Unknown collation: {collation}")
+
+    cache = {}
+
+    def key(text):
+        result = cache.get(text)
+        if result is None:
+            if len(cache) >= KEY_CACHE_SIZE:
+                cache.clear()
+            result = cache[text] = transform(text)
+        return result
+
+    return key
+
+
+def make_sort_key(collation="casefold", columns=(0,), locale_name=None):
+    """
+    Return a function row -> flat tuple of str that sorts rows by the
+    given columns in order, using the collation for each of them.
+    """
+    columns = tuple(columns)
+    if collation == "codepoint" and columns == (0,):
+        return lambda row: (row[0],)
+    key = column_key(collation, locale_name)
+
+    def sort_key(row):
+        result = ()
+        for column in columns:
+            result += key(row[column])
+        return result
+
+    return sort_key
+
+
+def collation_ranks(strings, collation="casefold", locale_name=None):
+    """
+    Return {string: rank} for the distinct strings, ranked by collation.
+    Each distinct string's collation key is computed exactly once.
+    """
+    key = column_key(collation, locale_name)
+    return {text: rank for rank, text in enumerate(sorted(set(strings), key=key))}
+
+
+def sort_verbs(rows, collation="casefold", columns=(0,), locale_name=None):
+    """
+    Return rows sorted by the given columns with precomputed keys.
+
+    Collation keys are computed once per distinct string and turned into
+    integer ranks; rows are then sorted by a single int built from the
+    ranks of their columns, which is as cheap to compare as it gets.
+    """
+    rows = list(rows)
+    columns = tuple(columns)
+    if collation == "codepoint" and len(columns) == 1:
+        rows.sort(key=itemgetter(columns[0]))
+        return rows
+
+    # One ranking shared by all sort columns: forms often repeat across columns
+    rank = collation_ranks((row[column] for row in rows for column in columns),
+                           collation, locale_name)
+
+    if len(columns) == 1:
+        column = columns[0]
+        rows.sort(key=lambda row: rank[row[column]])
+        return rows
+
+    size = len(rank)
+
+    def row_key(row):
+        combined = 0
+        for column in columns:
+            combined = combined * size + rank[row[column]]
+        return combined
+
+    rows.sort(key=row_key)
+    return rows
+
+
+def benchmark(row_count=1_000_000, distinct=50_000):
+    """Time sort_verbs() against the original list.sort(key=lambda x: x[0])."""
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyzéèàçüöÉ"
+    words = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(distinct)]
+    rows = [(word, word + "ed", word + "ed") for word in (rng.choice(words) for _ in range(row_count))]
+    print(f"Sorting {row_count:,} rows ({distinct:,} distinct present forms)")
+
+    start = time.perf_counter()
+    baseline = list(rows)
+    baseline.sort(key=lambda x: x[0])
+    print(f"  original sort(key=lambda x: x[0])     {time.perf_counter() - start:7.2f}s  (code point order)")
+
+    for collation, columns in (("codepoint", (0,)), ("casefold", (0,)), ("casefold", (0, 1, 2))):
+        start = time.perf_counter()
+        sort_verbs(rows, collation, columns)
+        label = f"sort_verbs({collation}, columns={columns})"
+        print(f"  {label:<38}{time.perf_counter() - start:7.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark verb table collation.")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=1_000_000, default=1_000_000,
+                        metavar="ROWS", help="rows to sort (default: %(default)s)")
+    args = parser.parse_args(argv)
+    benchmark(args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
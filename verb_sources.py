@@ -0,0 +1,208 @@
+"""
+Streaming verb sources for the verb table generators.
+
+Verb lists can live outside the Python scripts in CSV, TSV or JSONL files
+(optionally gzip-compressed, e.g. verbs.csv.gz). Rows are read lazily with
+generators (read_verbs(), or VerbFile for a source that can be read more
+than once), and unique_sorted() dedupes and sorts them with bounded memory:
+when the rows exceed the RAM budget, sorted runs are spilled to temporary
+files and merged back with heapq.merge (an external merge sort).
+chunked() splits the sorted rows into per-letter or fixed-size chunks
+for rendering one table per chunk.
+
+File formats (one verb per row/line):
+    CSV / TSV:  base,past,past_participle   (an optional header row is skipped)
+    JSONL:      ["base", "past", "past_participle"]
+                or {"base": ..., "past": ..., "past_participle": ...}
+"""
+
+import csv
+import gzip
+import heapq
+import itertools
+import json
+import os
+import sys
+import tempfile
+
+from verb_sorting import casefold_key
+
+# Default RAM budget for unique_sorted() before it spills to disk
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# First cells that mark a CSV/TSV header row
+HEADER_NAMES = {"base", "base (present)", "present", "verb"}
+
+# JSONL object keys, in column order (the first key found for a column wins)
+JSON_KEYS = (("base", "present"), ("past",), ("past_participle", "participle"))
+
+# chunked() mode for one chunk per first letter
+CHUNK_BY_LETTER = "letter"
+
+
+def _open_text(path):
+    """Open a text file for reading, transparently un-gzipping *.gz files."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def source_format(path):
+    """Return 'csv', 'tsv' or 'jsonl' for a path such as verbs.tsv.gz."""
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".tsv", ".tab"):
+        return "tsv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unknown verb source format: {path}")
+
+
+def _read_delimited(f, delimiter):
+    for line_number, row in enumerate(csv.reader(f, delimiter=delimiter), 1):
+        if not row or row[0].startswith("#"):
+            continue
+        if line_number == 1 and row[0].strip().lower() in HEADER_NAMES:
+            continue
+        if len(row) != 3:
+            raise ValueError(f"Line {line_number}: expected 3 columns, got {len(row)}")
+        yield tuple(cell.strip() for cell in row)
+
+
+def _read_jsonl(f):
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, dict):
+            row = []
+            for keys in JSON_KEYS:
+                value = next((record[key] for key in keys if key in record), None)
+                if value is None:
+                    raise ValueError(f"Line {line_number}: missing {keys[0]!r}")
+                row.append(value)
+            record = row
+        if len(record) != 3:
+            raise ValueError(f"Line {line_number}: expected 3 forms, got {len(record)}")
+        yield tuple(record)
+
+
+def read_verbs(path):
+    """Yield (base, past, past_participle) tuples from a CSV/TSV/JSONL(.gz) file."""
+    fmt = source_format(path)
+    with _open_text(path) as f:
+        if fmt == "jsonl":
+            yield from _read_jsonl(f)
+        else:
+            yield from _read_delimited(f, "," if fmt == "csv" else "\t")
+
+
+class VerbFile:
+    """
+    A verb source file that can be read any number of times: every
+    iteration streams read_verbs(path) again. A rebuild check can hash
+    its rows in one pass and render them in another without holding
+    them in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        return read_verbs(self.path)
+
+    def __repr__(self):
+        return f"VerbFile({self.path!r})"
+
+
+def row_size(row):
+    """Rough number of bytes a buffered row costs (strings + tuple + sort key)."""
+    return sys.getsizeof(row) + sum(sys.getsizeof(form) for form in row) + 120
+
+
+def _spill(run, tmp_dir):
+    """Write a sorted run of (sort key, seq, row) to a temporary JSONL file."""
+    f = tempfile.TemporaryFile("w+", encoding="utf-8", dir=tmp_dir)
+    for item in run:
+        f.write(json.dumps(item))
+        f.write("\n")
+    f.seek(0)
+    return f
+
+
+def _read_run(f):
+    for line in f:
+        sort_key, seq, row = json.loads(line)
+        if isinstance(sort_key, list):
+            sort_key = tuple(sort_key)
+        yield sort_key, seq, tuple(row)
+
+
+def unique_sorted(verbs, memory_limit=DEFAULT_MEMORY_LIMIT, tmp_dir=None, key=None):
+    """
+    Yield verb tuples deduped by base form (first occurrence wins) and
+    sorted by base form, or by key(row) if given (see verb_sorting). A
+    key must order rows by base form first, so rows sharing a base end
+    up next to each other.
+
+    Rows are buffered until they use about memory_limit bytes; larger
+    inputs are sorted in runs on disk and merged, so memory stays bounded
+    no matter how many rows the source has.
+    """
+    runs = []
+    buffer = []
+    buffered = 0
+    try:
+        for seq, row in enumerate(verbs):
+            buffer.append((key(row) if key else row[0], seq, row))
+            buffered += row_size(row)
+            if buffered >= memory_limit:
+                buffer.sort()
+                runs.append(_spill(buffer, tmp_dir))
+                buffer = []
+                buffered = 0
+        buffer.sort()
+
+        if runs:
+            merged = heapq.merge(buffer, *(_read_run(f) for f in runs))
+        else:
+            merged = buffer
+
+        # Rows of one base are adjacent; keep the one that came first in the input
+        for base, group in itertools.groupby(merged, key=lambda item: item[2][0]):
+            yield min(group, key=lambda item: item[1])[2]
+    finally:
+        for f in runs:
+            f.close()
+
+
+def first_letter(base):
+    """Upper-case first letter of base with accents stripped ("élire" -> "E"), or "#"."""
+    letter = casefold_key(base)[0][:1].upper()
+    return letter if letter.isalpha() else "#"
+
+
+def chunked(rows, chunk):
+    """
+    Yield (label, list of rows) chunks of sorted rows.
+
+    With chunk="letter" there is one chunk per first letter, labelled
+    "A", "B", ...; with an int, chunks hold that many rows and are
+    labelled by their first and last base form ("abide - cut"). Only one
+    chunk is held in memory at a time.
+    """
+    if chunk == CHUNK_BY_LETTER:
+        for letter, group in itertools.groupby(rows, key=lambda row: first_letter(row[0])):
+            yield letter, list(group)
+        return
+    if not isinstance(chunk, int) or chunk < 1:
+        raise ValueError(f"chunk must be {CHUNK_BY_LETTER!r} or a positive row count, not {chunk!r}")
+    rows = iter(rows)
+    while True:
+        group = list(itertools.islice(rows, chunk))
+        if not group:
+            return
+        yield f"{group[0][0]} - {group[-1][0]}", group
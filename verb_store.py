@@ -0,0 +1,180 @@
+"""
+Compact storage for large verb lists.
+
+A list of (present, past, past_participle) tuples costs a tuple object
+plus three str objects per verb, even when forms repeat ("cut", "cut",
+"cut"; "accepted", "accepted"). VerbStore interns every distinct form
+once into a single string pool and keeps each column as an array('I') of
+string ids, so a verb costs 12 bytes plus its share of the pool.
+
+VerbStore is iterable like the original lists (it yields tuples), so it
+can be passed anywhere a verb list is used, e.g. as VerbSheet.verbs.
+
+Usage:
+    python verb_store.py                    # memory of the built-in lists
+    python verb_store.py --synthetic 1000000
+"""
+
+import argparse
+import sys
+from array import array
+
+from verb_sorting import casefold_key
+from verb_tables import SHEETS, load_sheet
+
+
+class VerbStore:
+    """
+    Verb tuples stored as string ids into one interned string pool.
+
+    add() appends verbs; the pool is joined into a single str on first
+    read (or by compact()), after which the interning dict is dropped.
+    """
+
+    def __init__(self, verbs=(), columns=3):
+        self.columns = [array("I") for _ in range(columns)]
+        self._ids = {}
+        self._pieces = []
+        self._pool = ""
+        self._offsets = array("I", [0])
+        for verb in verbs:
+            self.add(verb)
+
+    def _intern(self, text):
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._offsets) - 1
+            self._pieces.append(text)
+            self._offsets.append(self._offsets[-1] + len(text))
+        return string_id
+
+    def add(self, verb):
+        """Append one verb tuple."""
+        if self._ids is None:
+            # Re-open a compacted store for appending
+            self._ids = {self.string(i): i for i in range(len(self._offsets) - 1)}
+            # The pool and offsets may be shared with stores made by _select()
+            self._offsets = array("I", self._offsets)
+            self._pieces = [self._pool]
+            self._pool = ""
+        for column, text in zip(self.columns, verb):
+            column.append(self._intern(text))
+
+    def compact(self):
+        """Join the pool into one str and drop the interning dict."""
+        if self._ids is not None:
+            self._pool += "".join(self._pieces)
+            self._pieces = []
+            self._ids = None
+        return self
+
+    def string(self, string_id):
+        """Return the interned string with the given id."""
+        self.compact()
+        return self._pool[self._offsets[string_id]:self._offsets[string_id + 1]]
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __getitem__(self, index):
+        return tuple(self.string(column[index]) for column in self.columns)
+
+    def __iter__(self):
+        self.compact()
+        pool, offsets = self._pool, self._offsets
+        for ids in zip(*self.columns):
+            yield tuple(pool[offsets[i]:offsets[i + 1]] for i in ids)
+
+    def _select(self, indices):
+        """New VerbStore sharing this pool, holding the rows at indices."""
+        self.compact()
+        store = VerbStore(columns=0)
+        store._pool, store._offsets, store._ids = self._pool, self._offsets, None
+        store.columns = [array("I", (column[i] for i in indices)) for column in self.columns]
+        return store
+
+    def unique(self):
+        """Drop rows whose base form was already seen (first one wins)."""
+        seen = bytearray(len(self._offsets) - 1)
+        keep = []
+        for index, base_id in enumerate(self.columns[0]):
+            if not seen[base_id]:
+                seen[base_id] = 1
+                keep.append(index)
+        return self._select(keep)
+
+    def sorted(self, column=0, key=casefold_key):
+        """
+        Rows sorted by one column, comparing strings by key(str) (the
+        builders' default collation; pass
+        verb_sorting.column_key(sheet.collation, sheet.locale_name) to
+        match a sheet). Distinct strings are sorted once and rows are
+        then sorted by integer rank, not by string.
+        """
+        self.compact()
+        string_count = len(self._offsets) - 1
+        rank = array("I", bytes(4 * string_count))
+        ordered = sorted(range(string_count), key=lambda string_id: key(self.string(string_id)))
+        for position, string_id in enumerate(ordered):
+            rank[string_id] = position
+        keys = self.columns[column]
+        return self._select(sorted(range(len(self)), key=lambda i: rank[keys[i]]))
+
+    def unique_sorted(self, key=casefold_key):
+        """
+        Same result as verb_sources.unique_sorted() with the matching row
+        key (verb_sorting.make_sort_key() for the default), as a VerbStore.
+        """
+        return self.unique().sorted(key=key)
+
+    def nbytes(self):
+        """Bytes used by the pool, offsets and id columns."""
+        self.compact()
+        return (sys.getsizeof(self._pool) + sys.getsizeof(self._offsets)
+                + sum(sys.getsizeof(column) for column in self.columns))
+
+
+def list_nbytes(verbs):
+    """Bytes used by a list of tuples of str, counting each object once."""
+    seen = set()
+    total = sys.getsizeof(verbs)
+    for verb in verbs:
+        for obj in (verb, *verb):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+    return total
+
+
+def memory_report(verbs, label):
+    """Print the memory of a list of tuples next to the same verbs in a VerbStore."""
+    verbs = list(verbs)
+    baseline = list_nbytes(verbs)
+    store = VerbStore(verbs).compact()
+    assert list(store) == verbs
+    compact = store.nbytes()
+    print(f"{label}: {len(verbs):,} verbs, {len(store._offsets) - 1:,} distinct strings")
+    print(f"  list of tuples  {baseline / 2**20:10.2f} MiB")
+    print(f"  VerbStore       {compact / 2**20:10.2f} MiB  ({baseline / compact:.1f}x smaller)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare VerbStore memory with lists of tuples.")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="also report N synthetic regular verbs (forms repeat like real ones)")
+    args = parser.parse_args(argv)
+
+    for name in sorted(SHEETS):
+        sheet = load_sheet(name)
+        memory_report(sheet.verbs, sheet.title)
+    if args.synthetic:
+        verbs = []
+        for i in range(args.synthetic):
+            # Build fresh str objects, as a file reader would
+            base = "verb" + str(i)
+            verbs.append((base, base + "ed", base + "ed"))
+        memory_report(verbs, f"Synthetic ({args.synthetic:,})")
+
+
+if __name__ == "__main__":
+    main()
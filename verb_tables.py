@@ -0,0 +1,523 @@
+"""
+Shared engine for building verb table Word documents.
+
+create_irregular_verbs.py and create_transitive_verbs.py describe their
+sheet (title, headers, verb list, output file) and hand it to this module,
+which dedupes, sorts and renders it. Sheets can also be read from CSV,
+TSV or JSONL files (see verb_sources.py). Many sheets can be built in one
+process: python-docx is imported once, the Word template is read once and
+the table style is resolved once per builder.
+
+Cell formatting is not set cell by cell: a "Verb Cell" (centered) and a
+"Verb Header" (centered, bold) paragraph style are added to the template
+once per builder and every cell refers to them by name, while column
+widths come from the table grid (fixed layout) instead of every cell.
+
+python-docx is only imported when the python-docx backend is used. If it
+is not installed, documents are written by the pure-stdlib writer in
+verb_docx_writer.py instead; nothing is installed at run time.
+
+Usage:
+    python verb_tables.py                      # build every known sheet
+    python verb_tables.py irregular transitive
+    python verb_tables.py transitive --per-row # original add_row() loop
+    python verb_tables.py --force              # rebuild even if nothing changed
+    python verb_tables.py --source verbs.csv.gz --title "Phrasal Verbs"
+    python verb_tables.py --source verbes.csv --collation locale --locale fr_FR.UTF-8
+    python verb_tables.py --backend stdlib     # write without python-docx
+    python verb_tables.py --chunk letter       # one table per letter, page breaks between
+    python verb_tables.py --chunk 5000         # one table per 5000 rows
+    python verb_tables.py --benchmark 10000    # rows/second of both builders
+    python verb_tables.py --cold-start         # process start-up cost per backend
+    VERB_PROFILE=1 python verb_tables.py       # stage times and cProfile (see verb_profile.py)
+"""
+
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from xml.sax.saxutils import escape
+
+from verb_cache import CachedDocumentBuilder
+from verb_docx_writer import StdlibDocumentBuilder, row_template
+from verb_profile import profiled, stage, staged_rows
+from verb_sorting import COLLATIONS, make_sort_key
+from verb_sources import CHUNK_BY_LETTER, DEFAULT_MEMORY_LIMIT, VerbFile, chunked
+
+# Sheet name -> module that provides make_sheet()
+SHEETS = {
+    "irregular": "create_irregular_verbs",
+    "transitive": "create_transitive_verbs",
+}
+
+TABLE_STYLE = "Light Grid Accent 1"
+
+# Paragraph styles referenced by the table cells (ids "VerbCell", "VerbHeader")
+CELL_STYLE = "Verb Cell"
+HEADER_STYLE = "Verb Header"
+
+# python-docx names, filled in by _load_docx() on first use
+_docx = {}
+
+
+def docx_available():
+    """True if python-docx can be imported (checked without importing it)."""
+    return importlib.util.find_spec("docx") is not None
+
+
+def _load_docx():
+    """Import python-docx once per process and return the names we use."""
+    if not _docx:
+        import docx
+        from docx.enum.section import WD_SECTION
+        from docx.enum.style import WD_STYLE_TYPE
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+        from docx.shared import Pt
+        from lxml.etree import tostring
+
+        _docx.update(
+            Document=docx.Document,
+            WD_ALIGN_PARAGRAPH=WD_ALIGN_PARAGRAPH,
+            WD_SECTION=WD_SECTION,
+            WD_STYLE_TYPE=WD_STYLE_TYPE,
+            parse_xml=parse_xml,
+            nsdecls=nsdecls,
+            Pt=Pt,
+            tostring=tostring,
+            default_template=os.path.join(
+                os.path.dirname(docx.__file__), "templates", "default.docx"
+            ),
+        )
+    return _docx
+
+
+class VerbSheet:
+    """
+    Everything needed to render one verb table document.
+
+    verbs may be a list or any iterable of tuples, such as
+    verb_sources.VerbFile(path) or read_verbs(path).
+    Rows are sorted with the given collation ("codepoint", "casefold" or
+    "locale", see verb_sorting.py) by sort_columns, which must start with
+    column 0 (the base form that rows are deduped by).
+    """
+
+    def __init__(self, title, headers, verbs, output_file, subtitle=None,
+                 collation="casefold", sort_columns=(0,), locale_name=None):
+        self.title = title
+        self.headers = tuple(headers)
+        self.verbs = verbs
+        self.output_file = output_file
+        self.subtitle = subtitle if subtitle is not None else " | ".join(self.headers)
+        if tuple(sort_columns)[:1] != (0,):
+            raise ValueError("sort_columns must start with column 0")
+        self.collation = collation
+        self.sort_columns = tuple(sort_columns)
+        self.locale_name = locale_name
+
+    def sort_key(self):
+        """Return the row sort key for unique_sorted()."""
+        return make_sort_key(self.collation, self.sort_columns, self.locale_name)
+
+
+def _drop_cell_widths(row):
+    """Remove the per-cell widths add_row() writes; the table grid defines them."""
+    for tc in row._tr.tc_lst:
+        tc._remove_tcPr()
+
+
+def add_rows_per_row(table, rows):
+    """
+    Add rows one at a time with table.add_row() (the original path).
+    Returns the number of rows added.
+    """
+    cell_style_id = table.part.styles[CELL_STYLE].style_id
+    count = 0
+    for row in rows:
+        count += 1
+        new_row = table.add_row()
+        _drop_cell_widths(new_row)
+        for cell, text in zip(new_row.cells, row):
+            cell.text = text
+            cell.paragraphs[0]._p.style = cell_style_id
+    return count
+
+
+def render_rows(template, rows, row_xml=None):
+    """
+    Return the XML text of all rows, rendered with a row_template(), or
+    taken from row_xml(template, rows) if given (see verb_cache.SectionRenderer).
+    """
+    if row_xml is not None:
+        return "".join(row_xml(template, rows))
+    return "".join(template.format(*(escape(text) for text in row)) for row in rows)
+
+
+def attach_rows(table, body):
+    """Parse rendered row XML once and append the rows to the table. Returns the row count."""
+    docx = _load_docx()
+    fragment = docx["parse_xml"]("<w:tbl %s>%s</w:tbl>" % (docx["nsdecls"]("w"), body))
+    new_rows = list(fragment)
+    table._tbl.extend(new_rows)
+    return len(new_rows)
+
+
+def add_rows_bulk(table, rows, row_xml=None):
+    """
+    Add all rows in one pass by building the <w:tr> XML as text,
+    parsing it once and attaching the parsed rows to the table.
+    Produces the same XML as add_rows_per_row() and returns the number
+    of rows added.
+    """
+    return attach_rows(table, render_rows(row_template(len(table.columns)), rows, row_xml))
+
+
+class VerbDocumentBuilder(CachedDocumentBuilder):
+    """
+    Renders VerbSheets with python-docx.
+
+    One builder can render any number of sheets; the template bytes and
+    the table style id are looked up once and reused for every document.
+    With cache=True, save() skips documents whose verbs and options have
+    not changed and, in bulk mode, re-renders only the sections that did
+    (see verb_cache.CachedDocumentBuilder); force=True
+    ignores existing manifests. With chunk ("letter" or a row count), the
+    verbs are split into one table per chunk (see _build_chunked).
+    """
+
+    def __init__(self, template=None, table_style=TABLE_STYLE, bulk=True,
+                 memory_limit=DEFAULT_MEMORY_LIMIT, cache=False, force=False, chunk=None):
+        super().__init__(memory_limit, cache, force, chunk)
+        self.docx = _load_docx()
+        with open(template or self.docx["default_template"], "rb") as f:
+            template_bytes = f.read()
+        # The styled template is re-zipped with fresh timestamps, so hash the original
+        self.template_hash = hashlib.sha256(template_bytes).hexdigest()
+        self.template = self._add_styles(template_bytes)
+        self.table_style = table_style
+        self.bulk = bulk
+        self._table_style_id = None
+        self._header_style_id = None
+        self._row_templates = {}
+
+    def _add_styles(self, template):
+        """Return the template bytes with the cell and header paragraph styles added."""
+        doc = self.docx["Document"](io.BytesIO(template))
+        styles = doc.styles
+        paragraph = self.docx["WD_STYLE_TYPE"].PARAGRAPH
+        if CELL_STYLE not in styles:
+            cell = styles.add_style(CELL_STYLE, paragraph)
+            cell.base_style = styles["Normal"]
+            cell.paragraph_format.alignment = self.docx["WD_ALIGN_PARAGRAPH"].CENTER
+        if HEADER_STYLE not in styles:
+            header = styles.add_style(HEADER_STYLE, paragraph)
+            header.base_style = styles[CELL_STYLE]
+            header.font.bold = True
+        output = io.BytesIO()
+        doc.save(output)
+        return output.getvalue()
+
+    def new_document(self):
+        """Return a fresh Document loaded from the cached template bytes."""
+        return self.docx["Document"](io.BytesIO(self.template))
+
+    def _apply_table_style(self, table):
+        if self._table_style_id is None:
+            table.style = self.table_style
+            self._table_style_id = table._tbl.tblPr.style
+        else:
+            table._tbl.tblPr.style = self._table_style_id
+
+    def build(self, sheet, verbs=None):
+        """Create the Word document for a sheet; verbs default to unique_sorted(sheet.verbs)."""
+        return self._build(sheet, verbs)[0]
+
+    def _build(self, sheet, verbs=None, row_xml=None):
+        """
+        Return (doc, number of verbs, per-chunk report or None). In bulk
+        mode the row XML comes from row_xml if given (see _write()).
+        """
+        if verbs is None:
+            verbs = staged_rows(sheet, self.memory_limit)
+        if self.chunk:
+            return self._build_chunked(sheet, verbs, row_xml)
+
+        doc, table = self._new_sheet_document(sheet)
+
+        # Add verb rows
+        if self.bulk:
+            count = add_rows_bulk(table, verbs, row_xml)
+        else:
+            count = add_rows_per_row(table, verbs)
+
+        return doc, count, None
+
+    def _build_chunked(self, sheet, verbs, row_xml=None):
+        """
+        _build() with one table per chunk of verbs (see verb_sources.chunked()).
+        Every chunk starts a new page section under a heading with its
+        label, and its header row repeats at the top of each page. The
+        report holds one {"label", "rows", "bytes", "seconds"} per chunk,
+        where bytes is the size of the chunk's table XML.
+        """
+        new_page = self.docx["WD_SECTION"].NEW_PAGE
+        doc = self._new_titled_document(sheet)
+        report = []
+        count = 0
+        for label, rows in chunked(verbs, self.chunk):
+            start = time.perf_counter()
+            if report:
+                doc.add_section(new_page)
+            doc.add_heading(label, 1)
+            table = self._add_table(doc, sheet, repeat_header=True)
+            if self.bulk:
+                attach_rows(table, render_rows(self._row_template(sheet), rows, row_xml))
+            else:
+                add_rows_per_row(table, rows)
+            elapsed = time.perf_counter() - start
+            report.append({"label": label, "rows": len(rows),
+                           "bytes": len(self.docx["tostring"](table._tbl)), "seconds": elapsed})
+            count += len(rows)
+        return doc, count, report
+
+    def _new_sheet_document(self, sheet):
+        """Return (doc, table): title, subtitle and a table holding only the header row."""
+        doc = self._new_titled_document(sheet)
+        return doc, self._add_table(doc, sheet)
+
+    def _new_titled_document(self, sheet):
+        """Return a new document holding the title, subtitle and spacing paragraphs."""
+        center = self.docx["WD_ALIGN_PARAGRAPH"].CENTER
+        doc = self.new_document()
+
+        # Add title
+        title = doc.add_heading(sheet.title, 0)
+        title.alignment = center
+
+        # Add subtitle
+        subtitle = doc.add_paragraph(sheet.subtitle)
+        subtitle.alignment = center
+        subtitle_format = subtitle.runs[0].font
+        subtitle_format.size = self.docx["Pt"](12)
+        subtitle_format.bold = True
+
+        # Add spacing
+        doc.add_paragraph()
+
+        return doc
+
+    def _add_table(self, doc, sheet, repeat_header=False):
+        """Add a table holding only the header row; repeat_header repeats it on every page."""
+        # Create table; column widths come from its grid
+        table = doc.add_table(rows=1, cols=len(sheet.headers))
+        self._apply_table_style(table)
+        table.autofit = False
+        _drop_cell_widths(table.rows[0])
+
+        # Add header row
+        if self._header_style_id is None:
+            self._header_style_id = doc.styles[HEADER_STYLE].style_id
+        for cell, text in zip(table.rows[0].cells, sheet.headers):
+            cell.text = text
+            cell.paragraphs[0]._p.style = self._header_style_id
+        if repeat_header:
+            table.rows[0]._tr.get_or_add_trPr().append(
+                self.docx["parse_xml"]("<w:tblHeader %s/>" % self.docx["nsdecls"]("w"))
+            )
+
+        return table
+
+    def _row_template(self, sheet):
+        """row_template() for the sheet's column count, computed once per builder."""
+        columns = len(sheet.headers)
+        if columns not in self._row_templates:
+            self._row_templates[columns] = row_template(columns)
+        return self._row_templates[columns]
+
+    def _options(self):
+        return [self.bulk, self.table_style, self.template_hash]
+
+    def _write(self, sheet, rows, output_file, row_xml=None):
+        with stage("render", sheet):
+            doc, count, chunks = self._build(sheet, rows, row_xml)
+        with stage("save", sheet):
+            doc.save(output_file)
+        return count, chunks
+
+
+def make_builder(backend="auto", bulk=True, memory_limit=DEFAULT_MEMORY_LIMIT,
+                 cache=False, force=False, chunk=None):
+    """
+    Return a document builder for backend "docx" (python-docx), "stdlib"
+    (verb_docx_writer) or "auto" (python-docx if it is installed).
+    """
+    if backend == "auto":
+        backend = "docx" if docx_available() else "stdlib"
+    if backend == "docx":
+        return VerbDocumentBuilder(bulk=bulk, memory_limit=memory_limit, cache=cache, force=force,
+                                   chunk=chunk)
+    if backend == "stdlib":
+        return StdlibDocumentBuilder(memory_limit=memory_limit, cache=cache, force=force, chunk=chunk)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def load_sheet(name):
+    """Return the VerbSheet registered under name in SHEETS."""
+    return importlib.import_module(SHEETS[name]).make_sheet()
+
+
+def source_sheet(path, title=None, headers=("Present", "Past", "Past Participle")):
+    """Return a VerbSheet that streams its verbs from a CSV/TSV/JSONL(.gz) file."""
+    stem = os.path.basename(path).split(".")[0]
+    return VerbSheet(
+        title=title or stem.replace("_", " ").title(),
+        headers=headers,
+        verbs=VerbFile(path),
+        output_file=stem + ".docx",
+    )
+
+
+def benchmark(row_count=10000):
+    """Print rows/second of the per-row and bulk table builders, whole and chunked."""
+    rows = [(f"verb{i}", f"verb{i}ed", f"verb{i}ed") for i in range(row_count)]
+    sheet = VerbSheet("Benchmark", ("Present", "Past", "Past Participle"), rows, "benchmark.docx")
+    print(f"Benchmark: {row_count} rows")
+    for label, bulk, chunk in (("per-row add_row()", False, None), ("bulk XML", True, None),
+                               ("bulk, 1000-row chunks", True, 1000)):
+        builder = VerbDocumentBuilder(bulk=bulk, chunk=chunk)
+        start = time.perf_counter()
+        builder.build(sheet, rows)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<22} {elapsed:8.3f}s  {row_count / elapsed:12,.0f} rows/s")
+
+
+def cold_start(runs=5):
+    """
+    Print the best wall time of a fresh interpreter building the irregular
+    sheet with each backend (start-up, imports and rendering).
+    """
+    backends = ["stdlib"] + (["docx"] if docx_available() else [])
+    print(f"Cold start: python verb_tables.py irregular, best of {runs}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for backend in backends:
+            command = [sys.executable, os.path.abspath(__file__), "irregular",
+                       "--backend", backend, "--force", "-o", output_dir]
+            best = None
+            for _ in range(runs):
+                start = time.perf_counter()
+                subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"  {backend:<8} {best * 1000:8.1f} ms")
+
+
+def parse_chunk(text):
+    """argparse type for --chunk: "letter" or a positive row count."""
+    if text == CHUNK_BY_LETTER:
+        return text
+    try:
+        rows = int(text)
+    except ValueError:
+        rows = 0
+    if rows < 1:
+        raise argparse.ArgumentTypeError(f"expected {CHUNK_BY_LETTER!r} or a positive row count, got {text!r}")
+    return rows
+
+
+def print_chunk_report(chunks):
+    """Print one line per rendered chunk: label, rows, XML size and time."""
+    for chunk in chunks:
+        print(f"  {chunk['label']:<30} {chunk['rows']:8,} rows {chunk['bytes'] / 1024:10,.1f} KiB "
+              f"{chunk['seconds'] * 1000:9.1f} ms")
+
+
+def main(argv=None, sheets=None):
+    """Command line entry point; sheets, if given, are built instead of named ones."""
+    parser = argparse.ArgumentParser(description="Build verb table Word documents.")
+    parser.add_argument("sheets", nargs="*",
+                        help="sheets to build: %s (default: all)" % ", ".join(sorted(SHEETS)))
+    parser.add_argument("-o", "--output-dir", default="",
+                        help="directory for the .docx files (default: current directory)")
+    parser.add_argument("--source", action="append", default=[], metavar="FILE",
+                        help="build a sheet from a CSV/TSV/JSONL file, optionally .gz (repeatable)")
+    parser.add_argument("--title", help="title for --source sheets (default: from the file name)")
+    parser.add_argument("--memory-mb", type=float, default=DEFAULT_MEMORY_LIMIT / 2**20,
+                        help="RAM budget for dedupe/sort before spilling to disk (default: %(default)g)")
+    parser.add_argument("--collation", choices=COLLATIONS, default="casefold",
+                        help="row order: casefold (accent/case-insensitive first), "
+                             "locale (strxfrm) or codepoint (default: %(default)s)")
+    parser.add_argument("--locale", dest="locale_name",
+                        help="locale for --collation locale, e.g. fr_FR.UTF-8")
+    parser.add_argument("--sort-columns", type=int, nargs="+", default=[0], metavar="N",
+                        help="columns to sort by, starting with 0 (default: 0)")
+    parser.add_argument("--backend", choices=("auto", "docx", "stdlib"), default="auto",
+                        help="docx: python-docx, stdlib: zipfile writer, auto: docx if installed")
+    parser.add_argument("--chunk", type=parse_chunk, metavar="letter|ROWS",
+                        help="split the table into one table per first letter or per ROWS rows, "
+                             "each on a new page with a repeated header row")
+    parser.add_argument("--per-row", action="store_true",
+                        help="use the original table.add_row() loop instead of bulk XML")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if the rebuild manifest says nothing changed")
+    parser.add_argument("--benchmark", nargs="?", type=int, const=10000, metavar="ROWS",
+                        help="compare rows/second of both table builders and exit")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="time a fresh interpreter building a sheet with each backend and exit")
+    args = parser.parse_args(argv)
+    for name in args.sheets:
+        if name not in SHEETS:
+            parser.error(f"unknown sheet {name!r} (choose from {', '.join(sorted(SHEETS))})")
+    if args.sort_columns[0] != 0:
+        parser.error("--sort-columns must start with 0")
+
+    if args.benchmark is not None:
+        benchmark(args.benchmark)
+        return
+    if args.cold_start:
+        cold_start()
+        return
+
+    with profiled():
+        build_sheets(args, sheets)
+
+
+def build_sheets(args, sheets=None):
+    """Build the sheets selected by parsed command line args and print a report for each."""
+    builder = make_builder(args.backend, bulk=not args.per_row,
+                           memory_limit=int(args.memory_mb * 2**20),
+                           cache=True, force=args.force, chunk=args.chunk)
+    if args.source:
+        sheets = [source_sheet(path, args.title) for path in args.source]
+    elif sheets is None:
+        sheets = [load_sheet(name) for name in args.sheets or sorted(SHEETS)]
+    for sheet in sheets:
+        sheet.collation = args.collation
+        sheet.sort_columns = tuple(args.sort_columns)
+        sheet.locale_name = args.locale_name
+        output_file, count = builder.save(
+            sheet, os.path.join(args.output_dir, sheet.output_file)
+        )
+        report = builder.last_report
+        if report["skipped"]:
+            print(f"Document up to date: {output_file}")
+        else:
+            print(f"Document created successfully: {output_file}")
+            if report["changed"] is not None:
+                print(f"Sections changed: {report['changed']}, unchanged: {report['unchanged']} "
+                      f"(reused without rendering: {report['reused']})")
+            if report["chunks"]:
+                print(f"Chunks: {len(report['chunks'])}")
+                print_chunk_report(report["chunks"])
+        print(f"Total {sheet.title.lower()}: {count}")
+
+
+if __name__ == "__main__":
+    main()
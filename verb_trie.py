@@ -0,0 +1,334 @@
+"""
+Prefix autocomplete over verb base forms.
+
+VerbTrie is a minimized trie (a DAWG: shared prefixes and shared
+suffixes are both stored once) over the UTF-8 bytes of the deduplicated,
+lower-cased base forms, laid out as flat arrays:
+
+    offsets   state -> its first edge (the edges of state s are
+              offsets[s]:offsets[s + 1], sorted by byte)
+    labels    edge -> byte
+    targets   edge -> state it leads to
+    info      state -> shortest completion length (capped at 127) << 1
+              | is-a-word
+
+complete(prefix, n) walks the prefix, then does a best-first search from
+its state, returning the n shortest completions (alphabetical among
+equal lengths); the stored shortest lengths make the search stop after
+about n words, whatever the size of the subtree.
+
+save() writes the arrays to a binary file that load() maps with mmap and
+reads in place, so startup costs no parsing and the pages are shared
+between processes.
+
+Usage:
+    python verb_trie.py --build                            # verbs.trie: irregular + transitive bases
+    python verb_trie.py --build transitive extra.csv -t my.trie
+    python verb_trie.py wr ta be -n 5                      # completions from verbs.trie
+    python verb_trie.py --benchmark 1000000
+"""
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+from verb_fuzzy import synthetic_words
+from verb_lookup import split_forms
+from verb_merge import source_verbs
+
+MAGIC = b"VTRI"
+VERSION = 1
+
+# magic, version, states, edges, words
+HEADER = struct.Struct("<4sIIII")
+
+DEFAULT_TRIE_FILE = "verbs.trie"
+
+
+class _State:
+    """Trie state while building; numbered once registered as minimal."""
+
+    __slots__ = ("final", "edges", "number", "shortest")
+
+    def __init__(self):
+        self.final = False
+        self.edges = {}
+        self.number = None
+        self.shortest = 0
+
+    def signature(self):
+        return self.final, tuple((byte, target.number) for byte, target in sorted(self.edges.items()))
+
+
+def _build_states(words):
+    """
+    Minimal automaton for sorted, distinct byte strings (incremental
+    construction: each finished branch is merged with an equal one
+    already registered). Returns (root, registered states by number).
+    """
+    root = _State()
+    register = {}
+    states = []
+    unchecked = []  # (parent, byte, child) along the last word's path
+
+    def minimize(down_to):
+        while len(unchecked) > down_to:
+            parent, byte, child = unchecked.pop()
+            signature = child.signature()
+            same = register.get(signature)
+            if same is not None:
+                parent.edges[byte] = same
+                continue
+            child.number = len(states)
+            child.shortest = 0 if child.final else 1 + min(t.shortest for t in child.edges.values())
+            register[signature] = child
+            states.append(child)
+
+    previous = b""
+    for word in words:
+        common = 0
+        for a, b in zip(previous, word):
+            if a != b:
+                break
+            common += 1
+        minimize(common)
+        state = unchecked[-1][2] if unchecked else root
+        for byte in word[common:]:
+            child = _State()
+            state.edges[byte] = child
+            unchecked.append((state, byte, child))
+            state = child
+        state.final = True
+        previous = word
+    minimize(0)
+    return root, states
+
+
+class VerbTrie:
+    """Read-only DAWG over words; build() one, or load() a saved one."""
+
+    def __init__(self, offsets, targets, info, labels, words, label_base=0, mapped=None):
+        self._offsets = offsets
+        self._targets = targets
+        self._info = info
+        # bytes, or the mmap with the labels starting at label_base
+        self._labels = labels
+        self._label_base = label_base
+        self._mapped = mapped
+        self.words = words
+
+    @classmethod
+    def build(cls, words):
+        """Trie over words (lower-cased, duplicates ignored)."""
+        keys = sorted({word.strip().lower().encode("utf-8") for word in words} - {b""})
+        root, states = _build_states(keys)
+        if root.edges:
+            root.shortest = 0 if root.final else 1 + min(t.shortest for t in root.edges.values())
+
+        # Root is state 0, registered state n is n + 1
+        offsets = array("I", [0])
+        targets = array("I")
+        info = array("B")
+        labels = bytearray()
+        for state in [root] + states:
+            for byte, target in sorted(state.edges.items()):
+                labels.append(byte)
+                targets.append(target.number + 1)
+            offsets.append(len(targets))
+            info.append(min(state.shortest, 0x7F) << 1 | state.final)
+        return cls(offsets, targets, info, bytes(labels), len(keys))
+
+    def save(self, path):
+        """Write the trie to a binary file for load()."""
+        arrays = [array(a.typecode, a) for a in (self._offsets, self._targets, self._info)]
+        if sys.byteorder != "little":
+            for a in arrays:
+                a.byteswap()
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self._info), len(self._targets), self.words))
+            for a in arrays:
+                a.tofile(f)
+            f.write(self._label_bytes(0, len(self._targets)))
+
+    @classmethod
+    def load(cls, path):
+        """Map a file written by save(); the arrays are read in place, not copied."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, states, edges, words = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            raise ValueError(f"{path} is not a verb trie file (version {VERSION})")
+        view = memoryview(mapped)
+        position = HEADER.size
+        arrays = []
+        # Sections are in decreasing item size, so every one is aligned
+        for typecode, count in (("I", states + 1), ("I", edges), ("B", states)):
+            size = array(typecode).itemsize * count
+            section = view[position:position + size]
+            if sys.byteorder == "little":
+                arrays.append(section.cast(typecode))
+            else:
+                copy = array(typecode, section.tobytes())
+                copy.byteswap()
+                arrays.append(copy)
+            position += size
+        return cls(*arrays, labels=mapped, words=words, label_base=position, mapped=mapped)
+
+    def close(self):
+        """Unmap a loaded trie."""
+        if self._mapped is not None:
+            for a in (self._offsets, self._targets, self._info):
+                if isinstance(a, memoryview):
+                    a.release()
+            self._mapped.close()
+            self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.words
+
+    def _label_bytes(self, start, end):
+        return self._labels[self._label_base + start:self._label_base + end]
+
+    def _walk(self, key):
+        """State reached by the bytes of key, or None."""
+        state = 0
+        base = self._label_base
+        for byte in key:
+            start, end = self._offsets[state], self._offsets[state + 1]
+            edge = self._labels.find(bytes((byte,)), base + start, base + end)
+            if edge < 0:
+                return None
+            state = self._targets[edge - base]
+        return state
+
+    def __contains__(self, word):
+        state = self._walk(word.strip().lower().encode("utf-8"))
+        return state is not None and self._info[state] & 1 == 1
+
+    def complete(self, prefix, n=10):
+        """
+        Up to n words starting with prefix, shortest first and
+        alphabetical among words of the same length.
+        """
+        key = prefix.strip().lower().encode("utf-8")
+        state = self._walk(key)
+        if state is None or n <= 0:
+            return []
+        offsets, targets, info = self._offsets, self._targets, self._info
+        # (shortest possible length, text, 0 = a word / 1 = a state to expand, state)
+        heap = [(len(key) + (info[state] >> 1), key, 1, state)]
+        results = []
+        while heap and len(results) < n:
+            length, text, expand, state = heapq.heappop(heap)
+            if not expand:
+                results.append(text.decode("utf-8"))
+                continue
+            if info[state] & 1:
+                heapq.heappush(heap, (len(text), text, 0, state))
+            start, end = offsets[state], offsets[state + 1]
+            for i, byte in enumerate(self._label_bytes(start, end), start):
+                target = targets[i]
+                heapq.heappush(heap, (len(text) + 1 + (info[target] >> 1), text + bytes((byte,)), 1, target))
+        return results
+
+    def nbytes(self):
+        """Size of the arrays (and of the saved file, less the header)."""
+        return len(self._offsets) * 4 + len(self._targets) * 5 + len(self._info)
+
+
+def corpus_bases(specs=("irregular", "transitive")):
+    """Distinct lower-cased base forms of sheets or source files (see verb_merge.source_verbs)."""
+    bases = set()
+    for spec in specs:
+        _, verbs = source_verbs(spec)
+        for row in verbs:
+            bases.update(split_forms(row[0]))
+    return bases
+
+
+def benchmark(entries=1_000_000, queries=10_000, n=10, trie_file=None):
+    """Print build time, file size, load time and completion latency on entries words."""
+    words = corpus_bases()
+    real = sorted(words)
+    for word in synthetic_words(entries):
+        if len(words) >= entries:
+            break
+        words.add(word)
+
+    start = time.perf_counter()
+    trie = VerbTrie.build(words)
+    build = time.perf_counter() - start
+    text_bytes = sum(len(word) + 1 for word in words)
+    print(f"{len(trie):,} words ({len(real):,} verb bases, {text_bytes / 2**20:.1f} MiB as text), "
+          f"built in {build:.1f}s")
+
+    path = trie_file or f"benchmark_{entries}.trie"
+    trie.save(path)
+    try:
+        print(f"  file      {os.path.getsize(path) / 2**20:9.2f} MiB "
+              f"({len(trie._info):,} states, {len(trie._targets):,} edges)")
+        start = time.perf_counter()
+        loaded = VerbTrie.load(path)
+        print(f"  load      {(time.perf_counter() - start) * 1000:9.3f} ms (mmap)")
+
+        rng = random.Random(0)
+        sample = list(words)
+        prefixes = [word[:rng.randint(1, 4)] for word in rng.sample(sample, min(queries, len(sample)))]
+        with loaded:
+            assert all(loaded.complete(p, n) == trie.complete(p, n) for p in prefixes[:100])
+            start = time.perf_counter()
+            for prefix in prefixes:
+                loaded.complete(prefix, n)
+            elapsed = time.perf_counter() - start
+        print(f"  complete  {elapsed * 1e6 / len(prefixes):9.1f} us/query (top {n}, 1-4 letter prefixes)")
+    finally:
+        if trie_file is None:
+            os.remove(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Autocomplete verb base forms.")
+    parser.add_argument("prefixes", nargs="*", help="prefixes to complete")
+    parser.add_argument("-t", "--trie", default=DEFAULT_TRIE_FILE,
+                        help="trie file to load or build (default: %(default)s)")
+    parser.add_argument("--build", nargs="*", metavar="SOURCE",
+                        help="build the trie file from sheet names or CSV/TSV/JSONL files "
+                             "(default: irregular transitive)")
+    parser.add_argument("-n", type=int, default=10, help="completions per prefix (default: %(default)s)")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=1_000_000, metavar="ENTRIES",
+                        help="measure size, load and query time on ENTRIES words")
+    args = parser.parse_args(argv)
+
+    if args.benchmark is not None:
+        benchmark(args.benchmark, n=args.n)
+        return
+
+    if args.build is not None:
+        trie = VerbTrie.build(corpus_bases(args.build or ("irregular", "transitive")))
+        trie.save(args.trie)
+        print(f"{len(trie):,} bases written to {args.trie} ({os.path.getsize(args.trie):,} bytes)")
+    elif os.path.exists(args.trie):
+        trie = VerbTrie.load(args.trie)
+    else:
+        trie = VerbTrie.build(corpus_bases())
+    with trie:
+        for prefix in args.prefixes:
+            print(json.dumps({"prefix": prefix, "completions": trie.complete(prefix, args.n)}))
+
+
+if __name__ == "__main__":
+    main()